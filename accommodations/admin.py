@@ -3,6 +3,7 @@ from django.contrib import admin
 
 # 현재 앱의 Accommodation, AccommodationImage 모델을 가져옴
 from .models import Accommodation, AccommodationImage
+from .search import filter_search_matches, get_search_backend
 
 
 # 숙소 관리 페이지에서 이미지를 함께 관리하기 위한 인라인 클래스
@@ -26,7 +27,7 @@ class AccommodationAdmin(admin.ModelAdmin):
     # 관리자 페이지에서 필터링할 수 있는 필드들 (오른쪽 사이드바에 표시)
     list_filter = ['created_at', 'updated_at']
 
-    # 관리자 페이지에서 검색 가능한 필드들 (상단 검색바에서 사용)
+    # 관리자 페이지에서 검색 가능한 필드들 (상단 검색바에서 사용, 색인이 없는 DB에서만 LIKE 검색)
     search_fields = ['name', 'location']
 
     # 관리자 페이지에서 수정할 수 없는 필드들 (읽기 전용)
@@ -35,13 +36,24 @@ class AccommodationAdmin(admin.ModelAdmin):
     # 숙소 관리 페이지에 이미지 인라인 추가 (숙소와 함께 이미지도 관리 가능)
     inlines = [AccommodationImageInline]
 
+    # 목록 화면 조회 시 평점 정보를 함께 계산 (숙소마다 추가 쿼리 방지)
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_stats(prefetch_images=False)
+
+    # 상단 검색바 검색을 전문 검색 색인으로 처리 (LIKE '%검색어%' 전체 스캔 대신)
+    def get_search_results(self, request, queryset, search_term):
+        if search_term and get_search_backend() is not None:
+            return filter_search_matches(queryset, search_term), False
+        return super().get_search_results(request, queryset, search_term)
+
     # 평균 평점을 관리자 페이지에 표시하기 위한 메서드
     def get_average_rating(self, obj):
-        # obj는 Accommodation 인스턴스, average_rating 프로퍼티 호출
-        return obj.average_rating
+        # obj는 with_stats()로 조회한 Accommodation 인스턴스, annotate된 avg_rating 사용
+        return round(obj.avg_rating, 1)
 
     # 위 메서드가 관리자 페이지에서 표시될 때의 컬럼 제목
     get_average_rating.short_description = "평균 평점"
+    get_average_rating.admin_order_field = 'avg_rating'
 
     # 투표 수를 관리자 페이지에 표시하기 위한 메서드
     def get_vote_count(self, obj):
@@ -50,6 +62,7 @@ class AccommodationAdmin(admin.ModelAdmin):
 
     # 위 메서드가 관리자 페이지에서 표시될 때의 컬럼 제목
     get_vote_count.short_description = "투표 수"
+    get_vote_count.admin_order_field = 'vote_count'
 
 
 # AccommodationImage 모델을 관리자 페이지에 등록하고 설정하는 데코레이터
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AccommodationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accommodations'
+
+    def ready(self):
+        # 이미지 파일 정리, 검색 색인 갱신 시그널 핸들러 등록
+        from . import signals  # noqa: F401
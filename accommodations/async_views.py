@@ -0,0 +1,107 @@
+# ASGI 서버용 숙소 조회 API 비동기 View 모음 (settings.ASYNC_VIEWS가 켜져 있을 때 urls.py에서 사용)
+from django.db.models import Avg, Max, Min
+
+# 비동기 View 공통 도구
+from core.async_views import async_read_view, json_response, paginate_page_number
+from core.cache import cache_response_on_tables
+from core.versions import conditional_on_tables
+
+# 현재 앱의 모델, serializer, 동기 View와 공용 함수를 가져옴
+from .models import Accommodation
+from .serializers import AccommodationSerializer
+from . import views
+
+# 다른 앱의 평점 분포 함수를 가져옴
+from votes.summary import aget_rating_histogram, summarize_histogram
+
+
+# serializer에 넘길 context (필드 선택 없는 기본 응답)
+def get_serializer_context(request):
+    return {'request': request, 'requested_fields': None}
+
+
+# 숙소 목록 조회 (기본 목록과 ?page= 만 비동기로 처리)
+@async_read_view(views.AccommodationListCreateView.as_view(), params=('page',))
+@conditional_on_tables(*views.ACCOMMODATION_TABLES)
+async def accommodation_list(request):
+    """
+    URL: /api/accommodations/
+    응답은 AccommodationListCreateView의 기본 목록과 같음
+    검색/필터/정렬/?fields= / ?cursor= 요청과 POST는 동기 View가 처리
+    """
+    queryset = views.get_accommodation_queryset().order_by('-created_at', '-id')
+
+    page = await paginate_page_number(request, queryset)
+    if page is None:
+        return None
+    accommodations, pagination = page
+
+    serializer = AccommodationSerializer(accommodations, many=True, context=get_serializer_context(request))
+    return json_response({**pagination, 'results': serializer.data})
+
+
+# 숙소 상세 조회 (?fields= / ?expand= 가 없는 요청만 비동기로 처리)
+@async_read_view(views.AccommodationDetailView.as_view())
+@conditional_on_tables(*views.ACCOMMODATION_TABLES)
+async def accommodation_detail(request, pk):
+    """
+    URL: /api/accommodations/{id}/
+    없는 숙소(404)와 PUT/PATCH/DELETE는 동기 View가 처리
+    """
+    try:
+        accommodation = await views.get_accommodation_queryset().aget(pk=pk)
+    except Accommodation.DoesNotExist:
+        return None
+
+    serializer = AccommodationSerializer(accommodation, context=get_serializer_context(request))
+    return json_response(serializer.data)
+
+
+# 숙소 통계 조회
+@async_read_view(views.accommodation_stats)
+@conditional_on_tables('accommodations', 'votes')
+@cache_response_on_tables('accommodations', 'votes')
+async def accommodation_stats(request):
+    """
+    URL: /api/accommodations/stats/ (응답은 accommodation_stats와 같음)
+    """
+    total_accommodations = await Accommodation.objects.acount()
+    price_stats = await Accommodation.objects.aaggregate(
+        average_price=Avg('price'),
+        min_price=Min('price'),
+        max_price=Max('price'),
+    )
+    total_votes, average_rating = summarize_histogram(await aget_rating_histogram())
+
+    return json_response({
+        'total_accommodations': total_accommodations,
+        'average_price': round(price_stats['average_price'] or 0),
+        'min_price': price_stats['min_price'] or 0,
+        'max_price': price_stats['max_price'] or 0,
+        'total_votes': total_votes,
+        'average_rating': round(average_rating, 1),
+        'message': '숙소 통계 정보입니다.'
+    })
+
+
+# 숙소 랭킹 조회
+@async_read_view(views.accommodation_ranking, params=('method', 'prior_weight', 'limit', 'offset'))
+async def accommodation_ranking(request):
+    """
+    URL: /api/accommodations/ranking/ (응답은 accommodation_ranking과 같음)
+    잘못된 파라미터의 400 응답은 동기 View가 만듦
+    """
+    method, limit, offset, prior_weight, error = views.parse_ranking_params(request.GET)
+    if error:
+        return None
+
+    prior_mean, default_prior_weight = await Accommodation.objects.arating_prior()
+    if prior_weight is None:
+        prior_weight = default_prior_weight
+
+    rows = [row async for row in views.get_ranking_queryset(method, prior_mean, prior_weight, limit, offset)]
+    count = rows[0]['total'] if rows else await Accommodation.objects.acount()
+
+    return json_response(
+        views.build_ranking_response(method, prior_mean, prior_weight, count, limit, offset, rows)
+    )
@@ -0,0 +1,36 @@
+# 숙소 목록 API의 가격 범위 필터와 정렬을 정의하는 모듈
+import django_filters
+
+# 현재 앱의 모델을 가져옴
+from .models import Accommodation
+
+
+# 숙소 가격 범위 필터와 정렬을 처리하는 FilterSet
+class AccommodationFilter(django_filters.FilterSet):
+    """
+    ?min_price=50000&max_price=150000 - 1박 가격 범위 (price 인덱스 사용)
+    ?ordering=price / -price / created_at / -vote_count / name - 정렬 (같은 값이면 id 순)
+    """
+
+    # 최저 가격 (이상)
+    min_price = django_filters.NumberFilter(field_name='price', lookup_expr='gte')
+
+    # 최고 가격 (이하)
+    max_price = django_filters.NumberFilter(field_name='price', lookup_expr='lte')
+
+    # 정렬 기준 (앞에 -를 붙이면 내림차순)
+    ordering = django_filters.OrderingFilter(
+        fields=('price', 'created_at', 'vote_count', 'name'),
+    )
+
+    # FilterSet 설정을 위한 메타 클래스
+    class Meta:
+        model = Accommodation
+        fields = ['min_price', 'max_price']
+
+    # 필터 적용 후 정렬 결과가 항상 같도록 id를 마지막 정렬 기준으로 추가 (오버라이드)
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.form.cleaned_data.get('ordering'):
+            queryset = queryset.order_by(*queryset.query.order_by, '-id')
+        return queryset
@@ -0,0 +1,108 @@
+# 숙소 이미지의 파생본(썸네일, 카드, 전체 화면용)을 생성하는 모듈
+import os
+from io import BytesIO
+
+# 이미지 처리 라이브러리 (Pillow)
+from PIL import Image, ImageOps
+
+# Django 파일 저장 관련 기능을 가져옴
+from django.core.files.base import ContentFile
+
+
+# 생성할 파생본 크기 목록 (이름: (최대 너비, 최대 높이)), 비율은 유지하고 확대는 하지 않음
+IMAGE_VARIANT_SIZES = {
+    'thumb': (320, 320),
+    'card': (800, 800),
+    'full': (1600, 1600),
+}
+
+# 파생본 저장 형식 (이름: (확장자, Pillow 형식, 저장 옵션))
+IMAGE_VARIANT_FORMATS = {
+    'webp': ('webp', 'WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('jpg', 'JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+# 원본 파일 이름으로부터 파생본 파일 이름을 만드는 함수
+def variant_path(original_name, size, extension):
+    """
+    원본과 같은 폴더에 저장될 파생본 경로를 반환
+    예: 'accommodations/3/room.png' -> 'accommodations/3/room.thumb.webp'
+    """
+    stem, _ = os.path.splitext(original_name)
+    return f'{stem}.{size}.{extension}'
+
+
+# 저장 형식에 맞게 이미지 색상 모드를 변환하는 함수
+def _prepare_for_format(image, pil_format):
+    # JPEG는 투명도를 지원하지 않으므로 흰 배경 위에 합성
+    if pil_format == 'JPEG':
+        if image.mode in ('RGBA', 'LA'):
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            return background
+        return image.convert('RGB') if image.mode != 'RGB' else image
+
+    # WebP는 RGB/RGBA만 지원
+    if image.mode not in ('RGB', 'RGBA'):
+        return image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+    return image
+
+
+# 원본 이미지 파일을 읽어 Pillow 이미지로 여는 함수
+def _open_original(field_file):
+    with field_file.storage.open(field_file.name, 'rb') as original:
+        image = Image.open(original)
+        # 휴대폰 사진의 EXIF 회전 정보를 실제 픽셀에 반영
+        image = ImageOps.exif_transpose(image)
+        # 팔레트 이미지는 투명도 정보를 보존하기 위해 RGBA로 변환
+        if image.mode == 'P':
+            image = image.convert('RGBA')
+        image.load()
+    return image
+
+
+# 숙소 이미지의 모든 파생본을 생성해 저장하는 함수
+def generate_variants(accommodation_image):
+    """
+    원본 이미지로부터 크기별(thumb, card, full) WebP/JPEG 파생본을 만들어 원본 옆에 저장
+    accommodation_image: AccommodationImage 인스턴스
+    반환값: {'thumb': {'width': 320, 'height': 240, 'webp': 경로, 'jpeg': 경로}, ...}
+    """
+    field_file = accommodation_image.image
+    storage = field_file.storage
+    original = _open_original(field_file)
+
+    variants = {}
+    for size, max_size in IMAGE_VARIANT_SIZES.items():
+        resized = original.copy()
+        resized.thumbnail(max_size, Image.Resampling.LANCZOS)
+
+        entry = {'width': resized.width, 'height': resized.height}
+        for format_name, (extension, pil_format, options) in IMAGE_VARIANT_FORMATS.items():
+            buffer = BytesIO()
+            _prepare_for_format(resized, pil_format).save(buffer, pil_format, **options)
+
+            # 같은 이름의 파생본이 있으면 덮어쓰기 (재생성 시 _1, _2 접미사 방지)
+            name = variant_path(field_file.name, size, extension)
+            if storage.exists(name):
+                storage.delete(name)
+            entry[format_name] = storage.save(name, ContentFile(buffer.getvalue()))
+
+        variants[size] = entry
+
+    return variants
+
+
+# 숙소 이미지의 파생본 파일들을 삭제하는 함수
+def delete_variants(storage, variants):
+    """
+    variants에 기록된 파생본 파일들을 저장소에서 삭제
+    storage: 파일이 저장된 Storage
+    variants: AccommodationImage.variants 값
+    """
+    for entry in (variants or {}).values():
+        for format_name in IMAGE_VARIANT_FORMATS:
+            name = entry.get(format_name)
+            if name and storage.exists(name):
+                storage.delete(name)
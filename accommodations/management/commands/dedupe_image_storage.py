@@ -0,0 +1,97 @@
+# Django 관리 명령어 기본 클래스를 가져옴
+from django.core.files import File
+from django.core.management.base import BaseCommand
+
+# 현재 앱의 모델과 저장소 관련 함수를 가져옴
+from accommodations.imaging import delete_variants
+from accommodations.models import AccommodationImage
+from accommodations.storage import CONTENT_ADDRESSED_PREFIX, compute_content_hash, content_addressed_path
+from core.versions import bump_table_versions
+
+
+# 기존 'accommodations/숙소ID/파일명' 이미지를 내용 해시 경로로 옮겨 중복을 제거하는 관리 명령어
+class Command(BaseCommand):
+    """
+    사용법:
+    python manage.py dedupe_image_storage            # 기존 이미지를 해시 경로로 이전
+    python manage.py dedupe_image_storage --dry-run  # 이전하지 않고 중복 현황만 보고
+    같은 내용의 파일들은 하나의 해시 파일을 공유하게 되고, 더 이상 참조되지 않는 기존 파일은 삭제됨
+    """
+
+    help = '기존 숙소 이미지를 내용 해시 기반 경로로 옮기고 중복 파일을 제거합니다.'
+
+    # 명령어 옵션 정의
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='파일을 옮기지 않고 중복 현황만 출력합니다.',
+        )
+
+    # 명령어 실행
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        images = AccommodationImage.objects.exclude(
+            image__startswith=CONTENT_ADDRESSED_PREFIX
+        ).order_by('id')
+
+        seen_hashes = set()
+        moved, duplicates, missing = 0, 0, 0
+        saved_bytes = 0
+
+        for image in images.iterator():
+            storage = image.image.storage
+            old_name = image.image.name
+
+            if not storage.exists(old_name):
+                missing += 1
+                self.stderr.write(f'[파일 없음] {old_name}')
+                continue
+
+            # 기존 파일 내용으로 해시 경로 계산
+            with storage.open(old_name, 'rb') as original:
+                content_hash = compute_content_hash(File(original))
+                new_name = content_addressed_path(content_hash, old_name)
+
+                is_duplicate = content_hash in seen_hashes or storage.exists(new_name)
+                seen_hashes.add(content_hash)
+                if is_duplicate:
+                    duplicates += 1
+                    saved_bytes += storage.size(old_name)
+
+                self.stdout.write(f"[{'중복' if is_duplicate else '이전'}] {old_name} -> {new_name}")
+                if dry_run:
+                    continue
+
+                # 해시 경로에 저장 (같은 파일이 이미 있으면 쓰지 않음)
+                storage.save(new_name, File(original))
+
+            # 같은 해시의 파생본이 이미 있으면 공유, 없으면 다시 생성하도록 대기열에 넣음
+            processed = AccommodationImage.objects.filter(
+                image=new_name, status=AccommodationImage.STATUS_READY
+            ).values_list('variants', flat=True).first()
+
+            old_variants = image.variants
+            AccommodationImage.objects.filter(pk=image.pk).update(
+                image=new_name,
+                content_hash=content_hash,
+                variants=processed or {},
+                status=AccommodationImage.STATUS_READY if processed else AccommodationImage.STATUS_PENDING,
+            )
+            moved += 1
+
+            # 더 이상 참조되지 않는 기존 파일과 파생본 삭제
+            if not AccommodationImage.objects.filter(image=old_name).exists():
+                delete_variants(storage, old_variants)
+                storage.delete(old_name)
+
+        # QuerySet.update()로 경로를 바꿨으므로 테이블 버전을 직접 올림
+        if moved:
+            bump_table_versions('accommodation_images')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'이전 {moved}개, 중복 {duplicates}개 ({saved_bytes:,} bytes 절약), 파일 없음 {missing}개'
+            + (' (dry-run: 변경 없음)' if dry_run else '')
+        ))
+        if moved:
+            self.stdout.write('파생본이 없는 이미지는 manage.py process_images --once 로 생성하세요.')
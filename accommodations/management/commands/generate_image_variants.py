@@ -0,0 +1,63 @@
+# Django 관리 명령어 기본 클래스를 가져옴
+from django.core.management.base import BaseCommand
+
+# 현재 앱의 모델을 가져옴
+from accommodations.models import AccommodationImage
+
+# 조건부 GET용 테이블 버전 함수
+from core.versions import bump_table_versions
+
+
+# 기존에 업로드된 숙소 이미지의 파생본을 생성하는 관리 명령어
+class Command(BaseCommand):
+    """
+    사용법:
+    python manage.py generate_image_variants                    # 파생본이 없는 이미지만 처리
+    python manage.py generate_image_variants --force            # 모든 이미지 다시 생성
+    python manage.py generate_image_variants --accommodation 24 # 특정 숙소의 이미지만 처리
+    """
+
+    help = '기존 숙소 이미지의 크기별 파생본(thumb, card, full / WebP, JPEG)을 생성합니다.'
+
+    # 명령어 옵션 정의
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='이미 파생본이 있는 이미지도 다시 생성합니다.',
+        )
+        parser.add_argument(
+            '--accommodation',
+            type=int,
+            help='특정 숙소 ID의 이미지만 처리합니다.',
+        )
+
+    # 명령어 실행
+    def handle(self, *args, **options):
+        images = AccommodationImage.objects.order_by('id')
+
+        if not options['force']:
+            images = images.filter(variants={})
+        if options['accommodation']:
+            images = images.filter(accommodation_id=options['accommodation'])
+
+        processed, failed = 0, 0
+        for image in images.iterator():
+            try:
+                image.build_variants()
+            except (OSError, ValueError) as error:
+                failed += 1
+                self.stderr.write(f'[실패] {image.image.name}: {error}')
+                continue
+
+            processed += 1
+            self.stdout.write(f'[완료] {image.image.name}')
+
+        # 파생본/상태는 QuerySet.update()로 바뀌므로 테이블 버전을 직접 올림
+        # (올리지 않으면 ETag를 가진 클라이언트가 계속 304를 받아 새 파생본 URL을 보지 못함)
+        if processed:
+            bump_table_versions('accommodation_images')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'파생 이미지 생성 완료: {processed}개 성공, {failed}개 실패'
+        ))
@@ -0,0 +1,58 @@
+# 시간 관련 기능을 가져옴 (대기열 확인 간격)
+import time
+
+# Django 관리 명령어 기본 클래스를 가져옴
+from django.core.management.base import BaseCommand
+
+# 현재 앱의 모델과 이미지 처리 함수를 가져옴
+from accommodations.models import AccommodationImage
+from accommodations.tasks import process_image
+from core.versions import bump_table_versions
+
+
+# 처리 대기 중인 숙소 이미지의 파생본을 생성하는 워커 관리 명령어
+class Command(BaseCommand):
+    """
+    사용법 (IMAGE_PROCESSING_BACKEND=worker 일 때 웹 프로세스와 별도로 실행):
+    python manage.py process_images              # 계속 실행하며 대기열 처리
+    python manage.py process_images --once       # 현재 대기 중인 이미지만 처리하고 종료
+    python manage.py process_images --requeue    # 중단된 처리 중(processing)/실패 이미지를 다시 대기열로
+    """
+
+    help = '처리 대기(pending) 상태인 숙소 이미지의 파생본을 생성합니다.'
+
+    # 명령어 옵션 정의
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='대기열을 한 번만 처리하고 종료합니다.')
+        parser.add_argument('--interval', type=float, default=2.0, help='대기열이 비었을 때 다시 확인할 간격(초)')
+        parser.add_argument('--batch-size', type=int, default=20, help='한 번에 가져올 이미지 수')
+        parser.add_argument(
+            '--requeue',
+            action='store_true',
+            help='처리 중(processing) 또는 실패(failed) 상태의 이미지를 다시 대기(pending) 상태로 돌립니다.',
+        )
+
+    # 명령어 실행
+    def handle(self, *args, **options):
+        if options['requeue']:
+            requeued = AccommodationImage.objects.filter(
+                status__in=[AccommodationImage.STATUS_PROCESSING, AccommodationImage.STATUS_FAILED]
+            ).update(status=AccommodationImage.STATUS_PENDING)
+            bump_table_versions('accommodation_images')
+            self.stdout.write(f'{requeued}개 이미지를 다시 대기열에 넣었습니다.')
+
+        while True:
+            pending_ids = list(
+                AccommodationImage.objects.filter(
+                    status=AccommodationImage.STATUS_PENDING
+                ).order_by('id').values_list('id', flat=True)[:options['batch_size']]
+            )
+
+            for image_id in pending_ids:
+                if process_image(image_id):
+                    self.stdout.write(f'[처리] 이미지 ID {image_id}')
+
+            if options['once'] and not pending_ids:
+                break
+            if not pending_ids:
+                time.sleep(options['interval'])
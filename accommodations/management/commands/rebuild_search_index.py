@@ -0,0 +1,28 @@
+# Django 관리 명령어 기본 클래스를 가져옴
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# 숙소 검색 색인 함수
+from accommodations.search import get_search_backend, rebuild_search_index
+
+
+# 숙소 전문 검색 색인을 다시 만드는 관리 명령어
+class Command(BaseCommand):
+    """
+    사용법:
+    python manage.py rebuild_search_index    # 모든 숙소의 이름/위치/설명을 다시 색인
+    (시그널을 거치지 않고 DB를 직접 수정했거나 토큰화 방식이 바뀌었을 때 사용)
+    """
+
+    help = '숙소 이름/위치/설명 전문 검색 색인을 다시 만듭니다.'
+
+    # 명령어 실행
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        if backend is None:
+            self.stdout.write(self.style.WARNING('이 데이터베이스는 전문 검색 색인을 지원하지 않습니다. (LIKE 검색 사용)'))
+            return
+
+        with transaction.atomic():
+            count = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f'{count}개 숙소를 검색 색인에 추가했습니다. ({backend})'))
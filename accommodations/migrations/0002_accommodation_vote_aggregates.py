@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:16
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_vote_aggregates(apps, schema_editor):
+    # 기존 투표 데이터로 집계 컬럼 채우기
+    Accommodation = apps.get_model('accommodations', 'Accommodation')
+    Vote = apps.get_model('votes', 'Vote')
+
+    votes = Vote.objects.filter(accommodation=OuterRef('pk')).order_by().values('accommodation')
+    Accommodation.objects.update(
+        vote_count=Coalesce(
+            Subquery(votes.annotate(total=Count('id')).values('total'), output_field=IntegerField()),
+            Value(0),
+        ),
+        rating_sum=Coalesce(
+            Subquery(votes.annotate(total=Sum('rating')).values('total'), output_field=IntegerField()),
+            Value(0),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0001_initial'),
+        ('votes', '0002_delete_comment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodation',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='평점 합계'),
+        ),
+        migrations.AddField(
+            model_name='accommodation',
+            name='vote_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='투표 수'),
+        ),
+        migrations.RunPython(backfill_vote_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0002_accommodation_vote_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodationimage',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='파생 이미지'),
+        ),
+    ]
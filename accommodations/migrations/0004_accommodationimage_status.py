@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:20
+
+from django.db import migrations, models
+
+
+def mark_processed_images_ready(apps, schema_editor):
+    # 파생본이 이미 만들어진 기존 이미지는 완료 상태로 표시 (나머지는 대기열에 남김)
+    AccommodationImage = apps.get_model('accommodations', 'AccommodationImage')
+    AccommodationImage.objects.exclude(variants={}).update(status='ready')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0003_accommodationimage_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodationimage',
+            name='status',
+            field=models.CharField(choices=[('pending', '대기'), ('processing', '처리 중'), ('ready', '완료'), ('failed', '실패')], db_index=True, default='pending', editable=False, max_length=20, verbose_name='처리 상태'),
+        ),
+        migrations.RunPython(mark_processed_images_ready, migrations.RunPython.noop),
+    ]
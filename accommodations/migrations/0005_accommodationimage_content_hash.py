@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:22
+
+import accommodations.models
+import accommodations.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0004_accommodationimage_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodationimage',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64, verbose_name='내용 해시'),
+        ),
+        migrations.AlterField(
+            model_name='accommodationimage',
+            name='image',
+            field=models.ImageField(storage=accommodations.storage.get_image_storage, upload_to=accommodations.models.accommodation_image_path, verbose_name='이미지'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0005_accommodationimage_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accommodation',
+            index=models.Index(fields=['-created_at', '-id'], name='accommodations_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,100 @@
+# 숙소 전문 검색 색인 테이블 생성
+# (SQLite: FTS5 가상 테이블, PostgreSQL: tsvector + GIN 인덱스, 그 외 DB는 LIKE 검색으로 대체되어 생성하지 않음)
+# 이후 accommodations.search가 바뀌어도 이 마이그레이션의 결과가 달라지지 않도록 DDL과 토큰화 규칙을 복사해 둠
+
+import re
+
+from django.db import migrations
+
+
+# 마이그레이션 시점의 색인 테이블 이름과 필드, 가중치
+SEARCH_TABLE = 'accommodation_search'
+SEARCH_FIELDS = ('name', 'location', 'description')
+POSTGRES_WEIGHTS = ('A', 'B', 'C')
+
+# 마이그레이션 시점의 토큰화 규칙 (단어 + 한글 bigram)
+WORD_RE = re.compile(r'\w+')
+HANGUL_RE = re.compile(r'[가-힣]')
+
+
+# 텍스트를 색인 문서 문자열로 바꾸는 함수
+def build_document(text):
+    tokens = []
+    for word in WORD_RE.findall((text or '').lower()):
+        tokens.append(word)
+        if len(word) > 2 and HANGUL_RE.search(word):
+            tokens += [word[i:i + 2] for i in range(len(word) - 1)]
+    return ' '.join(tokens)
+
+
+# 사용할 검색 방식을 반환하는 함수 ('sqlite', 'postgresql' 또는 None)
+def get_backend(connection):
+    if connection.vendor == 'postgresql':
+        return 'postgresql'
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pragma_module_list WHERE name = 'fts5'")
+            if cursor.fetchone() is not None:
+                return 'sqlite'
+    return None
+
+
+# 색인 테이블을 만들고 기존 숙소를 색인하는 함수
+def create_search_index(apps, schema_editor):
+    backend = get_backend(schema_editor.connection)
+    if backend is None:
+        return
+
+    Accommodation = apps.get_model('accommodations', 'Accommodation')
+    with schema_editor.connection.cursor() as cursor:
+        if backend == 'sqlite':
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} "
+                f"USING fts5({', '.join(SEARCH_FIELDS)}, tokenize='unicode61')"
+            )
+        else:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+                f"accommodation_id bigint PRIMARY KEY REFERENCES accommodations (id) ON DELETE CASCADE, "
+                f"document tsvector NOT NULL)"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {SEARCH_TABLE}_document_idx "
+                f"ON {SEARCH_TABLE} USING GIN (document)"
+            )
+
+        vector = ' || '.join(
+            f"setweight(to_tsvector('simple', %s), '{weight}')" for weight in POSTGRES_WEIGHTS
+        )
+        rows = Accommodation.objects.order_by().values_list('id', *SEARCH_FIELDS)
+        for accommodation_id, *values in rows.iterator():
+            documents = [build_document(value) for value in values]
+            if backend == 'sqlite':
+                cursor.execute(
+                    f"INSERT INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_FIELDS)}) VALUES (%s, %s, %s, %s)",
+                    [accommodation_id, *documents],
+                )
+            else:
+                cursor.execute(
+                    f"INSERT INTO {SEARCH_TABLE} (accommodation_id, document) VALUES (%s, {vector})",
+                    [accommodation_id, *documents],
+                )
+
+
+# 색인 테이블을 삭제하는 함수 (마이그레이션 되돌리기)
+def delete_search_index(apps, schema_editor):
+    if get_backend(schema_editor.connection) is None:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0006_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, delete_search_index),
+    ]
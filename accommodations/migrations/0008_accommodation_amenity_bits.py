@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:39
+
+from django.db import migrations, models
+
+
+# 마이그레이션 시점의 편의시설 목록 (순서가 비트 위치)
+AMENITIES = (
+    'wifi', 'parking', 'pool', 'restaurant', 'kitchen',
+    'valley', 'sea', 'ocean_view', 'bbq', 'karaoke', 'billiards', 'foot_volleyball',
+)
+
+
+def backfill_amenity_bits(apps, schema_editor):
+    # 기존 숙소의 amenities 값으로 비트마스크 채우기 (허용 목록에 없는 값은 무시)
+    Accommodation = apps.get_model('accommodations', 'Accommodation')
+    for accommodation_id, amenities in Accommodation.objects.values_list('id', 'amenities').iterator():
+        mask = 0
+        for amenity in amenities or ():
+            if amenity in AMENITIES:
+                mask |= 1 << AMENITIES.index(amenity)
+        if mask:
+            Accommodation.objects.filter(pk=accommodation_id).update(amenity_bits=mask)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0007_accommodation_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodation',
+            name='amenity_bits',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, verbose_name='편의시설 비트'),
+        ),
+        migrations.RunPython(backfill_amenity_bits, migrations.RunPython.noop),
+    ]
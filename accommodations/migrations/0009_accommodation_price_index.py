@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0008_accommodation_amenity_bits'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accommodation',
+            index=models.Index(fields=['price', 'id'], name='accommodations_price_id_idx'),
+        ),
+    ]
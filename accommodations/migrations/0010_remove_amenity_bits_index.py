@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 03:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0009_accommodation_price_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='accommodation',
+            name='amenity_bits',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='편의시설 비트'),
+        ),
+    ]
@@ -1,9 +1,15 @@
 # Django의 데이터베이스 모델 기능을 가져옴
 from django.db import models
-import os
-
-# 운영체제 관련 기능을 가져옴 (파일 경로 처리용)
+from django.db.models.functions import DenseRank, Rank, Sqrt
 
+# 파생본 이미지 생성 함수와 내용 해시 저장소를 가져옴
+from .imaging import generate_variants
+from .storage import (
+    compute_content_hash,
+    content_addressed_path,
+    content_addressed_uploads_enabled,
+    get_image_storage,
+)
 
 
 # 숙소 이미지 파일이 저장될 경로를 생성하는 함수
@@ -12,11 +18,189 @@ def accommodation_image_path(instance, filename):
     이미지 업로드 경로를 동적으로 생성하는 함수
     instance: AccommodationImage 모델의 인스턴스
     filename: 업로드되는 파일의 원본 이름
-    반환값: 'accommodations/숙소ID/파일명' 형태의 경로
+    반환값: 내용 해시 저장 방식이면 'accommodations/sha256/ab/cd/해시.확장자',
+            아니면 'accommodations/숙소ID/파일명' 형태의 경로
     """
+    if instance.content_hash:
+        return content_addressed_path(instance.content_hash, filename)
     return f'accommodations/{instance.accommodation.id}/{filename}'
 
 
+# 허용되는 편의시설 목록 (순서가 amenity_bits의 비트 위치이므로 새 항목은 맨 뒤에만 추가)
+AMENITIES = (
+    'wifi', 'parking', 'pool', 'restaurant', 'kitchen',
+    'valley', 'sea', 'ocean_view', 'bbq', 'karaoke', 'billiards', 'foot_volleyball',
+)
+
+
+# 편의시설 목록을 비트마스크 정수로 바꾸는 함수
+def amenity_mask(amenities):
+    """
+    예: ['wifi', 'pool'] -> 0b101 = 5 (허용 목록에 없는 값은 무시)
+    """
+    mask = 0
+    for amenity in amenities or ():
+        if amenity in AMENITIES:
+            mask |= 1 << AMENITIES.index(amenity)
+    return mask
+
+
+# 숙소 조회 시 공통으로 사용하는 QuerySet 클래스
+class AccommodationQuerySet(models.QuerySet):
+    # 목록/상세/인기 숙소/관리자 페이지 등 모든 숙소 조회 경로에서 사용하는 메서드
+    def with_stats(self, prefetch_images=True, image_fields=None):
+        """
+        평균 평점(avg_rating)을 저장된 집계 컬럼으로 계산해 추가하고
+        표시 순서대로 정렬된 이미지를 미리 로드 (숙소 수와 관계없이 쿼리 수 고정)
+        prefetch_images: 이미지가 필요 없는 경로(인기 숙소 등)에서는 False
+        image_fields: 이미지에서 읽을 필드 이름 목록 (None이면 전체)
+        """
+        queryset = self.annotate(
+            avg_rating=models.Case(
+                models.When(vote_count=0, then=models.Value(0.0)),
+                default=models.F('rating_sum') * 1.0 / models.F('vote_count'),
+                output_field=models.FloatField(),
+            )
+        )
+
+        if prefetch_images:
+            images = AccommodationImage.objects.order_by('order', 'created_at')
+            if image_fields is not None:
+                # 숙소와 연결하기 위한 외래키 컬럼은 항상 필요
+                images = images.only('accommodation', *image_fields)
+            queryset = queryset.prefetch_related(models.Prefetch('images', queryset=images))
+
+        return queryset
+
+    # 베이지안 평균에 사용할 전체 사전 분포(prior) 값을 계산하는 메서드
+    def rating_prior(self):
+        """
+        전체 평균 평점과 숙소당 평균 투표 수를 집계 쿼리 한 번으로 계산
+        반환값: (prior_mean, prior_weight)
+        """
+        return self._prior_from_totals(self.aggregate(**self._PRIOR_AGGREGATES))
+
+    # rating_prior()의 비동기 버전 (비동기 View용)
+    async def arating_prior(self):
+        return self._prior_from_totals(await self.aaggregate(**self._PRIOR_AGGREGATES))
+
+    # 사전 분포 계산에 필요한 집계
+    _PRIOR_AGGREGATES = {
+        'total_sum': models.Sum('rating_sum'),
+        'total_votes': models.Sum('vote_count'),
+        'total_accommodations': models.Count('id'),
+    }
+
+    # 집계 결과로 (prior_mean, prior_weight)를 계산하는 메서드
+    @staticmethod
+    def _prior_from_totals(totals):
+        total_votes = totals['total_votes'] or 0
+        if not total_votes:
+            return 0.0, 0.0
+
+        prior_mean = totals['total_sum'] / total_votes
+        prior_weight = total_votes / totals['total_accommodations']
+        return prior_mean, prior_weight
+
+    # 랭킹 점수(score)를 계산해 추가하는 메서드
+    def with_score(self, method='bayesian', prior_mean=0.0, prior_weight=0.0, z=1.96):
+        """
+        저장된 집계 컬럼만으로 DB에서 랭킹 점수를 계산 (투표 테이블 조인 없음)
+        method:
+            'mean'     - 단순 평균 평점 (투표 1개짜리 10점이 1위가 될 수 있음)
+            'bayesian' - 전체 평균(prior_mean)을 prior_weight개 투표만큼 섞은 베이지안 평균
+            'wilson'   - 평점을 0~1로 정규화한 Wilson 신뢰구간 하한을 다시 1~10점으로 환산
+        """
+        votes = models.F('vote_count')
+        mean = models.F('rating_sum') * 1.0 / votes
+
+        if method == 'mean':
+            score = mean
+        elif method == 'bayesian':
+            score = (models.Value(prior_mean * prior_weight) + models.F('rating_sum')) / (
+                models.Value(prior_weight) + votes
+            )
+        elif method == 'wilson':
+            # 1~10점 평균을 0~1 비율로 정규화
+            p = (mean - 1.0) / 9.0
+            z2 = z * z
+            lower_bound = (
+                p + models.Value(z2 / 2) / votes
+                - models.Value(z) * Sqrt((p * (1.0 - p) + models.Value(z2 / 4) / votes) / votes)
+            ) / (1.0 + models.Value(z2) / votes)
+            score = 1.0 + lower_bound * 9.0
+        else:
+            raise ValueError(f"지원되지 않는 랭킹 방식입니다: {method}")
+
+        # 투표가 없는 숙소는 베이지안이면 전체 평균, 나머지는 0점
+        empty_score = prior_mean if method == 'bayesian' else 0.0
+
+        return self.annotate(
+            score=models.Case(
+                models.When(vote_count=0, then=models.Value(float(empty_score))),
+                default=score,
+                output_field=models.FloatField(),
+            )
+        )
+
+    # 점수 순위(rank)와 동점 그룹(tie_group)까지 계산해 정렬하는 메서드
+    def ranked(self, method='bayesian', **score_options):
+        """
+        with_score()에 윈도우 함수를 더해 순위를 DB에서 계산
+        rank: 동점이면 같은 순위, 다음 순위는 건너뜀 (1, 1, 3)
+        tie_group: 동점 묶음 번호 (1, 1, 2)
+        total: 전체 숙소 수 (LIMIT/OFFSET 적용 전, 별도 COUNT 쿼리 불필요)
+        """
+        order = models.F('score').desc()
+        return self.with_score(method, **score_options).annotate(
+            rank=models.Window(expression=Rank(), order_by=order),
+            tie_group=models.Window(expression=DenseRank(), order_by=order),
+            total=models.Window(expression=models.Count('id')),
+        ).order_by('-score', '-vote_count', 'id')
+
+    # 편의시설로 숙소를 거르는 메서드
+    def with_amenities(self, amenities, match='all'):
+        """
+        JSON 필드 대신 정수 컬럼(amenity_bits)의 비트 연산으로 비교
+        match:
+            'all' - 지정한 편의시설을 모두 갖춘 숙소
+            'any' - 하나라도 갖춘 숙소
+        """
+        mask = amenity_mask(amenities)
+        if not mask:
+            return self
+        queryset = self.alias(matched_amenities=models.F('amenity_bits').bitand(mask))
+        if match == 'any':
+            return queryset.filter(matched_amenities__gt=0)
+        return queryset.filter(matched_amenities=mask)
+
+    # 편의시설별 숙소 수를 계산하는 메서드
+    def amenity_facets(self):
+        """
+        전체 숙소 수와 모든 편의시설의 숙소 수를 집계 쿼리 한 번으로 계산
+        (비트별 AND 결과를 더한 뒤 비트 값으로 나누면 해당 편의시설을 가진 숙소 수)
+        반환값: (전체 숙소 수, {'wifi': 3, 'parking': 0, ...})
+        """
+        totals = self.order_by().aggregate(
+            total=models.Count('id'),
+            **{
+                amenity: models.Sum(models.F('amenity_bits').bitand(1 << bit))
+                for bit, amenity in enumerate(AMENITIES)
+            },
+        )
+        return totals['total'], {
+            amenity: (totals[amenity] or 0) >> bit
+            for bit, amenity in enumerate(AMENITIES)
+        }
+
+
+# 편의시설 필터에서 지원하는 비교 방식 목록
+AMENITY_MATCH_MODES = ('all', 'any')
+
+# 랭킹 API에서 지원하는 점수 계산 방식 목록
+RANKING_METHODS = ('mean', 'bayesian', 'wilson')
+
+
 # 숙소 정보를 저장하는 모델 클래스 정의
 class Accommodation(models.Model):
     # 숙소 이름 필드 (최대 200자, 관리자 페이지에서 "숙소명"으로 표시)
@@ -40,12 +224,26 @@ class Accommodation(models.Model):
     # 편의시설 정보 필드 (JSON 형태로 저장, 기본값은 빈 리스트)
     amenities = models.JSONField(default=list, verbose_name="편의시설")
 
+    # 편의시설 비트마스크 (AMENITIES 순서의 비트, 저장 시 amenities로부터 자동 계산되며 필터/집계에 사용)
+    # 비트 AND 조건은 B-tree 인덱스로 찾을 수 없으므로 인덱스를 두지 않음 (행마다 정수 비교 한 번)
+    amenity_bits = models.PositiveIntegerField(default=0, editable=False, verbose_name="편의시설 비트")
+
     # 숙소 등록 날짜와 시간 (자동으로 현재 시간 저장)
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
 
     # 숙소 정보 수정 날짜와 시간 (수정될 때마다 자동으로 현재 시간 업데이트)
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
+    # 투표 집계 컬럼 (투표가 생성/수정/삭제될 때마다 votes 앱에서 갱신, 직접 수정 불가)
+    # 총 투표 수
+    vote_count = models.PositiveIntegerField(default=0, editable=False, verbose_name="투표 수")
+
+    # 모든 투표 평점의 합계 (평균 평점 = rating_sum / vote_count)
+    rating_sum = models.PositiveIntegerField(default=0, editable=False, verbose_name="평점 합계")
+
+    # 기본 매니저 (with_stats() 등 공통 조회 메서드 제공)
+    objects = AccommodationQuerySet.as_manager()
+
     # 데이터베이스 테이블 설정을 위한 메타 클래스
     class Meta:
         # 실제 데이터베이스 테이블명
@@ -60,34 +258,53 @@ class Accommodation(models.Model):
         # 기본 정렬 순서 (생성일 기준 내림차순 - 최신 것부터)
         ordering = ['-created_at']
 
+        # 커서 페이지네이션 정렬 순서와 같은 복합 인덱스
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='accommodations_created_id_idx'),
+            # 가격 범위 필터, 가격 정렬, 가격 분포 집계용 인덱스
+            models.Index(fields=['price', 'id'], name='accommodations_price_id_idx'),
+        ]
+
+    # votes 앱에서만 갱신하는 투표 집계 컬럼 목록
+    AGGREGATE_FIELDS = ('vote_count', 'rating_sum')
+
     # 객체를 문자열로 표현할 때 사용되는 메서드
     def __str__(self):
         return self.name  # 숙소 이름을 반환
 
+    # 숙소 정보 저장 메서드 (오버라이드)
+    def save(self, *args, **kwargs):
+        """
+        숙소 정보를 저장하는 메서드
+        기존 숙소를 저장할 때는 투표 집계 컬럼을 덮어쓰지 않도록 제외
+        (숙소를 불러온 뒤 들어온 투표의 집계가 오래된 값으로 되돌아가는 것을 방지)
+        편의시설 비트마스크는 항상 amenities 값으로 다시 계산
+        """
+        self.amenity_bits = amenity_mask(self.amenities)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'amenities' in update_fields and 'amenity_bits' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'amenity_bits']
+
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.AGGREGATE_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     # 숙소의 평균 평점을 계산하는 프로퍼티 (computed property)
     @property
     def average_rating(self):
         """
         이 숙소에 대한 모든 투표의 평균 평점을 계산
-        votes는 Vote 모델에서 정의된 related_name으로 연결됨
+        저장된 집계 컬럼(rating_sum, vote_count)만 사용하므로 추가 쿼리가 발생하지 않음
         """
-        # 이 숙소에 대한 모든 투표를 가져옴
-        votes = self.votes.all()
-
         # 투표가 없으면 0 반환
-        if not votes:
+        if not self.vote_count:
             return 0
 
-        # 모든 투표의 평점을 합산하고 투표 수로 나누어 평균 계산 후 소수점 첫째 자리까지 반올림
-        return round(sum(vote.rating for vote in votes) / len(votes), 1)
-
-    # 숙소의 총 투표 수를 계산하는 프로퍼티
-    @property
-    def vote_count(self):
-        """
-        이 숙소에 대한 총 투표 수를 계산
-        """
-        return self.votes.count()  # 관련된 투표 수를 반환
+        # 평점 합계를 투표 수로 나누어 평균 계산 후 소수점 첫째 자리까지 반올림
+        return round(self.rating_sum / self.vote_count, 1)
 
 
 # 숙소 이미지 정보를 저장하는 모델 클래스 정의
@@ -103,9 +320,19 @@ class AccommodationImage(models.Model):
     # 이미지 파일을 저장하는 필드
     image = models.ImageField(
         upload_to=accommodation_image_path,  # 위에서 정의한 함수로 저장 경로 결정
+        storage=get_image_storage,  # 같은 내용의 파일은 한 번만 저장하는 저장소
         verbose_name="이미지"
     )
 
+    # 이미지 파일 내용의 SHA-256 해시 (같은 파일을 공유하는 이미지끼리 같은 값)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        db_index=True,
+        editable=False,
+        verbose_name="내용 해시"
+    )
+
     # 이미지 설명 텍스트 (선택사항, 빈 값 허용)
     alt_text = models.CharField(
         max_length=200,
@@ -116,6 +343,31 @@ class AccommodationImage(models.Model):
     # 이미지 표시 순서 (숫자가 작을수록 먼저 표시)
     order = models.PositiveIntegerField(default=0, verbose_name="순서")
 
+    # 파생본 처리 상태 값들
+    STATUS_PENDING = 'pending'  # 업로드 직후, 처리 대기 중
+    STATUS_PROCESSING = 'processing'  # 백그라운드에서 처리 중
+    STATUS_READY = 'ready'  # 파생본 생성 완료
+    STATUS_FAILED = 'failed'  # 파생본 생성 실패 (원본은 그대로 제공)
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_PROCESSING, '처리 중'),
+        (STATUS_READY, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    # 크기별 파생본 이미지 정보 (imaging.generate_variants 결과, 업로드 후 자동 생성)
+    variants = models.JSONField(default=dict, blank=True, editable=False, verbose_name="파생 이미지")
+
+    # 파생본 처리 상태 (처리 대기열 역할도 함, manage.py process_images 참고)
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        db_index=True,
+        editable=False,
+        verbose_name="처리 상태"
+    )
+
     # 이미지 업로드 날짜와 시간
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
 
@@ -135,4 +387,39 @@ class AccommodationImage(models.Model):
 
     # 객체를 문자열로 표현할 때 사용되는 메서드
     def __str__(self):
-        return f"{self.accommodation.name} - 이미지 {self.order}"
\ No newline at end of file
+        return f"{self.accommodation.name} - 이미지 {self.order}"
+
+    # 이미지 저장 메서드 (오버라이드)
+    def save(self, *args, **kwargs):
+        """
+        새로 올라온 파일이면 저장 전에 내용 해시를 계산
+        (해시가 있어야 upload_to에서 해시 기반 경로를 만들 수 있음)
+        """
+        self.prepare_content_hash()
+        super().save(*args, **kwargs)
+
+    # 업로드된 파일의 내용 해시를 계산하는 메서드
+    def prepare_content_hash(self):
+        """
+        아직 저장소에 기록되지 않은 새 파일이고 내용 해시 저장 방식이 켜져 있을 때만 계산
+        bulk_create처럼 save()를 거치지 않는 경로에서는 직접 호출해야 함
+        """
+        if self.image and not self.image._committed and content_addressed_uploads_enabled():
+            self.content_hash = compute_content_hash(self.image.file)
+
+    # 같은 파일을 사용하는 다른 이미지가 있는지 확인하는 메서드
+    def is_file_shared(self):
+        """
+        파일 참조 수 확인 (같은 경로를 가리키는 다른 이미지 행이 있으면 True)
+        """
+        return AccommodationImage.objects.filter(image=self.image.name).exclude(pk=self.pk).exists()
+
+    # 파생본 이미지를 생성하고 저장하는 메서드
+    def build_variants(self):
+        """
+        원본 이미지로 크기별 파생본을 만들고 variants, status 필드만 갱신
+        """
+        self.variants = generate_variants(self)
+        self.status = self.STATUS_READY
+        AccommodationImage.objects.filter(pk=self.pk).update(variants=self.variants, status=self.status)
+        return self.variants
@@ -0,0 +1,228 @@
+# 숙소 이름/위치/설명 전문 검색 색인을 관리하고 검색하는 모듈
+import re
+
+# Django의 데이터베이스 관련 기능을 가져옴
+from django.db import connection
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+
+
+# 검색 색인 테이블 이름 (SQLite: FTS5 가상 테이블, PostgreSQL: tsvector + GIN 인덱스 테이블)
+SEARCH_TABLE = 'accommodation_search'
+
+# 색인하는 숙소 필드와 가중치 순서 (이름 > 위치 > 설명)
+SEARCH_FIELDS = ('name', 'location', 'description')
+
+# 필드별 가중치 (SQLite bm25 가중치, PostgreSQL setweight 등급)
+SQLITE_WEIGHTS = (10.0, 5.0, 1.0)
+POSTGRES_WEIGHTS = ('A', 'B', 'C')
+
+# 단어와 한글 문자를 찾는 정규식
+WORD_RE = re.compile(r'\w+')
+HANGUL_RE = re.compile(r'[가-힣]')
+
+
+# 텍스트를 검색 토큰 목록으로 바꾸는 함수
+def tokenize(text):
+    """
+    영문/숫자는 단어 단위(소문자), 한글 단어는 단어 자체와 2글자씩 끊은 n-gram(bigram)을 함께 사용
+    (한글은 조사가 붙거나 띄어쓰기가 달라도 '가평', '펜션' 같은 부분 문자열로 찾을 수 있도록)
+    예: '가평펜션 Pool' -> ['가평펜션', '가평', '평펜', '펜션', 'pool']
+    """
+    tokens = []
+    for word in WORD_RE.findall(text.lower()):
+        tokens.append(word)
+        if len(word) > 2 and HANGUL_RE.search(word):
+            tokens += [word[i:i + 2] for i in range(len(word) - 1)]
+    return tokens
+
+
+# 색인에 저장할 문서 문자열을 만드는 함수
+def build_document(text):
+    return ' '.join(tokenize(text or ''))
+
+
+# 검색어를 단어별 토큰 묶음으로 바꾸는 함수
+def parse_query(query):
+    """
+    반환값: [[단어, bigram, ...], ...]
+    단어끼리는 AND, 한 단어 안의 토큰끼리는 OR로 검색
+    (한글 '가평에' -> '가평에'로 시작하는 토큰 또는 '가평'/'평에' bigram이 있는 숙소)
+    """
+    groups = []
+    for word in WORD_RE.findall(query.lower()):
+        group = [word]
+        if len(word) > 2 and HANGUL_RE.search(word):
+            group += [word[i:i + 2] for i in range(len(word) - 1)]
+        groups.append(group)
+    return groups
+
+
+# 현재 데이터베이스에서 사용할 검색 방식을 반환하는 함수
+def get_search_backend(conn=None):
+    """
+    반환값: 'sqlite'   - FTS5 가상 테이블
+            'postgresql' - tsvector 컬럼과 GIN 인덱스
+            None       - 색인 없음 (LIKE 검색으로 대체)
+    """
+    conn = conn or connection
+    if conn.vendor == 'postgresql':
+        return 'postgresql'
+    if conn.vendor == 'sqlite' and sqlite_fts5_available(conn):
+        return 'sqlite'
+    return None
+
+
+# SQLite에 FTS5 모듈이 있는지 확인하는 함수 (연결마다 한 번만 확인)
+def sqlite_fts5_available(conn):
+    available = getattr(conn, '_fts5_available', None)
+    if available is None:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pragma_module_list WHERE name = 'fts5'")
+            available = cursor.fetchone() is not None
+        conn._fts5_available = available
+    return available
+
+
+# 숙소 한 개의 색인 행을 저장하는 함수
+def _write_index_row(cursor, backend, accommodation_id, values):
+    documents = [build_document(value) for value in values]
+    if backend == 'sqlite':
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [accommodation_id])
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_FIELDS)}) VALUES (%s, %s, %s, %s)",
+            [accommodation_id, *documents],
+        )
+    else:
+        vector = ' || '.join(
+            f"setweight(to_tsvector('simple', %s), '{weight}')" for weight in POSTGRES_WEIGHTS
+        )
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (accommodation_id, document) VALUES (%s, {vector}) "
+            f"ON CONFLICT (accommodation_id) DO UPDATE SET document = EXCLUDED.document",
+            [accommodation_id, *documents],
+        )
+
+
+# 숙소를 검색 색인에 추가하거나 갱신하는 함수
+def index_accommodation(accommodation):
+    """
+    숙소 저장 시 시그널에서 호출 (같은 트랜잭션 안에서 실행)
+    """
+    backend = get_search_backend()
+    if backend is None:
+        return
+    with connection.cursor() as cursor:
+        _write_index_row(
+            cursor, backend, accommodation.pk,
+            [getattr(accommodation, field) for field in SEARCH_FIELDS],
+        )
+
+
+# 숙소를 검색 색인에서 제거하는 함수
+def remove_accommodation(accommodation_id):
+    backend = get_search_backend()
+    if backend is None:
+        return
+    column = 'rowid' if backend == 'sqlite' else 'accommodation_id'
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE {column} = %s", [accommodation_id])
+
+
+# 모든 숙소로 검색 색인을 다시 만드는 함수
+def rebuild_search_index():
+    """
+    반환값: 색인한 숙소 수
+    """
+    backend = get_search_backend()
+    if backend is None:
+        return 0
+
+    from .models import Accommodation
+
+    rows = Accommodation.objects.order_by().values_list('id', *SEARCH_FIELDS)
+    count = 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        for accommodation_id, *values in rows.iterator():
+            _write_index_row(cursor, backend, accommodation_id, values)
+            count += 1
+    return count
+
+
+# 단어별 토큰 묶음을 색인 검색 조건 문자열로 바꾸는 함수
+def build_match_query(groups, backend):
+    if backend == 'sqlite':
+        # 단어 앞부분 일치("가평"*)와 bigram을 OR로 묶고 단어끼리는 AND
+        return ' AND '.join(
+            '(' + ' OR '.join(f'"{token}"*' for token in group) + ')' for group in groups
+        )
+    return ' & '.join(
+        '(' + ' | '.join(f"'{token}':*" for token in group) + ')' for group in groups
+    )
+
+
+# 검색 조건에 맞는 숙소 ID를 고르는 서브쿼리를 반환하는 함수
+def search_match_ids(match, backend):
+    """
+    pk__in= 에 넘기는 서브쿼리 (개수 제한 없이 색인에서 바로 고르므로 전체 개수와 페이지가 정확함)
+    """
+    if backend == 'sqlite':
+        return RawSQL(f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s", [match])
+    return RawSQL(
+        f"SELECT accommodation_id FROM {SEARCH_TABLE} WHERE document @@ to_tsquery('simple', %s)", [match]
+    )
+
+
+# 숙소 행마다 관련도 점수를 계산하는 식을 반환하는 함수 (값이 클수록 관련도가 높음)
+def search_score(match, backend, table):
+    """
+    table: 바깥 쿼리의 숙소 테이블 이름 (숙소 ID로 색인 행 하나만 찾는 상관 서브쿼리)
+    """
+    column = f'{connection.ops.quote_name(table)}.{connection.ops.quote_name("id")}'
+    if backend == 'sqlite':
+        # bm25는 관련도가 높을수록 작은(음수) 값이므로 부호를 바꿈
+        weights = ', '.join(str(weight) for weight in SQLITE_WEIGHTS)
+        sql = (
+            f"SELECT -bm25({SEARCH_TABLE}, {weights}) FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH %s AND rowid = {column}"
+        )
+    else:
+        sql = (
+            f"SELECT ts_rank(document, to_tsquery('simple', %s)) FROM {SEARCH_TABLE} "
+            f"WHERE accommodation_id = {column}"
+        )
+    return RawSQL(f'({sql})', [match], output_field=FloatField())
+
+
+# 숙소 쿼리셋을 검색어에 맞는 숙소로만 거르는 함수 (정렬하지 않음)
+def filter_search_matches(queryset, query):
+    """
+    색인을 사용할 수 없는 데이터베이스에서는 이름/위치/설명 LIKE 검색으로 대체
+    """
+    backend = get_search_backend()
+    if backend is None:
+        condition = Q()
+        for word in query.split():
+            condition &= Q(name__icontains=word) | Q(location__icontains=word) | Q(description__icontains=word)
+        return queryset.filter(condition)
+
+    groups = parse_query(query)
+    if not groups:
+        return queryset.none()
+    return queryset.filter(pk__in=search_match_ids(build_match_query(groups, backend), backend))
+
+
+# 검색어로 거른 숙소 쿼리셋을 관련도 순으로 정렬하는 함수
+def order_by_relevance(queryset, query):
+    """
+    filter_search_matches()로 거른 쿼리셋에 숙소마다 관련도 점수(search_score)를 붙여 정렬
+    색인을 사용할 수 없는 데이터베이스에서는 최신 순
+    """
+    backend = get_search_backend()
+    groups = parse_query(query)
+    if backend is None or not groups:
+        return queryset.order_by('-created_at', '-id')
+
+    score = search_score(build_match_query(groups, backend), backend, queryset.model._meta.db_table)
+    return queryset.annotate(search_score=score).order_by('-search_score', '-id')
@@ -1,12 +1,28 @@
 # Django REST Framework의 serializers 모듈을 가져옴
 from rest_framework import serializers
 
+# 이미지 헤더 확인을 위한 Pillow
+from PIL import Image
+
+# ?fields= / ?expand= 지원 믹스인
+from core.serializers import DynamicFieldsMixin
+
 # 현재 앱의 모델들을 가져옴
-from .models import Accommodation, AccommodationImage
+from .models import AMENITIES, Accommodation, AccommodationImage
+from .imaging import IMAGE_VARIANT_FORMATS
+
+
+# 업로드 가능한 이미지 조건
+IMAGE_UPLOAD_MAX_SIZE = 5 * 1024 * 1024  # 5MB in bytes
+IMAGE_UPLOAD_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
+IMAGE_UPLOAD_FORMATS = {'JPEG', 'PNG', 'GIF', 'WEBP'}  # Pillow가 식별한 실제 형식
+
+# 일괄 업로드 시 한 번에 보낼 수 있는 최대 파일 수
+BULK_UPLOAD_MAX_FILES = 30
 
 
 # 숙소 이미지 정보를 JSON으로 변환하는 Serializer
-class AccommodationImageSerializer(serializers.ModelSerializer):
+class AccommodationImageSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     숙소 이미지 정보를 JSON 형태로 직렬화/역직렬화하는 클래스
     이미지 URL, 설명, 순서 등의 정보를 포함
@@ -15,16 +31,29 @@ class AccommodationImageSerializer(serializers.ModelSerializer):
     # 이미지 URL을 절대 경로로 반환하는 메서드
     image_url = serializers.SerializerMethodField()
 
+    # 크기별 파생본 URL 정보를 반환하는 메서드
+    variants = serializers.SerializerMethodField()
+
+    # <img srcset> 속성에 바로 쓸 수 있는 형식별 문자열을 반환하는 메서드
+    srcset = serializers.SerializerMethodField()
+
     # Serializer 설정을 위한 메타 클래스
     class Meta:
         # 연결할 모델 지정
         model = AccommodationImage
 
         # JSON에 포함할 필드들 지정
-        fields = ['id', 'image', 'image_url', 'alt_text', 'order', 'created_at']
+        fields = ['id', 'image', 'image_url', 'status', 'variants', 'srcset', 'alt_text', 'order', 'created_at']
 
         # 수정할 수 없는 필드들 (읽기 전용)
-        read_only_fields = ['id', 'created_at']
+        read_only_fields = ['id', 'status', 'created_at']
+
+        # 계산 필드가 읽는 모델 필드 (?fields= 요청 시 only() 계산용)
+        field_sources = {
+            'image_url': ('image',),
+            'variants': ('variants',),
+            'srcset': ('variants',),
+        }
 
     # 이미지 URL을 완전한 경로로 반환하는 메서드
     def get_image_url(self, obj):
@@ -39,19 +68,59 @@ class AccommodationImageSerializer(serializers.ModelSerializer):
         # 이미지가 없으면 None 반환
         return None
 
+    # 저장소 경로를 완전한 URL로 바꾸는 메서드
+    def _build_url(self, name):
+        file_url = AccommodationImage._meta.get_field('image').storage.url(name)
+        request = self.context.get('request')
+        return request.build_absolute_uri(file_url) if request else file_url
+
+    # 크기별 파생본 URL을 반환하는 메서드
+    def get_variants(self, obj):
+        """
+        파생본 정보를 URL이 포함된 형태로 반환
+        obj: AccommodationImage 인스턴스
+        반환값: {'thumb': {'width': 320, 'height': 240, 'webp': URL, 'jpeg': URL}, ...}
+        (아직 파생본이 없으면 빈 딕셔너리)
+        """
+        result = {}
+        for size, entry in (obj.variants or {}).items():
+            result[size] = {
+                key: self._build_url(value) if key in IMAGE_VARIANT_FORMATS else value
+                for key, value in entry.items()
+            }
+        return result
+
+    # 형식별 srcset 문자열을 반환하는 메서드
+    def get_srcset(self, obj):
+        """
+        예: {'webp': 'http://.../a.thumb.webp 320w, http://.../a.card.webp 800w', 'jpeg': '...'}
+        obj: AccommodationImage 인스턴스
+        """
+        result = {}
+        for format_name in IMAGE_VARIANT_FORMATS:
+            candidates = [
+                f"{self._build_url(entry[format_name])} {entry['width']}w"
+                for entry in (obj.variants or {}).values()
+                if entry.get(format_name)
+            ]
+            if candidates:
+                result[format_name] = ', '.join(candidates)
+        return result
+
 
 # 숙소 정보를 JSON으로 변환하는 기본 Serializer
-class AccommodationSerializer(serializers.ModelSerializer):
+class AccommodationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     숙소 정보를 JSON 형태로 직렬화/역직렬화하는 클래스
     숙소의 모든 정보와 관련된 이미지들, 평균 평점, 투표 수 포함
+    ?fields=id,name,price 처럼 필요한 필드만 요청 가능 (이미지는 fields나 expand에 적은 경우에만 포함)
     """
 
     # 관련된 이미지들을 중첩해서 포함 (1:N 관계)
     images = AccommodationImageSerializer(many=True, read_only=True)
 
-    # 계산된 속성들 (모델의 @property 메서드들)
-    average_rating = serializers.ReadOnlyField()  # 평균 평점 (읽기 전용)
+    # 평점 관련 정보 (with_stats()에서 추가한 값 또는 저장된 집계 컬럼 사용)
+    average_rating = serializers.SerializerMethodField()  # 평균 평점 (읽기 전용)
     vote_count = serializers.ReadOnlyField()  # 투표 수 (읽기 전용)
 
     # 가격을 원화 형태로 표시하는 메서드
@@ -73,6 +142,26 @@ class AccommodationSerializer(serializers.ModelSerializer):
         # 수정할 수 없는 필드들 (읽기 전용)
         read_only_fields = ['id', 'created_at', 'updated_at']
 
+        # ?fields= 없이 ?expand= 만 보낸 경우 expand에 적어야 포함되는 중첩 필드
+        expandable_fields = ('images',)
+
+        # 계산 필드가 읽는 모델 필드 (?fields= 요청 시 only() 계산용)
+        field_sources = {
+            'price_formatted': ('price',),
+            'average_rating': ('vote_count', 'rating_sum'),
+        }
+
+    # 평균 평점을 반환하는 메서드
+    def get_average_rating(self, obj):
+        """
+        with_stats()로 조회한 경우 annotate된 avg_rating을, 아니면 모델 프로퍼티를 사용
+        obj: Accommodation 인스턴스
+        """
+        avg_rating = getattr(obj, 'avg_rating', None)
+        if avg_rating is None:
+            return obj.average_rating
+        return round(avg_rating, 1)
+
     # 가격을 한국 원화 형태로 포맷팅하는 메서드
     def get_price_formatted(self, obj):
         """
@@ -106,11 +195,8 @@ class AccommodationCreateSerializer(serializers.ModelSerializer):
         편의시설 필드의 유효성을 검사하는 메서드
         value: 클라이언트에서 입력한 편의시설 리스트
         """
-        # 허용되는 편의시설 목록
-        allowed_amenities = [
-            'wifi', 'parking', 'pool', 'restaurant', 'kitchen',
-            'valley', 'sea', 'ocean_view', 'bbq', 'karaoke', 'billiards', 'foot_volleyball'
-        ]
+        # 허용되는 편의시설 목록 (models.AMENITIES, 순서가 비트마스크 위치)
+        allowed_amenities = list(AMENITIES)
 
         # 입력된 편의시설이 허용 목록에 있는지 확인
         if value:
@@ -204,18 +290,87 @@ class AccommodationImageUploadSerializer(serializers.ModelSerializer):
         이미지 파일의 유효성을 검사하는 메서드
         value: 업로드된 이미지 파일
         """
-        # 파일 크기 제한 (5MB)
-        max_size = 5 * 1024 * 1024  # 5MB in bytes
-        if value.size > max_size:
-            raise serializers.ValidationError("이미지 파일은 5MB 이하여야 합니다.")
-
-        # 파일 확장자 확인
-        allowed_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-        file_extension = value.name.lower().split('.')[-1]
-        if f'.{file_extension}' not in allowed_extensions:
-            raise serializers.ValidationError(
-                f"지원되지 않는 파일 형식입니다. 허용 형식: {allowed_extensions}"
-            )
-
-        # 유효한 이미지면 그대로 반환
-        return value
\ No newline at end of file
+        return validate_image_file(value)
+
+
+# 여러 이미지를 한 번에 업로드할 때 사용하는 Serializer
+class AccommodationImageBulkUploadSerializer(serializers.Serializer):
+    """
+    숙소 이미지 일괄 업로드 시 사용하는 클래스
+    모든 파일을 한 번에 검사하고, 하나라도 잘못되면 아무것도 저장하지 않음
+    """
+
+    # 업로드할 이미지 파일 목록 (multipart의 같은 이름 'images'로 여러 개 전송)
+    images = serializers.ListField(
+        child=serializers.FileField(),
+        allow_empty=False,
+        max_length=BULK_UPLOAD_MAX_FILES,
+    )
+
+    # 이미지 설명 목록 (선택사항, images와 같은 순서)
+    alt_texts = serializers.ListField(
+        child=serializers.CharField(max_length=200, allow_blank=True),
+        required=False,
+        default=list,
+    )
+
+    # multipart 데이터에서 같은 이름의 값들을 리스트로 꺼내는 메서드
+    def to_internal_value(self, data):
+        if hasattr(data, 'getlist'):
+            data = {
+                'images': data.getlist('images'),
+                'alt_texts': data.getlist('alt_text'),
+            }
+        return super().to_internal_value(data)
+
+    # 이미지 파일 목록 유효성 검사
+    def validate_images(self, value):
+        """
+        각 파일의 크기, 확장자, 실제 이미지 헤더를 한 번에 검사
+        value: 업로드된 파일 목록
+        """
+        errors = {}
+        for index, image_file in enumerate(value):
+            try:
+                validate_image_file(image_file)
+            except serializers.ValidationError as error:
+                errors[f'{index}:{image_file.name}'] = error.detail
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return value
+
+
+# 이미지 파일 하나의 유효성을 검사하는 함수 (단일/일괄 업로드 공용)
+def validate_image_file(value):
+    """
+    파일 크기, 확장자, 실제 이미지 헤더(Pillow로 형식 식별)를 검사
+    헤더만 읽으므로 큰 파일도 전체를 메모리에 올리지 않음
+    value: 업로드된 파일
+    """
+    # 파일 크기 제한 (5MB)
+    if value.size > IMAGE_UPLOAD_MAX_SIZE:
+        raise serializers.ValidationError("이미지 파일은 5MB 이하여야 합니다.")
+
+    # 파일 확장자 확인
+    file_extension = value.name.lower().split('.')[-1]
+    if f'.{file_extension}' not in IMAGE_UPLOAD_EXTENSIONS:
+        raise serializers.ValidationError(
+            f"지원되지 않는 파일 형식입니다. 허용 형식: {IMAGE_UPLOAD_EXTENSIONS}"
+        )
+
+    # 파일 내용이 실제 이미지인지 확인 (확장자만 바꾼 파일 차단)
+    try:
+        with Image.open(value) as image:
+            image_format = image.format
+    except (OSError, Image.DecompressionBombError):
+        image_format = None
+    finally:
+        value.seek(0)
+
+    if image_format not in IMAGE_UPLOAD_FORMATS:
+        raise serializers.ValidationError("올바른 이미지 파일이 아닙니다.")
+
+    # 유효한 이미지면 그대로 반환
+    return value
\ No newline at end of file
@@ -0,0 +1,48 @@
+# Django의 시그널 기능을 가져옴
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# 현재 앱의 모델과 이미지 처리 함수를 가져옴
+from .imaging import delete_variants
+from .models import Accommodation, AccommodationImage
+from .search import SEARCH_FIELDS, index_accommodation, remove_accommodation
+
+
+# 숙소 이미지가 삭제될 때 더 이상 참조되지 않는 파일을 삭제하는 시그널 핸들러
+@receiver(post_delete, sender=AccommodationImage)
+def delete_unreferenced_image_files(sender, instance, **kwargs):
+    """
+    이미지 삭제 직후 실행 (숙소 삭제로 인한 연쇄 삭제 포함)
+    내용 해시 저장 방식에서는 여러 이미지가 같은 파일을 공유하므로,
+    삭제가 커밋된 뒤 같은 파일을 가리키는 이미지가 하나도 없을 때만 원본과 파생본을 삭제
+    """
+    storage = instance.image.storage
+    name = instance.image.name
+    variants = instance.variants
+
+    def delete_files():
+        if not name or AccommodationImage.objects.filter(image=name).exists():
+            return
+        delete_variants(storage, variants)
+        if storage.exists(name):
+            storage.delete(name)
+
+    transaction.on_commit(delete_files)
+
+
+# 숙소가 저장될 때 검색 색인을 갱신하는 시그널 핸들러
+@receiver(post_save, sender=Accommodation)
+def update_search_index(sender, instance, created, update_fields=None, **kwargs):
+    """
+    이름/위치/설명이 저장 대상일 때만 색인 행을 다시 씀 (같은 트랜잭션 안에서 실행)
+    """
+    if update_fields is not None and not set(update_fields) & set(SEARCH_FIELDS):
+        return
+    index_accommodation(instance)
+
+
+# 숙소가 삭제될 때 검색 색인에서 제거하는 시그널 핸들러
+@receiver(post_delete, sender=Accommodation)
+def delete_search_index(sender, instance, **kwargs):
+    remove_accommodation(instance.pk)
@@ -0,0 +1,103 @@
+# 숙소 이미지를 내용 해시(SHA-256) 기반 경로에 저장하는 저장소 모듈
+import os
+import re
+import uuid
+
+# Django 설정 및 파일 저장소 기능을 가져옴
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+# 파일 내용 해시 계산 함수를 가져옴
+from core.files import file_sha256
+
+
+# 내용 해시 기반 파일이 저장되는 최상위 폴더
+CONTENT_ADDRESSED_PREFIX = 'accommodations/sha256/'
+
+# 내용 해시 파일 이름 형식 (확장자를 뺀 이름이 정확히 64자리 16진수 해시)
+CONTENT_HASH_NAME_RE = re.compile(r'^[0-9a-f]{64}(\.[A-Za-z0-9]+)?$')
+
+
+# 파일 내용의 SHA-256 해시를 계산하는 함수
+def compute_content_hash(file):
+    """
+    파일을 청크 단위로 읽어 해시를 계산 (큰 파일도 메모리에 한 번에 올리지 않음)
+    Idempotency-Key 요청 지문에서 이미 계산했다면 그 값을 재사용
+    file: Django File 객체 (계산 후 처음 위치로 되돌림)
+    반환값: 64자리 16진수 문자열
+    """
+    return file_sha256(file)
+
+
+# 내용 해시로 저장 경로를 만드는 함수
+def content_addressed_path(content_hash, filename):
+    """
+    해시 앞 4자리로 2단계 폴더를 나눠 한 폴더에 파일이 몰리지 않도록 함
+    예: 'accommodations/sha256/ab/cd/abcd...ef.jpg'
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    return f'{CONTENT_ADDRESSED_PREFIX}{content_hash[:2]}/{content_hash[2:4]}/{content_hash}{extension}'
+
+
+# 경로가 내용 해시 기반인지 확인하는 함수
+def is_content_addressed(name):
+    """
+    해시 폴더 아래에 있고 파일 이름이 그 파일 내용의 해시인 경우만 True
+    같은 폴더의 파생본('<원본 해시>.thumb.webp')은 원본의 해시를 이름에 쓰므로 제외
+    (파생본은 크기/품질 설정을 바꿔 다시 만들면 같은 경로의 내용이 바뀜)
+    """
+    return (
+        bool(name)
+        and name.startswith(CONTENT_ADDRESSED_PREFIX)
+        and CONTENT_HASH_NAME_RE.match(os.path.basename(name)) is not None
+    )
+
+
+# 내용 해시 기반 경로는 중복 저장하지 않는 파일 저장소
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    해시 경로('accommodations/sha256/...')에 같은 파일이 이미 있으면 다시 쓰지 않고 그 경로를 그대로 사용
+    (같은 내용이면 같은 이름이므로 _1, _2 접미사가 생기지 않고 디스크도 추가로 쓰지 않음)
+    그 외 경로(기존 'accommodations/숙소ID/파일명' 방식)는 기본 FileSystemStorage와 동일하게 동작
+    """
+
+    # 저장 가능한 이름을 반환하는 메서드 (오버라이드)
+    def get_available_name(self, name, max_length=None):
+        # 해시 경로는 이름이 곧 내용이므로 이미 있어도 그대로 사용
+        if is_content_addressed(name):
+            return name
+        return super().get_available_name(name, max_length=max_length)
+
+    # 실제 파일을 저장하는 메서드 (오버라이드)
+    def _save(self, name, content):
+        if not is_content_addressed(name):
+            return super()._save(name, content)
+
+        # 같은 내용의 파일이 이미 있으면 쓰지 않음
+        if self.exists(name):
+            return name
+
+        # 임시 파일에 쓴 뒤 원자적으로 이름을 바꿈 (동시에 같은 파일을 올려도 내용이 같으므로 안전)
+        full_path = self.path(name)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        temp_path = f'{full_path}.{uuid.uuid4().hex}.tmp'
+        with open(temp_path, 'wb') as destination:
+            for chunk in content.chunks():
+                destination.write(chunk)
+        if self.file_permissions_mode is not None:
+            os.chmod(temp_path, self.file_permissions_mode)
+        os.replace(temp_path, full_path)
+
+        return name
+
+
+# 숙소 이미지 필드에서 사용하는 저장소를 반환하는 함수
+def get_image_storage():
+    return ContentAddressedStorage()
+
+
+# 새 업로드를 내용 해시 기반으로 저장할지 확인하는 함수
+def content_addressed_uploads_enabled():
+    return settings.ACCOMMODATION_IMAGE_STORAGE_MODE == 'hashed'
@@ -0,0 +1,113 @@
+# 숙소 이미지 파생본 생성을 요청 처리 흐름 밖에서 실행하는 모듈
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+# Django 설정 및 데이터베이스 관련 기능을 가져옴
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+# 현재 앱의 모델을 가져옴
+from .models import AccommodationImage
+
+# 조건부 GET용 테이블 버전 함수
+from core.versions import bump_table_versions
+
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 안에서 공유하는 이미지 처리 스레드 풀 (처음 사용할 때 생성)
+_executor = None
+
+
+# 이미지 처리 스레드 풀을 반환하는 함수
+def _get_executor():
+    """
+    Pillow는 리사이즈/인코딩 중 GIL을 해제하므로 스레드 풀로도 여러 코어를 활용할 수 있음
+    (프로세스 풀과 달리 DB 연결·Django 설정을 다시 초기화할 필요가 없음)
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.IMAGE_PROCESSING_WORKERS,
+            thread_name_prefix='image-processing',
+        )
+    return _executor
+
+
+# 이미지 한 장의 파생본을 생성하는 함수
+def process_image(image_id):
+    """
+    대기 중(pending)인 이미지를 처리 중(processing)으로 선점한 뒤 파생본 생성
+    조건부 UPDATE로 선점하므로 여러 워커가 동시에 실행되어도 한 번만 처리됨
+    반환값: 처리했으면 True, 다른 워커가 먼저 가져갔거나 이미 처리됐으면 False
+    """
+    processed = _claim_and_process_image(image_id)
+    if processed:
+        # 상태/파생본은 QuerySet.update()로 바뀌므로 테이블 버전을 직접 올림
+        bump_table_versions('accommodation_images')
+    return processed
+
+
+# 이미지를 선점하고 파생본을 생성하는 함수 (process_image에서 사용)
+def _claim_and_process_image(image_id):
+    claimed = AccommodationImage.objects.filter(
+        pk=image_id, status=AccommodationImage.STATUS_PENDING
+    ).update(status=AccommodationImage.STATUS_PROCESSING)
+    if not claimed:
+        return False
+
+    image = AccommodationImage.objects.get(pk=image_id)
+
+    # 같은 파일을 공유하는 이미지의 파생본이 이미 있으면 다시 만들지 않고 재사용
+    if image.content_hash:
+        processed = AccommodationImage.objects.filter(
+            image=image.image.name, status=AccommodationImage.STATUS_READY
+        ).exclude(pk=image_id).values_list('variants', flat=True).first()
+        if processed:
+            AccommodationImage.objects.filter(pk=image_id).update(
+                variants=processed, status=AccommodationImage.STATUS_READY
+            )
+            return True
+
+    # 선점한 이미지는 어떤 오류가 나도 failed로 바꿔 processing 상태로 남지 않도록 함
+    # (손상된 파일의 OSError/ValueError 외에 Image.DecompressionBombError 등 예상하지 못한 오류 포함,
+    #  sync 처리에서는 업로드가 이미 커밋된 뒤라 오류를 다시 던지지 않음)
+    try:
+        image.build_variants()
+    except Exception:
+        AccommodationImage.objects.filter(pk=image_id).update(status=AccommodationImage.STATUS_FAILED)
+        logger.exception('파생 이미지 생성 실패: %s', image.image.name)
+    return True
+
+
+# 스레드 풀에서 실행되는 처리 함수 (스레드별 DB 연결 정리 포함)
+def _process_image_in_thread(image_id):
+    close_old_connections()
+    try:
+        process_image(image_id)
+    finally:
+        close_old_connections()
+
+
+# 업로드된 이미지들의 파생본 생성을 예약하는 함수
+def enqueue_image_processing(image_ids):
+    """
+    현재 트랜잭션이 커밋된 뒤 IMAGE_PROCESSING_BACKEND 설정에 따라 처리
+        'thread' - 웹 프로세스 안의 스레드 풀에서 처리 (기본값)
+        'worker' - pending 상태로 두고 manage.py process_images 워커가 처리
+        'sync'   - 커밋 직후 현재 스레드에서 바로 처리 (테스트/디버깅용)
+    image_ids: AccommodationImage ID 목록
+    """
+    backend = settings.IMAGE_PROCESSING_BACKEND
+    image_ids = list(image_ids)
+
+    if backend == 'thread':
+        def submit():
+            for image_id in image_ids:
+                _get_executor().submit(_process_image_in_thread, image_id)
+        transaction.on_commit(submit)
+    elif backend == 'sync':
+        def run():
+            for image_id in image_ids:
+                process_image(image_id)
+        transaction.on_commit(run)
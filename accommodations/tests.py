@@ -1,3 +1,628 @@
-from django.test import TestCase
+import csv
+import json
+import shutil
+import tempfile
+from datetime import time
+from io import BytesIO, StringIO
+from unittest import mock
 
-# Create your tests here.
+from PIL import Image
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.cache import cache
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+from django.test import AsyncRequestFactory, Client, TestCase, override_settings
+from django.urls import reverse
+
+from users.models import User
+from votes.models import Vote
+
+from . import async_views
+from .models import Accommodation, AccommodationImage
+from .search import get_search_backend, rebuild_search_index, tokenize
+from .tasks import process_image
+
+
+# 데이터가 늘어나도 숙소 조회 API의 쿼리 수가 고정되는지 확인하는 테스트
+class AccommodationQueryCountTests(TestCase):
+
+    def setUp(self):
+        self.users = [User.objects.create(name=f'{i:02d}') for i in range(3)]
+
+    # 이미지 2장, 투표 3개를 가진 숙소를 count개 생성
+    def create_accommodations(self, count):
+        accommodations = []
+        for _ in range(count):
+            accommodation = Accommodation.objects.create(
+                name='숙소', location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11), amenities=['wifi'],
+            )
+            for order in range(2):
+                AccommodationImage.objects.create(
+                    accommodation=accommodation,
+                    image=f'accommodations/{accommodation.id}/{order}.jpg',
+                    order=order,
+                )
+            for rating, user in enumerate(self.users, start=5):
+                Vote.objects.create(user=user, accommodation=accommodation, rating=rating)
+            accommodations.append(accommodation)
+        return accommodations
+
+    # 데이터 양을 늘려가며 같은 쿼리 수로 응답하는지 확인
+    def assert_constant_queries(self, get_url, expected_queries):
+        for count in (1, 5):
+            accommodations = self.create_accommodations(count)
+            with self.assertNumQueries(expected_queries):
+                response = self.client.get(get_url(accommodations[0]))
+            self.assertEqual(response.status_code, 200)
+
+    def test_list_query_count(self):
+        # 테이블 버전 + 페이지네이션 COUNT + 숙소 + 이미지
+        self.assert_constant_queries(lambda a: reverse('accommodations:accommodation-list-create'), 4)
+
+    def test_detail_query_count(self):
+        # 테이블 버전 + 숙소 + 이미지
+        self.assert_constant_queries(
+            lambda a: reverse('accommodations:accommodation-detail', args=[a.id]), 3
+        )
+
+    def test_popular_query_count(self):
+        # 테이블 버전 + 전체 평균(prior) 집계 + 숙소 (캐시가 없을 때)
+        self.assert_constant_queries(lambda a: reverse('accommodations:popular-accommodations'), 3)
+
+    def test_vote_list_query_count(self):
+        # 테이블 버전 + 페이지네이션 COUNT + 투표 (간단한 형식)
+        self.assert_constant_queries(lambda a: reverse('votes:vote-list-create'), 3)
+
+    def test_nested_vote_list_query_count(self):
+        # 테이블 버전 + 페이지네이션 COUNT + 투표(사용자 조인) + 숙소 + 이미지
+        self.assert_constant_queries(lambda a: reverse('votes:vote-list-create') + '?nested=true', 5)
+
+    def test_sideloaded_vote_list_query_count(self):
+        # 테이블 버전 + 페이지네이션 COUNT + 투표 + 사용자 + 숙소 + 이미지
+        self.assert_constant_queries(
+            lambda a: reverse('votes:vote-list-create') + '?include=users,accommodations', 6
+        )
+
+    def test_sparse_fields_skip_images_and_columns(self):
+        # 테이블 버전 + 페이지네이션 COUNT + 숙소 (이미지를 요청하지 않으면 미리 로드하지 않음)
+        url = reverse('accommodations:accommodation-list-create') + '?fields=id,name,price,average_rating'
+        self.assert_constant_queries(lambda a: url, 3)
+
+        response = self.client.get(url)
+        self.assertEqual(set(response.json()['results'][0]), {'id', 'name', 'price', 'average_rating'})
+        self.assertEqual(response.json()['results'][0]['average_rating'], 6.0)
+
+    def test_sparse_fields_on_nested_images(self):
+        accommodation = self.create_accommodations(1)[0]
+        url = reverse('accommodations:accommodation-detail', args=[accommodation.id])
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {'fields': 'id,images.order'})
+        self.assertEqual(response.json(), {'id': accommodation.id, 'images': [{'order': 0}, {'order': 1}]})
+
+        # ?expand= 만 보내면 기본 필드는 모두 유지
+        response = self.client.get(url, {'expand': 'images'})
+        self.assertIn('description', response.json())
+        self.assertEqual(len(response.json()['images']), 2)
+
+    def test_vote_list_sparse_fields(self):
+        self.create_accommodations(2)
+        url = reverse('votes:vote-list-create')
+        # 테이블 버전 + 페이지네이션 COUNT + 투표 (사용자/숙소를 요청하지 않으면 조인/미리 로드하지 않음)
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {'fields': 'id,rating'})
+        self.assertEqual(set(response.json()['results'][0]), {'id', 'rating'})
+
+        # 테이블 버전 + 페이지네이션 COUNT + 투표(사용자 조인) + 숙소 (이미지 제외)
+        with self.assertNumQueries(4):
+            response = self.client.get(url, {
+                'nested': 'true', 'fields': 'id,user.name,accommodation.name,accommodation.price',
+            })
+        vote = response.json()['results'][0]
+        self.assertEqual(set(vote['user']), {'name'})
+        self.assertEqual(set(vote['accommodation']), {'name', 'price'})
+
+    def test_list_uses_stored_rating_aggregates(self):
+        accommodation = self.create_accommodations(1)[0]
+        response = self.client.get(reverse('accommodations:accommodation-detail', args=[accommodation.id]))
+        self.assertEqual(response.json()['average_rating'], 6.0)
+        self.assertEqual(response.json()['vote_count'], 3)
+        self.assertEqual([image['order'] for image in response.json()['images']], [0, 1])
+
+
+# 랭킹 API 테스트
+class AccommodationRankingTests(TestCase):
+
+    def setUp(self):
+        users = [User.objects.create(name=f'{i:02d}') for i in range(5)]
+        self.single_vote = self.create_accommodation('한 표')
+        self.many_votes = self.create_accommodation('여러 표')
+        self.low_votes = self.create_accommodation('낮은 점수')
+        self.no_votes = self.create_accommodation('투표 없음')
+        Vote.objects.create(user=users[0], accommodation=self.single_vote, rating=10)
+        for user in users:
+            Vote.objects.create(user=user, accommodation=self.many_votes, rating=9)
+            Vote.objects.create(user=user, accommodation=self.low_votes, rating=3)
+
+    def create_accommodation(self, name):
+        return Accommodation.objects.create(
+            name=name, location='가평', price=100000, description='설명',
+            check_in=time(15), check_out=time(11),
+        )
+
+    def get_ranking(self, **params):
+        return self.client.get(reverse('accommodations:accommodation-ranking'), params)
+
+    def test_mean_ranks_single_vote_first(self):
+        results = self.get_ranking(method='mean').json()['results']
+        self.assertEqual(results[0]['id'], self.single_vote.id)
+
+    def test_bayesian_and_wilson_rank_many_votes_first(self):
+        for method in ('bayesian', 'wilson'):
+            results = self.get_ranking(method=method).json()['results']
+            self.assertEqual(results[0]['id'], self.many_votes.id, method)
+            self.assertEqual([row['rank'] for row in results], [1, 2, 3, 4])
+
+    def test_limit_offset_keeps_global_rank(self):
+        data = self.get_ranking(method='mean', limit=1, offset=1).json()
+        self.assertEqual(data['count'], 4)
+        self.assertEqual([(row['id'], row['rank']) for row in data['results']], [(self.many_votes.id, 2)])
+
+    def test_ties_share_rank_and_group(self):
+        Vote.objects.filter(accommodation=self.single_vote).update(rating=9)
+        Accommodation.objects.filter(pk=self.single_vote.pk).update(rating_sum=9)
+        results = self.get_ranking(method='mean').json()['results']
+        self.assertEqual([(row['rank'], row['tie_group']) for row in results], [(1, 1), (1, 1), (3, 2), (4, 3)])
+
+    def test_invalid_method(self):
+        self.assertEqual(self.get_ranking(method='median').status_code, 400)
+
+
+# 임시 MEDIA_ROOT에서 이미지를 업로드/처리하는 테스트의 공통 설정
+class TemporaryMediaMixin:
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root, IMAGE_PROCESSING_BACKEND='sync')
+        self.settings_override.enable()
+        self.accommodation = Accommodation.objects.create(
+            name='숙소', location='가평', price=100000, description='설명',
+            check_in=time(15), check_out=time(11),
+        )
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+
+# 업로드 시 파생 이미지 생성 테스트
+class AccommodationImageVariantTests(TemporaryMediaMixin, TestCase):
+
+    def upload(self, size=(2000, 1000), mode='RGBA', image_format='PNG', name='room.png', **extra):
+        buffer = BytesIO()
+        Image.new(mode, size, (10, 20, 30, 128)[:len(mode)]).save(buffer, image_format)
+        # 커밋 후 실행되는 파생본 처리 콜백까지 실행
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse('accommodations:accommodation-image-upload', args=[self.accommodation.id]),
+                {'accommodation': self.accommodation.id, 'image': SimpleUploadedFile(name, buffer.getvalue())},
+                **extra,
+            )
+
+    def test_upload_returns_pending_then_generates_variants(self):
+        response = self.upload()
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['status'], AccommodationImage.STATUS_PENDING)
+
+        image = AccommodationImage.objects.get()
+        self.assertEqual(image.status, AccommodationImage.STATUS_READY)
+        self.assertEqual(set(image.variants), {'thumb', 'card', 'full'})
+        self.assertEqual((image.variants['thumb']['width'], image.variants['thumb']['height']), (320, 160))
+        for entry in image.variants.values():
+            self.assertTrue(entry['webp'].endswith('.webp'))
+            with image.image.storage.open(entry['jpeg']) as jpeg:
+                self.assertEqual(Image.open(jpeg).format, 'JPEG')
+
+        data = self.client.get(reverse('accommodations:accommodation-images', args=[self.accommodation.id])).json()
+        serialized = data['results'][0]
+        self.assertTrue(serialized['variants']['card']['webp'].startswith('http://testserver/media/'))
+        self.assertIn('320w', serialized['srcset']['webp'])
+
+    def test_retry_with_idempotency_key_replays_response(self):
+        first = self.upload(HTTP_IDEMPOTENCY_KEY='upload-1')
+        retry = self.upload(HTTP_IDEMPOTENCY_KEY='upload-1')
+        self.assertEqual(retry.status_code, 202)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(retry.json()['id'], first.json()['id'])
+        self.assertEqual(AccommodationImage.objects.count(), 1)
+
+    def test_small_image_is_not_upscaled(self):
+        self.upload(size=(100, 50), mode='RGB', image_format='JPEG', name='small.jpg')
+        image = AccommodationImage.objects.get()
+        self.assertEqual(image.variants['full']['width'], 100)
+
+    def test_unreadable_image_is_marked_failed(self):
+        image = AccommodationImage.objects.create(
+            accommodation=self.accommodation, image=SimpleUploadedFile('broken.png', b'not an image')
+        )
+        self.assertTrue(process_image(image.id))
+        image.refresh_from_db()
+        self.assertEqual(image.status, AccommodationImage.STATUS_FAILED)
+        # 이미 처리된 이미지는 다시 선점되지 않음
+        self.assertFalse(process_image(image.id))
+
+    def test_backfill_command_changes_accommodation_etag(self):
+        self.upload()
+        url = reverse('accommodations:accommodation-detail', args=[self.accommodation.id])
+        etag = self.client.get(url)['ETag']
+
+        call_command('generate_image_variants', force=True, stdout=StringIO())
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_unexpected_error_marks_image_failed(self):
+        image = AccommodationImage.objects.create(
+            accommodation=self.accommodation, image=SimpleUploadedFile('huge.png', b'not an image')
+        )
+        error = Image.DecompressionBombError('too many pixels')
+        with mock.patch.object(AccommodationImage, 'build_variants', side_effect=error), \
+                self.assertLogs('accommodations.tasks', 'ERROR'):
+            self.assertTrue(process_image(image.id))
+        image.refresh_from_db()
+        self.assertEqual(image.status, AccommodationImage.STATUS_FAILED)
+
+    def test_delete_removes_variant_files(self):
+        self.upload()
+        image = AccommodationImage.objects.get()
+        storage = image.image.storage
+        names = [image.image.name] + [entry['webp'] for entry in image.variants.values()]
+        with self.captureOnCommitCallbacks(execute=True):
+            image.delete()
+        self.assertFalse(any(storage.exists(name) for name in names))
+
+    def test_identical_uploads_share_one_file(self):
+        self.upload()
+        other = Accommodation.objects.create(
+            name='다른 숙소', location='가평', price=100000, description='설명',
+            check_in=time(15), check_out=time(11),
+        )
+        self.accommodation, first_accommodation = other, self.accommodation
+        self.upload()
+
+        first, second = AccommodationImage.objects.order_by('id')
+        self.assertEqual(first.image.name, second.image.name)
+        self.assertTrue(first.image.name.startswith('accommodations/sha256/'))
+        self.assertEqual(len(first.content_hash), 64)
+        self.assertEqual(second.status, AccommodationImage.STATUS_READY)
+        self.assertEqual(first.variants, second.variants)
+
+        # 하나를 지워도 다른 이미지가 참조하므로 파일은 남음
+        storage = first.image.storage
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertTrue(storage.exists(second.image.name))
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertFalse(storage.exists(second.image.name))
+
+
+# 이미지 일괄 업로드 테스트
+class AccommodationImageBulkUploadTests(TemporaryMediaMixin, TestCase):
+
+    def make_file(self, name, size=(400, 300)):
+        buffer = BytesIO()
+        Image.new('RGB', size).save(buffer, 'PNG')
+        return SimpleUploadedFile(name, buffer.getvalue())
+
+    def bulk_upload(self, files, headers=None, **extra):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse('accommodations:accommodation-image-bulk-upload', args=[self.accommodation.id]),
+                {'images': files, **extra},
+                headers=headers,
+            )
+
+    def test_bulk_upload_assigns_order_and_processes(self):
+        AccommodationImage.objects.create(accommodation=self.accommodation, image='accommodations/x.png', order=0,
+                                          status=AccommodationImage.STATUS_READY)
+
+        response = self.bulk_upload([self.make_file(f'{i}.png') for i in range(3)], alt_text=['a', 'b', 'c'])
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['count'], 3)
+        uploaded = AccommodationImage.objects.exclude(order=0).order_by('order')
+        self.assertEqual([(image.order, image.alt_text) for image in uploaded], [(1, 'a'), (2, 'b'), (3, 'c')])
+        self.assertTrue(all(image.status == AccommodationImage.STATUS_READY for image in uploaded))
+
+    def test_bulk_upload_rejects_fake_image_without_saving(self):
+        response = self.bulk_upload([self.make_file('ok.png'), SimpleUploadedFile('fake.png', b'GIF89a-not-really')])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('1:fake.png', response.json()['images'])
+        self.assertFalse(AccommodationImage.objects.exists())
+
+    def test_reused_key_with_different_file_of_same_size_is_rejected(self):
+        content = self.make_file('0.png').read()
+        changed = content[:100] + bytes([content[100] ^ 0xFF]) + content[101:]
+
+        first = self.bulk_upload([SimpleUploadedFile('0.png', content)], headers={'Idempotency-Key': 'bulk-1'})
+        self.assertEqual(first.status_code, 202)
+
+        retry = self.bulk_upload([SimpleUploadedFile('0.png', content)], headers={'Idempotency-Key': 'bulk-1'})
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+
+        # 본문 길이가 같아도 파일 내용이 다르면 저장된 응답을 돌려주지 않음
+        response = self.bulk_upload([SimpleUploadedFile('0.png', changed)], headers={'Idempotency-Key': 'bulk-1'})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(AccommodationImage.objects.count(), 1)
+
+    def test_bulk_upload_with_session_login_and_csrf(self):
+        # 세션 인증은 CSRF 검사에서 본문을 먼저 파싱하므로 업로드 핸들러를 그보다 앞서 지정해야 함
+        admin = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(admin)
+        token = 'a' * 32
+        client.cookies['csrftoken'] = token
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.post(
+                reverse('accommodations:accommodation-image-bulk-upload', args=[self.accommodation.id]),
+                {'images': [self.make_file('0.png')]},
+                HTTP_X_CSRFTOKEN=token,
+            )
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(AccommodationImage.objects.count(), 1)
+
+
+# 숙소 전문 검색(?q=)과 색인 동기화를 확인하는 테스트
+class AccommodationSearchTests(TestCase):
+
+    def create(self, name, location='가평', description='설명'):
+        return Accommodation.objects.create(
+            name=name, location=location, price=100000, description=description,
+            check_in=time(15), check_out=time(11),
+        )
+
+    def search(self, query):
+        response = self.client.get(reverse('accommodations:accommodation-list-create'), {'q': query})
+        self.assertEqual(response.status_code, 200)
+        return [accommodation['name'] for accommodation in response.data['results']]
+
+    def test_korean_words_are_split_into_bigrams(self):
+        self.assertEqual(tokenize('가평펜션 Pool'), ['가평펜션', '가평', '평펜', '펜션', 'pool'])
+
+    def test_index_is_used_on_sqlite(self):
+        self.assertEqual(get_search_backend(), 'sqlite')
+
+    def test_ranks_name_matches_above_description_matches(self):
+        self.create('바다 전망 호텔', location='속초', description='조용한 숙소')
+        self.create('숲속 캠핑장', location='홍천', description='바다가 보이는 전망대 근처')
+        self.create('도심 호텔', location='서울')
+
+        self.assertEqual(self.search('바다'), ['바다 전망 호텔', '숲속 캠핑장'])
+        self.assertEqual(self.search('호텔 속초'), ['바다 전망 호텔'])
+
+    def test_compound_korean_words_match_parts(self):
+        self.create('가평펜션')
+        self.create('양평 글램핑')
+
+        self.assertEqual(self.search('펜션'), ['가평펜션'])
+        self.assertEqual(self.search('글램핑장'), ['양평 글램핑'])
+
+    def test_index_follows_updates_and_deletes(self):
+        accommodation = self.create('산장')
+        accommodation.name = '호숫가 산장'
+        accommodation.save()
+        self.assertEqual(self.search('호숫가'), ['호숫가 산장'])
+
+        accommodation.delete()
+        self.assertEqual(self.search('호숫가'), [])
+
+    def test_query_without_words_returns_nothing(self):
+        self.create('숙소')
+        self.assertEqual(self.search('!!!'), [])
+
+    def test_count_and_pages_cover_every_match(self):
+        Accommodation.objects.bulk_create([
+            Accommodation(
+                name=f'펜션 {number}', location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+            for number in range(501)
+        ])
+        rebuild_search_index()
+        url = reverse('accommodations:accommodation-list-create')
+
+        response = self.client.get(url, {'q': '펜션', 'page': 26})
+        self.assertEqual(response.data['count'], 501)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(self.client.get(url, {'q': '펜션 없는단어'}).data['count'], 0)
+
+
+# 편의시설 비트마스크 필터(?amenities=)와 패싯 집계를 확인하는 테스트
+class AccommodationAmenityTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for name, amenities in [('수영장', ['pool', 'wifi']), ('바비큐', ['bbq', 'wifi']), ('둘 다', ['pool', 'bbq'])]:
+            Accommodation.objects.create(
+                name=name, location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11), amenities=amenities,
+            )
+
+    def names(self, params):
+        response = self.client.get(reverse('accommodations:accommodation-list-create'), params)
+        self.assertEqual(response.status_code, 200)
+        return {accommodation['name'] for accommodation in response.data['results']}
+
+    def test_all_and_any_matching(self):
+        self.assertEqual(self.names({'amenities': 'pool,bbq'}), {'둘 다'})
+        self.assertEqual(self.names({'amenities': 'pool,bbq', 'amenities_match': 'any'}), {'수영장', '바비큐', '둘 다'})
+        self.assertEqual(self.names({'amenities': 'wifi', 'q': '수영장'}), {'수영장'})
+
+    def test_bits_follow_updates(self):
+        accommodation = Accommodation.objects.get(name='바비큐')
+        accommodation.amenities = ['karaoke']
+        accommodation.save(update_fields=['amenities'])
+        self.assertEqual(self.names({'amenities': 'karaoke'}), {'바비큐'})
+        self.assertNotIn('바비큐', self.names({'amenities': 'bbq'}))
+
+    def test_unknown_amenity_is_rejected(self):
+        response = self.client.get(reverse('accommodations:accommodation-list-create'), {'amenities': 'sauna'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.data)
+
+    def test_facets_come_from_one_query(self):
+        # 테이블 버전 + 패싯 집계
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('accommodations:accommodation-amenities'))
+        self.assertEqual(response.data['total'], 3)
+        self.assertEqual(len(response.data['amenities']), 12)
+        self.assertEqual(response.data['amenities']['wifi'], 2)
+        self.assertEqual(response.data['amenities']['pool'], 2)
+        self.assertEqual(response.data['amenities']['sea'], 0)
+
+        response = self.client.get(reverse('accommodations:accommodation-amenities'), {'amenities': 'pool'})
+        self.assertEqual(response.data['total'], 2)
+        self.assertEqual(response.data['amenities']['bbq'], 1)
+
+
+# 가격 범위 필터, 정렬, 가격 분포 API를 확인하는 테스트
+class AccommodationExportTests(TestCase):
+
+    def test_csv_export_streams_all_rows(self):
+        Accommodation.objects.create(
+            name='숙소, "별관"', location='가평', price=90000, description='첫 줄\n둘째 줄',
+            check_in=time(15), check_out=time(11), amenities=['wifi', 'bbq'],
+        )
+        response = self.client.get(reverse('accommodations:accommodation-export'))
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="accommodations.csv"')
+
+        [row] = csv.DictReader(StringIO(b''.join(response.streaming_content).decode()))
+        self.assertEqual(row['name'], '숙소, "별관"')
+        self.assertEqual(row['description'], '첫 줄\n둘째 줄')
+        self.assertEqual(row['amenities'], 'wifi|bbq')
+        self.assertEqual(row['check_in'], '15:00:00')
+
+
+class AccommodationPriceTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for price in (50000, 80000, 120000, 150000, 240000):
+            Accommodation.objects.create(
+                name=f'숙소 {price}', location='가평', price=price, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+
+    def prices(self, params):
+        response = self.client.get(reverse('accommodations:accommodation-list-create'), params)
+        self.assertEqual(response.status_code, 200)
+        return [accommodation['price'] for accommodation in response.data['results']]
+
+    def test_price_range_and_ordering(self):
+        self.assertEqual(
+            self.prices({'min_price': 80000, 'max_price': 150000, 'ordering': 'price'}),
+            [80000, 120000, 150000],
+        )
+        self.assertEqual(self.prices({'ordering': '-price'})[0], 240000)
+
+    def test_cursor_keeps_requested_ordering(self):
+        Accommodation.objects.create(
+            name='숙소 같은 가격', location='가평', price=120000, description='설명',
+            check_in=time(15), check_out=time(11),
+        )
+        url = reverse('accommodations:accommodation-list-create')
+        params = {'ordering': '-price', 'cursor': '', 'page_size': 2}
+
+        # 같은 가격(120000)이 페이지 경계에 걸려도 빠지거나 겹치는 숙소 없이 가격 순으로 이어짐
+        seen = []
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            seen += [(accommodation['price'], accommodation['id']) for accommodation in response.data['results']]
+            url, params = response.data['next'], None
+        self.assertEqual([price for price, _ in seen], [240000, 150000, 120000, 120000, 80000, 50000])
+        self.assertEqual(len({accommodation_id for _, accommodation_id in seen}), 6)
+
+    def test_invalid_price_is_rejected(self):
+        response = self.client.get(reverse('accommodations:accommodation-list-create'), {'min_price': 'abc'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_histogram_buckets(self):
+        # 테이블 버전 + 최저/최고 가격 + 구간별 GROUP BY
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('accommodations:accommodation-price-histogram'), {'buckets': 4})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['bucket_size'], 47501)
+        self.assertEqual([bucket['count'] for bucket in response.data['buckets']], [2, 1, 1, 1])
+        self.assertEqual(response.data['buckets'][0]['min_price'], 50000)
+        self.assertEqual(response.data['total'], 5)
+
+    def test_histogram_applies_filters(self):
+        response = self.client.get(
+            reverse('accommodations:accommodation-price-histogram'), {'buckets': 2, 'max_price': 100000}
+        )
+        self.assertEqual([bucket['count'] for bucket in response.data['buckets']], [1, 1])
+
+        response = self.client.get(reverse('accommodations:accommodation-price-histogram'), {'buckets': 0})
+        self.assertEqual(response.status_code, 400)
+
+
+# ASGI용 비동기 조회 View가 동기 View와 같은 응답을 주는지 확인하는 테스트
+class AccommodationAsyncViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = AsyncRequestFactory()
+        self.user = User.objects.create(name='민수')
+        self.accommodations = [
+            Accommodation.objects.create(
+                name=f'숙소 {i}', location='가평', price=100000 + i, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+            for i in range(25)
+        ]
+        for i, accommodation in enumerate(self.accommodations[:5]):
+            Vote.objects.create(user=self.user, accommodation=accommodation, rating=i + 5)
+
+    # 같은 URL을 동기 View(테스트 클라이언트)와 비동기 View로 요청해 결과를 비교
+    async def assertSameResponse(self, view, path, **kwargs):
+        sync_response = await self.async_client.get(path)
+        async_response = await view(self.factory.get(path), **kwargs)
+        # 동기 View로 넘긴 DRF 응답은 서버(핸들러)가 렌더링하므로 직접 호출한 테스트에서 렌더링
+        if hasattr(async_response, 'render'):
+            async_response.render()
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(json.loads(async_response.content), json.loads(sync_response.content))
+        return async_response
+
+    async def test_list_detail_ranking_and_stats_match_sync_views(self):
+        list_url = reverse('accommodations:accommodation-list-create')
+        await self.assertSameResponse(async_views.accommodation_list, list_url)
+        await self.assertSameResponse(async_views.accommodation_list, f'{list_url}?page=2')
+        await self.assertSameResponse(async_views.accommodation_list, f'{list_url}?page=9')
+        await self.assertSameResponse(async_views.accommodation_list, f'{list_url}?min_price=100020')
+
+        accommodation_id = self.accommodations[0].id
+        detail_url = reverse('accommodations:accommodation-detail', args=[accommodation_id])
+        await self.assertSameResponse(async_views.accommodation_detail, detail_url, pk=accommodation_id)
+        missing_url = reverse('accommodations:accommodation-detail', args=[0])
+        await self.assertSameResponse(async_views.accommodation_detail, missing_url, pk=0)
+
+        ranking_url = reverse('accommodations:accommodation-ranking')
+        await self.assertSameResponse(async_views.accommodation_ranking, f'{ranking_url}?limit=3&offset=1')
+        await self.assertSameResponse(async_views.accommodation_ranking, f'{ranking_url}?method=unknown')
+
+        await self.assertSameResponse(
+            async_views.accommodation_stats, reverse('accommodations:accommodation-stats')
+        )
+
+    async def test_etag_revalidation_skips_the_view(self):
+        url = reverse('accommodations:accommodation-list-create')
+        response = await async_views.accommodation_list(self.factory.get(url))
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        request = self.factory.get(url, headers={'If-None-Match': response['ETag']})
+        not_modified = await async_views.accommodation_list(request)
+        self.assertEqual(not_modified.status_code, 304)
@@ -1,11 +1,12 @@
 # Django의 URL 패턴 관련 기능을 가져옴
 from django.urls import path
 
-# 현재 앱의 뷰들을 가져옴
-from . import views
+# 현재 앱의 뷰들을 가져옴 (async_views: ASYNC_VIEWS가 켜져 있을 때 쓰는 조회용 비동기 View)
+from . import async_views, views
+from core.async_views import select_view
 
 # votes 앱에서 필요한 클래스들 import (투표와 댓글은 votes 앱에서 관리)
-from votes.views import AccommodationVoteListView
+from votes.views import AccommodationVoteListView, accommodation_vote_trend
 
 # 앱 이름 설정 (URL 네임스페이스 구분용)
 app_name = 'accommodations'
@@ -15,22 +16,42 @@ urlpatterns = [
     # 숙소 목록 조회 및 새 숙소 생성
     # GET /api/accommodations/ - 모든 숙소 목록 조회 (검색, 필터링 지원)
     # POST /api/accommodations/ - 새로운 숙소 생성 (관리자 전용)
-    path('accommodations/', views.AccommodationListCreateView.as_view(), name='accommodation-list-create'),
+    path('accommodations/', select_view(async_views.accommodation_list, views.AccommodationListCreateView.as_view()),
+         name='accommodation-list-create'),
 
     # 숙소 통계 정보
     # GET /api/accommodations/stats/ - 숙소 통계 조회
-    path('accommodations/stats/', views.accommodation_stats, name='accommodation-stats'),
+    path('accommodations/stats/', select_view(async_views.accommodation_stats, views.accommodation_stats),
+         name='accommodation-stats'),
+
+    # 편의시설별 숙소 수
+    # GET /api/accommodations/amenities/ - 편의시설 패싯 조회 (?q=, ?amenities= 필터 적용 가능)
+    path('accommodations/amenities/', views.amenity_facets, name='accommodation-amenities'),
+
+    # 가격 분포
+    # GET /api/accommodations/price-histogram/ - 가격 구간별 숙소 수 조회 (?buckets=10)
+    path('accommodations/price-histogram/', views.price_histogram, name='accommodation-price-histogram'),
 
     # 인기 숙소 목록
     # GET /api/accommodations/popular/ - 인기 숙소 상위 5개 조회
     path('accommodations/popular/', views.popular_accommodations, name='popular-accommodations'),
 
+    # 숙소 내보내기
+    # GET /api/accommodations/export/?format=csv|ndjson - 전체 숙소를 스트리밍으로 내보내기
+    path('accommodations/export/', views.accommodation_export, name='accommodation-export'),
+
+    # 숙소 랭킹
+    # GET /api/accommodations/ranking/ - 점수/순위/동점 그룹이 계산된 숙소 랭킹 조회
+    path('accommodations/ranking/', select_view(async_views.accommodation_ranking, views.accommodation_ranking),
+         name='accommodation-ranking'),
+
     # 특정 숙소 상세 정보
     # GET /api/accommodations/{id}/ - 특정 숙소 정보 조회
     # PUT /api/accommodations/{id}/ - 특정 숙소 정보 수정 (관리자 전용)
     # PATCH /api/accommodations/{id}/ - 특정 숙소 정보 부분 수정 (관리자 전용)
     # DELETE /api/accommodations/{id}/ - 특정 숙소 삭제 (관리자 전용)
-    path('accommodations/<int:pk>/', views.AccommodationDetailView.as_view(), name='accommodation-detail'),
+    path('accommodations/<int:pk>/', select_view(async_views.accommodation_detail, views.AccommodationDetailView.as_view()),
+         name='accommodation-detail'),
 
     # 특정 숙소의 이미지 목록 조회
     # GET /api/accommodations/{accommodation_id}/images/ - 특정 숙소의 모든 이미지 조회
@@ -41,10 +62,19 @@ urlpatterns = [
     path('accommodations/<int:accommodation_id>/images/upload/', views.AccommodationImageUploadView.as_view(),
          name='accommodation-image-upload'),
 
+    # 특정 숙소에 이미지 여러 장 일괄 업로드
+    # POST /api/accommodations/{accommodation_id}/images/bulk-upload/ - 이미지 일괄 업로드 (관리자 전용)
+    path('accommodations/<int:accommodation_id>/images/bulk-upload/', views.AccommodationImageBulkUploadView.as_view(),
+         name='accommodation-image-bulk-upload'),
+
     # 특정 숙소의 투표 목록 (votes 앱에서 가져온 클래스 사용)
     # GET /api/accommodations/{accommodation_id}/votes/ - 특정 숙소의 모든 투표 조회
     path('accommodations/<int:accommodation_id>/votes/', AccommodationVoteListView.as_view(), name='accommodation-votes'),
 
+    # 특정 숙소의 투표 추이
+    # GET /api/accommodations/{accommodation_id}/trend/?interval=hour|day - 시간별/일별 투표 수와 평균 평점, 이동 평균
+    path('accommodations/<int:accommodation_id>/trend/', accommodation_vote_trend, name='accommodation-trend'),
+
     # 개별 이미지 삭제
     # DELETE /api/accommodations/images/{image_id}/ - 특정 이미지 삭제 (관리자 전용)
     path('accommodations/images/<int:pk>/', views.AccommodationImageDetailView.as_view(), name='accommodation-image-detail'),
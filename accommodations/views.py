@@ -6,38 +6,127 @@ from rest_framework.parsers import MultiPartParser, FormParser
 
 # Django의 단축 함수들을 가져옴
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count, Avg
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.db import transaction
+from django.db.models import Q, Count, Avg, F, Value
+from django_filters.rest_framework import DjangoFilterBackend
 
 # 현재 앱의 모델과 serializers를 가져옴
-from .models import Accommodation, AccommodationImage
+from .models import AMENITIES, AMENITY_MATCH_MODES, Accommodation, AccommodationImage, RANKING_METHODS
 from .serializers import (
     AccommodationSerializer,
     AccommodationCreateSerializer,
     AccommodationUpdateSerializer,
     AccommodationImageSerializer,
-    AccommodationImageUploadSerializer
+    AccommodationImageUploadSerializer,
+    AccommodationImageBulkUploadSerializer,
 )
 
 from django.db.models import Min, Max 
+from django.utils.decorators import method_decorator
+
+# 이미지 파생본 백그라운드 처리 함수
+from .tasks import enqueue_image_processing
+
+# 숙소 전문 검색
+from .search import filter_search_matches, order_by_relevance
+
+# 가격 범위 필터와 정렬
+from .filters import AccommodationFilter
+
+# 커서/페이지 번호 겸용 페이지네이션과 ?fields= / ?expand= 지원 믹스인
+from core.mixins import RequestedFieldsMixin
+from core.pagination import CursorOrPageNumberPagination
+
+# 테이블 버전 기반 조건부 GET (ETag / Last-Modified, 304)
+from core.versions import bump_table_versions, conditional_on_tables
+
+# 테이블 버전 기반 응답 캐시
+from core.cache import cache_response_on_tables
+
+# Idempotency-Key 재시도 처리 (재시도 시 파일을 다시 저장하지 않음)
+from core.idempotency import idempotent
+
+# CSV / NDJSON 스트리밍 내보내기
+from django.views.decorators.http import require_GET
+from core.export import export_response
+
+# 숙소 응답에 영향을 주는 테이블 (투표 수/평점은 투표 변경 시 바뀜)
+ACCOMMODATION_TABLES = ('accommodations', 'accommodation_images', 'votes')
+
+
+# 숙소 조회 시 공통으로 사용하는 쿼리셋을 만드는 함수
+def get_accommodation_queryset(serializer=None):
+    """
+    serializer: ?fields= / ?expand= 로 필드가 선택된 AccommodationSerializer
+                (None이면 모든 필드와 이미지를 로드)
+    선택된 필드의 컬럼만 조회(only)하고, 이미지는 응답에 포함될 때만 미리 로드
+    """
+    if serializer is None:
+        return Accommodation.objects.with_stats()
+
+    images = serializer.get_nested_serializer('images')
+    return Accommodation.objects.with_stats(
+        prefetch_images=images is not None,
+        image_fields=images.get_model_field_names() if images is not None else None,
+    ).only(*serializer.get_model_field_names())
+
+
+# 요청의 ?amenities=, ?amenities_match= 값을 확인하는 함수
+def parse_amenity_filter(query_params):
+    """
+    ?amenities=pool,bbq&amenities_match=all (기본값 all, any면 하나라도 갖춘 숙소)
+    반환값: (편의시설 목록, 비교 방식, 오류 메시지 또는 None)
+    """
+    amenities = [name.strip() for name in query_params.get('amenities', '').split(',') if name.strip()]
+    match = query_params.get('amenities_match', 'all')
+
+    invalid = [name for name in amenities if name not in AMENITIES]
+    if invalid:
+        return amenities, match, f"허용되지 않는 편의시설입니다: {invalid}. 허용 목록: {list(AMENITIES)}"
+    if match not in AMENITY_MATCH_MODES:
+        return amenities, match, f"amenities_match는 {list(AMENITY_MATCH_MODES)} 중 하나여야 합니다."
+    return amenities, match, None
+
+
+# 목록/편의시설 집계에서 공통으로 사용하는 검색어, 편의시설 필터를 적용하는 함수
+def filter_accommodations(queryset, query_params):
+    """
+    ?amenities= 는 편의시설 비트마스크 컬럼으로, ?q= 는 검색 색인으로 거름 (정렬하지 않은 쿼리셋 반환)
+    """
+    amenities, match, _ = parse_amenity_filter(query_params)
+    if amenities:
+        queryset = queryset.with_amenities(amenities, match)
+
+    query = query_params.get('q', '').strip()
+    if query:
+        queryset = filter_search_matches(queryset, query)
+    return queryset
 
 
 # 모든 숙소 조회 및 새 숙소 생성을 위한 API View
-class AccommodationListCreateView(generics.ListCreateAPIView):
+@method_decorator(conditional_on_tables(*ACCOMMODATION_TABLES), name='get')
+class AccommodationListCreateView(RequestedFieldsMixin, generics.ListCreateAPIView):
     """
-    GET: 모든 숙소 목록 조회 (페이지네이션 지원)
+    GET: 모든 숙소 목록 조회 (페이지네이션 지원, ?fields=id,name,price / ?expand=images 지원)
+         ?q=검색어 - 이름/위치/설명 전문 검색, 관련도 순 정렬 (?cursor= 와 함께 쓰면 최신 순)
+         ?amenities=pool,bbq&amenities_match=all|any - 편의시설 필터
+         ?min_price=&max_price= - 가격 범위, ?ordering=price / -price / -vote_count 등 - 정렬
+         ?cursor= - 커서 페이지네이션 (?ordering= 이 있으면 그 정렬 + id 순, 없으면 최신 순)
     POST: 새로운 숙소 생성 (관리자 전용)
     URL: /api/accommodations/
     """
 
-    # 조회할 데이터 쿼리셋 지정 (관련 데이터 미리 로드로 성능 최적화)
-    queryset = Accommodation.objects.prefetch_related(
-        'images',  # 숙소 이미지들
-        'votes'  # 투표 정보들
-    ).order_by('-created_at')  # 최신 순으로 정렬
-
     # GET 요청 시 사용할 serializer
     serializer_class = AccommodationSerializer
 
+    # ?cursor= 요청 시 커서 페이지네이션, 그 외에는 페이지 번호 방식
+    pagination_class = CursorOrPageNumberPagination
+
+    # 가격 범위 필터와 정렬 (accommodations.filters)
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = AccommodationFilter
+
     # HTTP 메서드별로 다른 serializer 사용하도록 설정
     def get_serializer_class(self):
         """
@@ -49,9 +138,24 @@ class AccommodationListCreateView(generics.ListCreateAPIView):
             return AccommodationCreateSerializer  # 숙소 생성 시
         return AccommodationSerializer  # 숙소 조회 시
 
-    # GET 요청 처리 (숙소 목록 조회)
+    # 조회할 데이터 쿼리셋 생성 (평점 정보 추가, 요청한 필드만 조회)
     def get_queryset(self):
-        return Accommodation.objects.all().order_by('-created_at')
+        queryset = filter_accommodations(
+            get_accommodation_queryset(self.get_field_serializer()), self.request.query_params
+        )
+
+        # 검색어가 있으면 관련도 순, 없으면 최신 순으로 정렬
+        query = self.request.query_params.get('q', '').strip()
+        if query:
+            return order_by_relevance(queryset, query)
+        return queryset.order_by('-created_at', '-id')
+
+    # GET 요청 처리 (오버라이드, 필터 값 확인)
+    def list(self, request, *args, **kwargs):
+        _, _, error = parse_amenity_filter(request.query_params)
+        if error:
+            return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+        return super().list(request, *args, **kwargs)
 
     # POST 요청 처리 (숙소 생성)
     def perform_create(self, serializer):
@@ -67,20 +171,15 @@ class AccommodationListCreateView(generics.ListCreateAPIView):
 
 
 # 특정 숙소 조회, 수정, 삭제를 위한 API View
-class AccommodationDetailView(generics.RetrieveUpdateDestroyAPIView):
+@method_decorator(conditional_on_tables(*ACCOMMODATION_TABLES), name='get')
+class AccommodationDetailView(RequestedFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     """
-    GET: 특정 숙소 상세 정보 조회
+    GET: 특정 숙소 상세 정보 조회 (?fields= / ?expand= 지원)
     PUT/PATCH: 특정 숙소 정보 수정 (관리자 전용)
     DELETE: 특정 숙소 삭제 (관리자 전용)
     URL: /api/accommodations/{id}/
     """
 
-    # 조회할 데이터 쿼리셋 지정 (관련 데이터 미리 로드)
-    queryset = Accommodation.objects.prefetch_related(
-        'images',
-        'votes__user',  # 투표한 사용자 정보도 함께 로드
-    )
-
     # 기본 serializer 지정
     serializer_class = AccommodationSerializer
 
@@ -95,6 +194,10 @@ class AccommodationDetailView(generics.RetrieveUpdateDestroyAPIView):
             return AccommodationUpdateSerializer  # 숙소 수정 시
         return AccommodationSerializer  # 숙소 조회 시
 
+    # 조회할 데이터 쿼리셋 생성 (평점 정보 추가, 요청한 필드만 조회)
+    def get_queryset(self):
+        return get_accommodation_queryset(self.get_field_serializer())
+
     # DELETE 요청 처리 (숙소 삭제)
     def perform_destroy(self, instance):
         """
@@ -109,10 +212,11 @@ class AccommodationDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 
 # 숙소 이미지 업로드를 위한 API View
+@method_decorator(idempotent, name='post')
 class AccommodationImageUploadView(generics.CreateAPIView):
     """
-    POST: 숙소 이미지 업로드 (관리자 전용)
-    URL: /api/accommodations/{accommodation_id}/images/
+    POST: 숙소 이미지 업로드 (관리자 전용, 파생본은 백그라운드에서 생성되며 202 응답, Idempotency-Key 헤더 지원)
+    URL: /api/accommodations/{accommodation_id}/images/upload/
     """
 
     # 사용할 serializer 지정
@@ -134,16 +238,113 @@ class AccommodationImageUploadView(generics.CreateAPIView):
         accommodation = get_object_or_404(Accommodation, id=accommodation_id)
 
         # 이미지에 숙소 정보 연결하여 저장
-        serializer.save(accommodation=accommodation)
+        image = serializer.save(accommodation=accommodation)
+
+        # 크기별 파생본(thumb, card, full) 생성은 백그라운드에서 처리 (요청은 바로 응답)
+        enqueue_image_processing([image.id])
 
         # 로그에 이미지 업로드 기록
         print(f"이미지 업로드: {accommodation.name}")
 
+    # POST 요청 처리 (오버라이드)
+    def create(self, request, *args, **kwargs):
+        """
+        이미지를 저장하고 파생본 처리를 예약한 뒤 202 Accepted로 바로 응답
+        응답의 status 필드(pending -> ready)로 처리 상태 확인 가능
+        (GET /api/accommodations/{accommodation_id}/images/ 로 다시 조회)
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+
+        # 처리 대기 중인 이미지 정보를 조회용 serializer로 반환
+        data = AccommodationImageSerializer(serializer.instance, context=self.get_serializer_context()).data
+        return Response(data, status=status.HTTP_202_ACCEPTED)
+
+
+# 숙소 이미지 일괄 업로드를 위한 API View
+@method_decorator(idempotent, name='post')
+class AccommodationImageBulkUploadView(generics.GenericAPIView):
+    """
+    POST: 숙소 이미지 여러 장을 한 번에 업로드 (관리자 전용, 파생본은 백그라운드에서 생성되며 202 응답, Idempotency-Key 헤더 지원)
+    URL: /api/accommodations/{accommodation_id}/images/bulk-upload/
+
+    Request (multipart/form-data):
+        images: 이미지 파일 (같은 이름으로 여러 개)
+        alt_text: 이미지 설명 (선택사항, images와 같은 순서로 여러 개)
+    """
+
+    # 사용할 serializer 지정
+    serializer_class = AccommodationImageBulkUploadSerializer
+
+    # 파일 업로드를 위한 파서 지정
+    parser_classes = [MultiPartParser]
+
+    # DRF Request를 만들기 전에 업로드 핸들러 지정 (오버라이드)
+    def initialize_request(self, request, *args, **kwargs):
+        """
+        각 파일 파트를 메모리에 모으지 않고 바로 임시 파일로 기록
+        세션 인증의 CSRF 검사가 post()보다 먼저 본문을 파싱하므로 원래 HttpRequest에 미리 설정해야 함
+        """
+        if request.method == 'POST':
+            request.upload_handlers = [TemporaryFileUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
+
+    # POST 요청 처리 (이미지 일괄 업로드)
+    def post(self, request, *args, **kwargs):
+        # 해당 숙소가 존재하는지 확인 (한 번만 조회)
+        accommodation = get_object_or_404(Accommodation, id=self.kwargs.get('accommodation_id'))
+
+        # 모든 파일을 한 번에 검사 (하나라도 잘못되면 400 응답, 아무것도 저장하지 않음)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        image_files = serializer.validated_data['images']
+        alt_texts = serializer.validated_data['alt_texts']
+
+        with transaction.atomic():
+            # 기존 이미지 뒤에 이어지도록 순서 자동 지정
+            next_order = accommodation.images.aggregate(max_order=Max('order'))['max_order']
+            next_order = 0 if next_order is None else next_order + 1
+
+            images = [
+                AccommodationImage(
+                    accommodation=accommodation,
+                    image=image_file,
+                    alt_text=alt_texts[index] if index < len(alt_texts) else '',
+                    order=next_order + index,
+                )
+                for index, image_file in enumerate(image_files)
+            ]
+
+            # bulk_create는 save()를 거치지 않으므로 내용 해시를 직접 계산
+            for image in images:
+                image.prepare_content_hash()
+
+            # 모든 이미지를 INSERT 한 번으로 저장 (파일은 저장소에 기록된 뒤 경로만 저장됨)
+            images = AccommodationImage.objects.bulk_create(images)
+
+            # bulk_create는 시그널을 보내지 않으므로 테이블 버전을 직접 올림
+            bump_table_versions('accommodation_images')
+
+            # 크기별 파생본 생성은 백그라운드에서 처리
+            enqueue_image_processing(image.id for image in images)
+
+        # 로그에 이미지 업로드 기록
+        print(f"이미지 일괄 업로드: {accommodation.name} ({len(images)}장)")
+
+        # 처리 대기 중인 이미지 정보 응답
+        data = AccommodationImageSerializer(images, many=True, context=self.get_serializer_context()).data
+        return Response({
+            'images': data,
+            'count': len(images),
+            'message': f'{len(images)}장의 이미지를 업로드했습니다.'
+        }, status=status.HTTP_202_ACCEPTED)
+
 
 # 숙소 이미지 목록 조회 및 개별 이미지 삭제를 위한 API View
-class AccommodationImageListView(generics.ListAPIView):
+class AccommodationImageListView(RequestedFieldsMixin, generics.ListAPIView):
     """
-    GET: 특정 숙소의 이미지 목록 조회
+    GET: 특정 숙소의 이미지 목록 조회 (?fields= 지원)
     URL: /api/accommodations/{accommodation_id}/images/
     """
 
@@ -156,10 +357,16 @@ class AccommodationImageListView(generics.ListAPIView):
         URL 파라미터의 숙소 ID에 해당하는 이미지들만 반환
         """
         accommodation_id = self.kwargs.get('accommodation_id')
-        return AccommodationImage.objects.filter(
+        queryset = AccommodationImage.objects.filter(
             accommodation_id=accommodation_id
         ).order_by('order', 'created_at')  # 순서, 생성일 기준 정렬
 
+        # 필드를 선택한 경우 해당 컬럼만 조회
+        serializer = self.get_field_serializer()
+        if serializer is not None:
+            queryset = queryset.only(*serializer.get_model_field_names())
+        return queryset
+
 
 # 개별 이미지 삭제를 위한 API View
 class AccommodationImageDetailView(generics.DestroyAPIView):
@@ -186,6 +393,8 @@ class AccommodationImageDetailView(generics.DestroyAPIView):
 
 # 숙소 통계 정보를 위한 함수형 API View
 @api_view(['GET'])
+@conditional_on_tables('accommodations', 'votes')
+@cache_response_on_tables('accommodations', 'votes')
 def accommodation_stats(request):
     """
     숙소 통계 정보 조회
@@ -212,14 +421,9 @@ def accommodation_stats(request):
         min_price=Min('price'),  # models.Min -> Min
         max_price=Max('price')  # models.Max -> Max
     )
-    # 투표 통계 계산
-    from votes.models import Vote
-    total_votes = Vote.objects.count()
-
-    # 전체 평균 평점 계산
-    average_rating = Vote.objects.aggregate(
-        avg_rating=Avg('rating')
-    )['avg_rating'] or 0
+    # 투표 수와 전체 평균 평점 계산 (평점 분포 요약 사용)
+    from votes.summary import get_rating_histogram, summarize_histogram
+    total_votes, average_rating = summarize_histogram(get_rating_histogram())
 
     # 통계 정보 응답
     return Response({
@@ -233,11 +437,141 @@ def accommodation_stats(request):
     }, status=status.HTTP_200_OK)
 
 
+# 편의시설별 숙소 수(패싯)를 위한 함수형 API View
+@api_view(['GET'])
+@conditional_on_tables('accommodations')
+@cache_response_on_tables('accommodations')
+def amenity_facets(request):
+    """
+    편의시설별 숙소 수 조회 (목록 API와 같은 ?q=, ?amenities= 필터 적용 가능)
+    GET: 조건에 맞는 숙소 수와 편의시설마다 그 편의시설을 갖춘 숙소 수
+    URL: /api/accommodations/amenities/
+
+    Response:
+    {
+        "total": 조건에_맞는_숙소_수,
+        "amenities": {"wifi": 숙소_수, "parking": 숙소_수, ...}
+    }
+    """
+
+    # 필터 값 확인
+    _, _, error = parse_amenity_filter(request.query_params)
+    if error:
+        return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+
+    # 비트마스크 컬럼으로 모든 편의시설을 한 번에 집계
+    total, facets = filter_accommodations(Accommodation.objects.all(), request.query_params).amenity_facets()
+
+    # 편의시설 집계 응답
+    return Response({
+        'total': total,
+        'amenities': facets,
+        'message': '편의시설별 숙소 수입니다.'
+    }, status=status.HTTP_200_OK)
+
+
+# 가격 분포 구간 수 기본값과 최대값
+PRICE_HISTOGRAM_DEFAULT_BUCKETS = 10
+PRICE_HISTOGRAM_MAX_BUCKETS = 50
+
+
+# 가격 분포(히스토그램)를 위한 함수형 API View
+@api_view(['GET'])
+@conditional_on_tables('accommodations')
+@cache_response_on_tables('accommodations')
+def price_histogram(request):
+    """
+    숙소 1박 가격 분포 조회 (목록 API와 같은 ?min_price=, ?max_price=, ?q=, ?amenities= 필터 적용 가능)
+    GET: 최저~최고 가격을 같은 폭의 구간으로 나눈 구간별 숙소 수
+    URL: /api/accommodations/price-histogram/?buckets=10
+
+    최저/최고 가격을 구하는 집계 1회(price 인덱스)와
+    구간 번호((가격 - 최저가) / 구간 폭)로 GROUP BY 하는 집계 1회로 계산 (숙소 행을 가져오지 않음)
+
+    Response:
+    {
+        "bucket_size": 구간_폭,
+        "total": 조건에_맞는_숙소_수,
+        "buckets": [{"min_price": 구간_시작, "max_price": 구간_끝, "count": 숙소_수}, ...]
+    }
+    """
+
+    # 구간 수 확인
+    try:
+        buckets = int(request.query_params.get('buckets') or PRICE_HISTOGRAM_DEFAULT_BUCKETS)
+    except ValueError:
+        return Response({
+            'error': 'buckets는 숫자여야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    if not 1 <= buckets <= PRICE_HISTOGRAM_MAX_BUCKETS:
+        return Response({
+            'error': f'buckets는 1 이상 {PRICE_HISTOGRAM_MAX_BUCKETS} 이하여야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    # 필터 값 확인
+    _, _, error = parse_amenity_filter(request.query_params)
+    if error:
+        return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+
+    price_filter = AccommodationFilter(request.query_params, queryset=Accommodation.objects.all())
+    if not price_filter.is_valid():
+        return Response({
+            'error': '가격 필터 값이 올바르지 않습니다.',
+            'details': price_filter.errors
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    accommodations = filter_accommodations(price_filter.qs, request.query_params).order_by()
+
+    # 가격 범위 계산
+    price_range = accommodations.aggregate(min_price=Min('price'), max_price=Max('price'))
+    low, high = price_range['min_price'], price_range['max_price']
+    if low is None:
+        return Response({
+            'bucket_size': 0,
+            'total': 0,
+            'buckets': [],
+            'message': '조건에 맞는 숙소가 없습니다.'
+        }, status=status.HTTP_200_OK)
+
+    # 구간 폭 (올림 나눗셈, 최고가도 마지막 구간에 포함되도록)
+    bucket_size = -(-(high - low + 1) // buckets)
+
+    # 구간 번호별 숙소 수 (정수 나눗셈)
+    counts = dict(
+        accommodations.annotate(
+            bucket=(F('price') - Value(low)) / Value(bucket_size)
+        ).values('bucket').annotate(count=Count('id')).values_list('bucket', 'count')
+    )
+
+    # 빈 구간을 포함한 결과 데이터 생성
+    result = []
+    for index in range(buckets):
+        start = low + index * bucket_size
+        if start > high:
+            break
+        result.append({
+            'min_price': start,
+            'max_price': start + bucket_size - 1,
+            'count': counts.get(index, 0),
+        })
+
+    # 가격 분포 응답
+    return Response({
+        'bucket_size': bucket_size,
+        'total': sum(counts.values()),
+        'buckets': result,
+        'message': f'{len(result)}개 가격 구간의 숙소 수입니다.'
+    }, status=status.HTTP_200_OK)
+
+
 # 인기 숙소 목록을 위한 함수형 API View
 @api_view(['GET'])
+@conditional_on_tables('accommodations', 'votes')
+@cache_response_on_tables('accommodations', 'votes')
 def popular_accommodations(request):
     """
-    인기 숙소 목록 조회 (평점 및 투표 수 기준)
+    인기 숙소 목록 조회 (베이지안 평균 점수 및 투표 수 기준)
     GET: 상위 5개 인기 숙소 정보
     URL: /api/accommodations/popular/
 
@@ -252,13 +586,13 @@ def popular_accommodations(request):
     ]
     """
 
-    # 투표 수와 평균 평점을 기준으로 인기 숙소 선정
-    popular_accommodations = Accommodation.objects.annotate(
-        vote_count=Count('votes'),
-        avg_rating=Avg('votes__rating')
+    # 베이지안 평균 점수를 기준으로 인기 숙소 선정 (투표 1개짜리 10점이 1위가 되는 것을 방지)
+    prior_mean, prior_weight = Accommodation.objects.rating_prior()
+    popular_accommodations = Accommodation.objects.with_stats(prefetch_images=False).with_score(
+        'bayesian', prior_mean=prior_mean, prior_weight=prior_weight
     ).filter(
         vote_count__gt=0  # 투표가 있는 숙소만
-    ).order_by('-avg_rating', '-vote_count')[:5]  # 평점 순, 투표 수 순으로 상위 5개
+    ).order_by('-score', '-vote_count')[:5]  # 점수 순, 투표 수 순으로 상위 5개
 
     # 결과 데이터 생성
     result = []
@@ -276,4 +610,139 @@ def popular_accommodations(request):
     return Response({
         'popular_accommodations': result,
         'message': f'상위 {len(result)}개 인기 숙소입니다.'
-    }, status=status.HTTP_200_OK)
\ No newline at end of file
+    }, status=status.HTTP_200_OK)
+
+
+# 랭킹 요청의 쿼리 파라미터를 확인하는 함수 (동기/비동기 랭킹 View 공용)
+def parse_ranking_params(query_params):
+    """
+    반환값: (method, limit, offset, prior_weight, 오류 메시지 또는 None)
+    """
+    method = query_params.get('method', 'bayesian')
+    if method not in RANKING_METHODS:
+        return method, None, 0, None, f'지원되지 않는 랭킹 방식입니다. 허용 방식: {list(RANKING_METHODS)}'
+
+    try:
+        limit = query_params.get('limit')
+        limit = int(limit) if limit not in (None, '') else None
+        offset = int(query_params.get('offset') or 0)
+        prior_weight = query_params.get('prior_weight')
+        prior_weight = float(prior_weight) if prior_weight not in (None, '') else None
+    except ValueError:
+        return method, None, 0, None, 'limit, offset, prior_weight는 숫자여야 합니다.'
+
+    if (limit is not None and limit < 0) or offset < 0 or (prior_weight is not None and prior_weight < 0):
+        return method, limit, offset, prior_weight, 'limit, offset, prior_weight는 0 이상이어야 합니다.'
+
+    return method, limit, offset, prior_weight, None
+
+
+# 랭킹 페이지를 조회하는 쿼리셋을 만드는 함수
+def get_ranking_queryset(method, prior_mean, prior_weight, limit, offset):
+    ranking = Accommodation.objects.ranked(
+        method, prior_mean=prior_mean, prior_weight=prior_weight
+    ).values('id', 'name', 'vote_count', 'rating_sum', 'score', 'rank', 'tie_group', 'total')
+
+    end = offset + limit if limit is not None else None
+    return ranking[offset:end]
+
+
+# 랭킹 응답 데이터를 만드는 함수
+def build_ranking_response(method, prior_mean, prior_weight, count, limit, offset, rows):
+    # 결과 데이터 생성
+    results = []
+    for row in rows:
+        results.append({
+            'id': row['id'],
+            'name': row['name'],
+            'score': round(row['score'], 3),
+            'average_rating': round(row['rating_sum'] / row['vote_count'], 1) if row['vote_count'] else 0,
+            'vote_count': row['vote_count'],
+            'rank': row['rank'],
+            'tie_group': row['tie_group'],
+        })
+
+    return {
+        'method': method,
+        'prior': {
+            'mean': round(prior_mean, 3),
+            'weight': round(prior_weight, 3),
+        },
+        'count': count,
+        'limit': limit,
+        'offset': offset,
+        'results': results,
+        'message': f'{method} 방식 숙소 랭킹입니다.'
+    }
+
+
+# 숙소 랭킹을 위한 함수형 API View
+@api_view(['GET'])
+def accommodation_ranking(request):
+    """
+    숙소 랭킹 조회 (점수, 순위, 동점 그룹을 모두 DB에서 계산)
+    GET: 점수 순으로 정렬된 숙소 랭킹
+    URL: /api/accommodations/ranking/
+
+    Query Parameters:
+        method: 점수 계산 방식 (mean, bayesian, wilson / 기본값 bayesian)
+        prior_weight: 베이지안 평균에서 전체 평균을 몇 표만큼 반영할지 (기본값: 숙소당 평균 투표 수)
+        limit: 최대 반환 개수 (기본값: 전체)
+        offset: 건너뛸 개수 (기본값: 0)
+
+    Response:
+    {
+        "method": "bayesian",
+        "prior": {"mean": 전체_평균_평점, "weight": 반영_투표_수},
+        "count": 전체_숙소_수,
+        "results": [
+            {"id": 숙소ID, "name": "숙소명", "score": 점수, "average_rating": 평균평점,
+             "vote_count": 투표수, "rank": 순위, "tie_group": 동점_그룹}
+        ]
+    }
+    """
+
+    # 점수 계산 방식, 페이지 범위, prior 가중치 확인
+    method, limit, offset, prior_weight, error = parse_ranking_params(request.query_params)
+    if error:
+        return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+
+    # 전체 평균 평점과 기본 prior 가중치 계산 (집계 쿼리 1회)
+    prior_mean, default_prior_weight = Accommodation.objects.rating_prior()
+    if prior_weight is None:
+        prior_weight = default_prior_weight
+
+    # 점수/순위/동점 그룹을 계산하고 필요한 컬럼만 조회 (랭킹 쿼리 1회)
+    rows = list(get_ranking_queryset(method, prior_mean, prior_weight, limit, offset))
+
+    # 전체 숙소 수 (현재 페이지가 비어 있으면 별도로 계산)
+    count = rows[0]['total'] if rows else Accommodation.objects.count()
+
+    # 랭킹 응답
+    return Response(
+        build_ranking_response(method, prior_mean, prior_weight, count, limit, offset, rows),
+        status=status.HTTP_200_OK,
+    )
+
+
+# 숙소 내보내기에 포함하는 컬럼
+ACCOMMODATION_EXPORT_FIELDS = (
+    'id', 'name', 'location', 'price', 'description', 'check_in', 'check_out', 'amenities',
+    'vote_count', 'rating_sum', 'created_at', 'updated_at',
+)
+
+
+# 전체 숙소를 CSV / NDJSON으로 내보내는 View
+@require_GET
+def accommodation_export(request):
+    """
+    전체 숙소를 ID 순으로 스트리밍 (이미지 제외, 투표 수/평점 합계는 집계 컬럼 값)
+    GET: ?format=csv (기본값) 또는 ?format=ndjson
+    URL: /api/accommodations/export/
+
+    DRF의 ?format= 렌더러 선택과 겹치지 않도록 DRF를 거치지 않는 Django View로 작성
+    CSV의 amenities는 | 로 이어 붙인 문자열
+    """
+    return export_response(
+        request, Accommodation.objects.order_by('id'), ACCOMMODATION_EXPORT_FIELDS, 'accommodations'
+    )
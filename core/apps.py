@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # 모델 저장/삭제 시 테이블 버전(조건부 GET용)을 올리는 시그널 핸들러 등록
+        from .signals import connect_version_signals
+        connect_version_signals()
@@ -0,0 +1,96 @@
+# ASGI 서버에서 조회 API를 비동기 View로 처리할 때 공통으로 사용하는 모듈
+from functools import wraps
+
+# Django 설정과 HTTP 응답 클래스를 가져옴
+from django.conf import settings
+from django.http import HttpResponse
+
+# 동기 View를 비동기 View 안에서 호출하기 위한 함수
+from asgiref.sync import sync_to_async
+
+# DRF와 같은 JSON 형식으로 응답하기 위한 렌더러와 페이지 URL 함수
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+# DRF Response와 같은 JSON 본문으로 응답을 만드는 함수
+def json_response(data, status=200):
+    """
+    DRF의 Response/렌더러는 동기 View 흐름(APIView.finalize_response) 안에서만 동작하므로
+    비동기 View는 JSONRenderer로 직접 렌더링 (응답 본문은 DRF View와 같음)
+    data: 응답 캐시(cache_response_on_tables)가 저장할 수 있도록 response.data에도 보관
+    """
+    renderer = JSONRenderer()
+    response = HttpResponse(renderer.render(data), status=status, content_type=renderer.media_type)
+    response.data = data
+    return response
+
+
+# 조회 요청 일부만 비동기로 처리하고 나머지는 기존 동기 View에 넘기는 데코레이터
+def async_read_view(sync_view, params=()):
+    """
+    sync_view: 같은 URL의 기존 DRF View (as_view() 또는 @api_view 함수)
+    params: 비동기 View가 처리하는 쿼리 파라미터 목록
+
+    - GET 요청이고 params 외의 쿼리 파라미터가 없으면 비동기 View가 처리
+    - 비동기 View가 None을 반환하면 (잘못된 값 등) 동기 View가 처리해 오류 응답 형식을 그대로 유지
+    - POST/PUT/DELETE, ?fields= / ?cursor= 같은 나머지 요청은 동기 View가 처리
+    """
+    run_sync_view = sync_to_async(sync_view)
+
+    def decorator(view_func):
+        @wraps(view_func)
+        async def inner(request, *args, **kwargs):
+            if request.method == 'GET' and set(request.GET) <= set(params):
+                response = await view_func(request, *args, **kwargs)
+                if response is not None:
+                    return response
+            return await run_sync_view(request, *args, **kwargs)
+
+        # DRF View처럼 세션 CSRF 검사를 하지 않음 (쓰기 요청은 동기 View로 넘어감)
+        inner.csrf_exempt = True
+        return inner
+
+    return decorator
+
+
+# 페이지 번호 방식(?page=)으로 쿼리셋을 잘라 조회하는 함수 (DRF PageNumberPagination과 같은 응답)
+async def paginate_page_number(request, queryset, page_size=None):
+    """
+    반환값: (현재 페이지 객체 목록, {'count', 'next', 'previous'})
+            페이지 번호가 잘못되었거나 범위를 벗어나면 None (동기 View가 404 응답)
+    COUNT 1회 + 페이지 조회 1회 (미리 로드하는 관계가 있으면 그만큼 추가)
+    """
+    page_size = page_size or settings.REST_FRAMEWORK['PAGE_SIZE']
+    page = request.GET.get('page', '1')
+    if not page.isdigit() or int(page) < 1:
+        return None
+    page = int(page)
+
+    count = await queryset.acount()
+    page_count = max(1, -(-count // page_size))
+    if page > page_count:
+        return None
+
+    start = (page - 1) * page_size
+    objects = [obj async for obj in queryset[start:start + page_size]]
+
+    url = request.build_absolute_uri()
+    next_url = replace_query_param(url, 'page', page + 1) if page < page_count else None
+    if page == 1:
+        previous_url = None
+    elif page == 2:
+        previous_url = remove_query_param(url, 'page')
+    else:
+        previous_url = replace_query_param(url, 'page', page - 1)
+
+    return objects, {'count': count, 'next': next_url, 'previous': previous_url}
+
+
+# urls.py에서 설정(ASYNC_VIEWS)에 따라 비동기/동기 View를 고르는 함수
+def select_view(async_view, sync_view):
+    """
+    ASGI 서버(uvicorn)에서는 비동기 View, WSGI 서버(gunicorn 동기 워커)에서는 기존 동기 View 사용
+    (WSGI에서 비동기 View를 쓰면 요청마다 이벤트 루프를 만들어 오히려 느려짐)
+    """
+    return async_view if settings.ASYNC_VIEWS else sync_view
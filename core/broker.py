@@ -0,0 +1,196 @@
+# 실시간 이벤트(Server-Sent Events)를 구독자에게 나눠 주는 발행/구독(pub/sub) 모듈
+import asyncio
+import json
+import threading
+
+# Django 설정과 캐시를 가져옴
+from django.conf import settings
+from django.core.cache import cache
+
+# 동기 함수를 이벤트 루프를 막지 않고 실행하기 위한 함수
+from asgiref.sync import sync_to_async
+
+
+# 구독자 한 명의 대기열 크기 (넘치면 쌓인 이벤트를 버리고 전체 스냅샷을 다시 받도록 함)
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# 대기열이 넘쳤을 때 보내는 이벤트 종류
+RESYNC_EVENT = 'resync'
+
+
+# 구독자 한 명을 나타내는 클래스
+class Subscription:
+    """
+    구독한 이벤트 루프의 asyncio.Queue로 이벤트를 받음 (연결마다 스레드를 쓰지 않음)
+    발행은 다른 스레드(동기 뷰, 커밋 후 콜백)에서 일어나므로 call_soon_threadsafe로 전달
+    """
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    # 이벤트를 대기열에 넣는 메서드 (이벤트 루프 스레드에서 실행)
+    def push(self, event):
+        if self.queue.full():
+            # 느린 구독자: 쌓인 이벤트 대신 전체 스냅샷을 다시 받도록 함
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = {'event': RESYNC_EVENT, 'data': {}}
+        self.queue.put_nowait(event)
+
+    # 다른 스레드에서 이벤트를 전달하는 메서드
+    def push_threadsafe(self, event):
+        try:
+            self.loop.call_soon_threadsafe(self.push, event)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힌 구독자
+            pass
+
+    # 다음 이벤트를 기다리는 메서드 (timeout초 동안 없으면 None)
+    async def get(self, timeout=None):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+# 같은 프로세스 안의 구독자에게만 이벤트를 전달하는 브로커 (워커 1개일 때)
+class InProcessBroker:
+
+    def __init__(self):
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+
+    # 채널을 구독하는 메서드 (이벤트 루프 안에서 호출)
+    def subscribe(self, channel):
+        subscription = Subscription(channel)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    # 구독을 해지하는 메서드
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    # 현재 구독자 수를 반환하는 메서드
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscriptions)
+
+    # 이 프로세스의 구독자에게 이벤트를 전달하는 메서드
+    def deliver(self, channel, event):
+        with self._lock:
+            subscriptions = [s for s in self._subscriptions if s.channel == channel]
+        for subscription in subscriptions:
+            subscription.push_threadsafe(event)
+
+    # 이벤트를 발행하는 메서드 (어느 스레드에서든 호출 가능)
+    def publish(self, channel, event, data):
+        self.deliver(channel, {'event': event, 'data': data})
+
+
+# 공유 캐시(파일/DB 캐시)를 거쳐 여러 워커 프로세스에 이벤트를 전달하는 브로커
+class CacheBroker(InProcessBroker):
+    """
+    Redis 같은 별도 메시지 서버 없이 같은 서버의 여러 워커가 이벤트를 나누기 위한 대용 브로커
+    - 발행: 캐시의 순번을 올리고 '채널:순번' 키에 이벤트를 저장 (EVENT_TTL초 후 만료)
+    - 구독: 프로세스마다 폴링 작업 하나만 순번을 확인하고, 새 이벤트를 그 프로세스의 구독자들에게 전달
+      (구독자 수와 관계없이 프로세스당 LIVE_EVENTS_POLL_INTERVAL마다 캐시 조회 1회)
+    locmem 캐시는 프로세스끼리 공유되지 않으므로 CACHE_BACKEND=file 또는 db와 함께 사용
+    """
+
+    # 저장된 이벤트 유지 시간(초)
+    EVENT_TTL = 60
+
+    def __init__(self):
+        super().__init__()
+        self._pollers = {}
+
+    # 순번 캐시 키
+    @staticmethod
+    def sequence_key(channel):
+        return f'live:{channel}:seq'
+
+    # 이벤트 캐시 키
+    @staticmethod
+    def event_key(channel, sequence):
+        return f'live:{channel}:{sequence}'
+
+    # 채널을 구독하는 메서드 (오버라이드, 이벤트 루프마다 폴링 작업 시작)
+    def subscribe(self, channel):
+        subscription = super().subscribe(channel)
+        key = (id(subscription.loop), channel)
+        with self._lock:
+            poller = self._pollers.get(key)
+            if poller is None or poller.done():
+                self._pollers[key] = subscription.loop.create_task(self._poll(channel))
+        return subscription
+
+    # 이벤트를 발행하는 메서드 (오버라이드)
+    def publish(self, channel, event, data):
+        cache.add(self.sequence_key(channel), 0, None)
+        sequence = cache.incr(self.sequence_key(channel))
+        cache.set(self.event_key(channel, sequence), {'event': event, 'data': data}, self.EVENT_TTL)
+
+    # 캐시의 새 이벤트를 확인해 이 프로세스의 구독자에게 전달하는 작업
+    async def _poll(self, channel):
+        get = sync_to_async(cache.get, thread_sensitive=False)
+        get_many = sync_to_async(cache.get_many, thread_sensitive=False)
+
+        last = await get(self.sequence_key(channel)) or 0
+        while self.subscriber_count():
+            await asyncio.sleep(settings.LIVE_EVENTS_POLL_INTERVAL)
+            current = await get(self.sequence_key(channel)) or 0
+            if current <= last:
+                continue
+            keys = [self.event_key(channel, sequence) for sequence in range(last + 1, current + 1)]
+            events = await get_many(keys)
+            for key in keys:
+                if key in events:
+                    self.deliver(channel, events[key])
+            last = current
+
+
+# 설정값별 브로커 클래스
+BROKER_CLASSES = {
+    'inprocess': InProcessBroker,
+    'cache': CacheBroker,
+}
+
+# 프로세스에서 공유하는 브로커 인스턴스
+_broker = None
+_broker_lock = threading.Lock()
+
+
+# 설정(LIVE_EVENTS_BROKER)에 맞는 브로커를 반환하는 함수
+def get_broker():
+    global _broker
+    with _broker_lock:
+        if _broker is None or not isinstance(_broker, BROKER_CLASSES[settings.LIVE_EVENTS_BROKER]):
+            _broker = BROKER_CLASSES[settings.LIVE_EVENTS_BROKER]()
+        return _broker
+
+
+# 이벤트를 발행하는 함수
+def publish(channel, event, data):
+    get_broker().publish(channel, event, data)
+
+
+# Server-Sent Events 형식의 메시지를 만드는 함수
+def format_sse(event=None, data=None, comment=None, retry=None):
+    """
+    예: format_sse('ranking', {...}) -> 'event: ranking\\ndata: {...}\\n\\n'
+    comment만 보내면 연결 유지용 주석 줄 (': keepalive')
+    """
+    lines = []
+    if comment is not None:
+        lines.append(f': {comment}')
+    if retry is not None:
+        lines.append(f'retry: {retry}')
+    if event is not None:
+        lines.append(f'event: {event}')
+    if data is not None:
+        lines.append(f'data: {json.dumps(data, ensure_ascii=False, separators=(",", ":"))}')
+    return '\n'.join(lines) + '\n\n'
@@ -0,0 +1,202 @@
+# 통계/인기 숙소처럼 집계 비용이 큰 API 응답을 캐시하는 모듈
+import asyncio
+import hashlib
+import time
+from functools import wraps
+
+# Django 설정 및 캐시 프레임워크를 가져옴
+from django.conf import settings
+from django.core.cache import cache
+
+# Django REST Framework 응답 클래스를 가져옴
+from rest_framework.response import Response
+
+# 테이블 버전 함수를 가져옴
+from .versions import aget_request_table_validators, get_request_table_validators
+
+
+# 다른 요청이 값을 계산하는 동안 기다릴 때 캐시를 다시 확인하는 간격(초)
+LOCK_POLL_INTERVAL = 0.05
+
+
+# 캐시에 값이 없을 때 한 번만 계산해 저장하는 함수 (캐시 스탬피드 방지)
+def get_or_compute(key, compute, timeout=None):
+    """
+    동시에 여러 요청이 캐시를 놓쳐도 잠금(cache.add)을 얻은 요청 하나만 compute()를 실행
+    나머지 요청은 값이 저장될 때까지 기다렸다가 그 값을 사용
+    (잠금을 얻은 요청의 계산이 실패해 값 없이 잠금이 풀리거나, 잠금 시간이 지나도 값이 없으면 직접 계산)
+    key: 캐시 키
+    compute: 값을 계산하는 함수 (None이 아닌 값을 반환해야 함)
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock_timeout = settings.RESPONSE_CACHE_LOCK_TIMEOUT
+    lock_key = f'{key}:lock'
+
+    # 잠금을 얻은 요청이 계산해서 저장
+    if cache.add(lock_key, 1, lock_timeout):
+        try:
+            value = compute()
+            if value is not None:
+                cache.set(key, value, timeout)
+        finally:
+            cache.delete(lock_key)
+        return value
+
+    # 다른 요청이 계산 중이면 값이 저장될 때까지 대기
+    # (잠금이 풀렸는데 값이 없으면 계산이 실패했거나 None을 반환한 것이므로 더 기다리지 않음)
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        value = cache.get(key)
+        if value is not None:
+            return value
+        if cache.get(lock_key) is None:
+            break
+
+    # 잠금이 풀린 직후 저장된 값이 있으면 사용하고, 없으면 직접 계산
+    value = cache.get(key)
+    if value is not None:
+        return value
+    return compute()
+
+
+# get_or_compute()의 비동기 버전 (compute: 값을 계산하는 코루틴 함수)
+async def aget_or_compute(key, compute, timeout=None):
+    value = await cache.aget(key)
+    if value is not None:
+        return value
+
+    lock_timeout = settings.RESPONSE_CACHE_LOCK_TIMEOUT
+    lock_key = f'{key}:lock'
+
+    if await cache.aadd(lock_key, 1, lock_timeout):
+        try:
+            value = await compute()
+            if value is not None:
+                await cache.aset(key, value, timeout)
+        finally:
+            await cache.adelete(lock_key)
+        return value
+
+    # 기다리는 동안 스레드를 차지하지 않음 (잠금이 풀렸는데 값이 없으면 더 기다리지 않음)
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+        value = await cache.aget(key)
+        if value is not None:
+            return value
+        if await cache.aget(lock_key) is None:
+            break
+
+    value = await cache.aget(key)
+    if value is not None:
+        return value
+    return await compute()
+
+
+# 기본 키 집합을 캐시하는 테이블 (행 수가 적고 존재 여부 확인이 잦은 테이블만)
+CACHED_ID_TABLES = ('users', 'accommodations')
+
+
+# 기본 키 집합의 캐시 키를 만드는 함수
+def id_set_cache_key(table):
+    return f'ids:{table}'
+
+
+# 작은 테이블의 기본 키 집합을 캐시에서 가져오는 함수
+def get_cached_ids(model):
+    """
+    사용자/숙소처럼 행 수가 적은 테이블의 ID 집합 (존재 여부 확인을 쿼리 없이 처리)
+    테이블 버전이 오를 때(bump_table_versions) 캐시를 지우므로 같은 캐시를 쓰는 요청에는 바로 반영되고,
+    워커별 로컬 메모리 캐시라면 다른 워커에서는 ID_SET_CACHE_TIMEOUT 동안 오래된 값일 수 있음
+    (그래서 집합에 없는 ID는 호출하는 쪽에서 DB로 다시 확인하고, 삭제된 ID는 외래키 제약 조건이 막음)
+    """
+    table = model._meta.db_table
+    assert table in CACHED_ID_TABLES, f'{table} 테이블은 ID 집합 캐시 대상이 아닙니다.'
+    return get_or_compute(
+        id_set_cache_key(table),
+        lambda: frozenset(model.objects.order_by().values_list('pk', flat=True)),
+        settings.ID_SET_CACHE_TIMEOUT,
+    )
+
+
+# 기본 키 집합 캐시를 지우는 함수
+def invalidate_cached_ids(table):
+    if table in CACHED_ID_TABLES:
+        cache.delete(id_set_cache_key(table))
+
+
+# 테이블 버전을 키에 포함해 함수형 API View의 응답을 캐시하는 데코레이터
+def cache_response_on_tables(*tables, timeout=None):
+    """
+    @api_view 아래에 사용 (@conditional_on_tables와 함께 쓰면 테이블 버전 조회를 공유)
+    캐시 키에 테이블 버전이 들어가므로, 투표/사용자/숙소가 저장·삭제되어 시그널이 버전을 올리면
+    이전 캐시는 더 이상 사용되지 않음 (여러 워커가 각자 로컬 메모리 캐시를 써도 오래된 값을 내보내지 않음)
+    GET 요청의 200 응답만 캐시하며, 쿼리 파라미터가 다르면 따로 캐시
+    async def 뷰에도 사용 가능 (core.async_views.json_response로 만든 응답의 data를 캐시)
+    """
+    def decorator(view_func):
+        if asyncio.iscoroutinefunction(view_func):
+            return _async_cache_response(view_func, tables, timeout)
+
+        @wraps(view_func)
+        def inner(request, *args, **kwargs):
+            if request.method != 'GET':
+                return view_func(request, *args, **kwargs)
+
+            etag, _ = get_request_table_validators(request, tables)
+            params = hashlib.sha1(request.get_full_path().encode()).hexdigest()[:16]
+            key = f'response:{view_func.__module__}.{view_func.__name__}:{etag}:{params}'
+
+            # 실패 응답은 캐시하지 않도록 별도로 전달
+            failed = []
+
+            def compute():
+                response = view_func(request, *args, **kwargs)
+                if response.status_code != 200:
+                    failed.append(response)
+                    return None
+                return response.data
+
+            data = get_or_compute(key, compute, timeout or settings.RESPONSE_CACHE_TIMEOUT)
+            if failed:
+                return failed[0]
+            return Response(data)
+
+        return inner
+
+    return decorator
+
+
+# 비동기 뷰용 응답 캐시 (캐시 키와 규칙은 cache_response_on_tables와 같음)
+def _async_cache_response(view_func, tables, timeout):
+    from .async_views import json_response
+
+    @wraps(view_func)
+    async def inner(request, *args, **kwargs):
+        if request.method != 'GET':
+            return await view_func(request, *args, **kwargs)
+
+        etag, _ = await aget_request_table_validators(request, tables)
+        params = hashlib.sha1(request.get_full_path().encode()).hexdigest()[:16]
+        key = f'response:{view_func.__module__}.{view_func.__name__}:{etag}:{params}'
+
+        # 실패 응답이나 동기 뷰로 넘기는 경우(None)는 캐시하지 않도록 별도로 전달
+        passed = []
+
+        async def compute():
+            response = await view_func(request, *args, **kwargs)
+            if response is None or response.status_code != 200:
+                passed.append(response)
+                return None
+            return response.data
+
+        data = await aget_or_compute(key, compute, timeout or settings.RESPONSE_CACHE_TIMEOUT)
+        if passed:
+            return passed[0]
+        return json_response(data)
+
+    return inner
@@ -0,0 +1,93 @@
+# 큰 테이블을 CSV / NDJSON으로 조금씩 내보내는 공통 모듈
+import csv
+from datetime import date, datetime, time
+
+# Django 스트리밍 응답과 JSON 인코더를 가져옴
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+
+
+# 지원하는 내보내기 형식과 응답 Content-Type
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+# DB에서 한 번에 가져올 행 수 (PostgreSQL에서는 서버 측 커서로 이만큼씩 읽음)
+EXPORT_CHUNK_SIZE = 2000
+
+
+# CSV 작성기가 쓴 한 줄을 그대로 돌려주는 파일 흉내 객체
+class Echo:
+    def write(self, value):
+        return value
+
+
+# 날짜/시각 값을 API 응답과 같은 ISO 8601 문자열(tz 시간대)로 바꾸는 함수
+def format_value(value, tz):
+    if isinstance(value, datetime):
+        return value.astimezone(tz).isoformat() if timezone.is_aware(value) else value.isoformat()
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
+
+
+# CSV 칸에 넣을 값으로 바꾸는 함수 (목록은 | 로 이어 붙인 문자열)
+def format_csv_value(value, tz):
+    if isinstance(value, (list, tuple)):
+        return '|'.join(str(item) for item in value)
+    return format_value(value, tz)
+
+
+# 행 목록을 CSV 줄 단위로 만드는 제너레이터
+def iter_csv(fields, rows, tz):
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow([format_csv_value(value, tz) for value in row])
+
+
+# 행 목록을 NDJSON(한 줄에 JSON 객체 하나) 줄 단위로 만드는 제너레이터
+def iter_ndjson(fields, rows, tz):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode({field: format_value(value, tz) for field, value in zip(fields, row)}) + '\n'
+
+
+# 쿼리셋을 values_list + iterator로 읽어 형식에 맞는 줄을 만드는 함수
+def iter_export(queryset, fields, export_format, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    queryset: 내보낼 쿼리셋 (정렬을 지정해야 결과 순서가 일정함)
+    fields: 내보낼 컬럼 목록 (values_list에 그대로 전달)
+    행을 chunk_size개씩만 메모리에 올리고, CSV 머리글은 쿼리 실행 전에 바로 만들어짐
+    시간대는 처음에 한 번만 구함 (timezone.localtime()을 값마다 부르면 내보내기 시간의 절반 이상을 차지)
+    """
+    tz = timezone.get_current_timezone()
+    rows = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+    if export_format == 'csv':
+        return iter_csv(fields, rows, tz)
+    return iter_ndjson(fields, rows, tz)
+
+
+# 함수형 View에서 내보내기 응답을 만드는 함수
+def export_response(request, queryset, fields, filename):
+    """
+    GET ?format=csv|ndjson (기본값 csv)
+    StreamingHttpResponse로 첫 줄을 바로 보내고 나머지는 읽는 대로 전송 (테이블 크기와 관계없이 메모리 일정)
+    filename: 확장자를 뺀 다운로드 파일 이름
+    """
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse({
+            'error': f'지원되지 않는 형식입니다. 허용 형식: {list(EXPORT_FORMATS)}'
+        }, status=400, json_dumps_params={'ensure_ascii': False})
+
+    response = StreamingHttpResponse(
+        iter_export(queryset, fields, export_format),
+        content_type=EXPORT_FORMATS[export_format],
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{export_format}"'
+    # 프록시가 응답을 모았다가 보내지 않도록 설정
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,24 @@
+# 업로드 파일을 여러 모듈에서 공통으로 다루는 함수 모듈
+import hashlib
+
+
+# 파일 내용의 SHA-256 해시를 계산하는 함수
+def file_sha256(file):
+    """
+    파일을 청크 단위로 읽어 해시를 계산 (큰 파일도 메모리에 한 번에 올리지 않음)
+    계산한 값은 파일 객체에 기억해 같은 요청에서 다시 읽지 않음
+    (Idempotency-Key 요청 지문과 이미지 내용 해시 저장소가 같은 값을 사용)
+    file: Django File 객체 (계산 후 처음 위치로 되돌림)
+    반환값: 64자리 16진수 문자열
+    """
+    cached = getattr(file, 'sha256', None)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in file.chunks():
+        digest.update(chunk)
+    file.seek(0)
+    file.sha256 = digest.hexdigest()
+    return file.sha256
@@ -0,0 +1,134 @@
+# Idempotency-Key 헤더로 POST 요청의 재시도를 한 번만 처리하는 모듈
+import hashlib
+import json
+from datetime import timedelta
+from functools import wraps
+
+# Django 설정, 데이터베이스, 시간 관련 기능을 가져옴
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+# Django REST Framework 응답 클래스를 가져옴
+from rest_framework import status
+from rest_framework.response import Response
+
+# 현재 앱의 모델과 파일 해시 함수를 가져옴
+from .files import file_sha256
+from .models import IdempotencyRecord
+
+
+# 재시도 요청에 저장된 응답을 돌려줬음을 알리는 응답 헤더
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+
+# 같은 키로 다른 내용을 보냈는지 확인하기 위한 요청 지문을 만드는 함수
+def get_request_fingerprint(request):
+    """
+    JSON 요청은 본문 전체의 해시
+    파일 업로드(multipart)는 본문 대신 파싱한 필드 값과 파일별 필드 이름/파일 이름/크기/내용 해시를 사용
+    (boundary가 달라도 같은 업로드면 같은 지문, 크기가 같아도 내용이 다르면 다른 지문)
+    파일 내용 해시는 청크 단위로 계산하고 파일 객체에 기억해 내용 해시 저장소가 다시 계산하지 않음
+    request: DRF Request (multipart 본문은 뷰의 파서와 업로드 핸들러로 파싱됨)
+    """
+    digest = hashlib.sha256(f'{request.method}:{request.path}'.encode())
+    if not request.META.get('CONTENT_TYPE', '').startswith('multipart/'):
+        digest.update(request.body)
+        return digest.hexdigest()
+
+    for name, values in sorted(request.POST.lists()):
+        digest.update(json.dumps(['field', name, values]).encode())
+    for name, files in sorted(request.FILES.lists()):
+        for file in files:
+            digest.update(json.dumps(['file', name, file.name, file.size, file_sha256(file)]).encode())
+    return digest.hexdigest()
+
+
+# 저장된 응답을 다시 만드는 함수
+def replay_response(record):
+    return Response(record.response_body, status=record.status_code, headers={REPLAYED_HEADER: 'true'})
+
+
+# POST 요청을 Idempotency-Key 기준으로 한 번만 처리하는 데코레이터
+def idempotent(view_func):
+    """
+    @api_view 아래에 사용하거나, 클래스형 View에는 @method_decorator(idempotent, name='post')로 사용
+    - Idempotency-Key 헤더가 없으면 기존과 똑같이 동작
+    - 처음 온 키는 처리 중 행을 먼저 만든 뒤 뷰를 실행하고, 2xx 응답이면 상태 코드와 본문을 저장
+      (실패 응답이나 예외면 행을 지워 같은 키로 다시 시도할 수 있게 함)
+    - 같은 키로 다시 오면 뷰(ORM 저장, 파일 저장)를 실행하지 않고 저장된 응답을 반환
+    - 같은 키로 다른 내용을 보내면 422, 첫 요청이 아직 처리 중이면 409
+    """
+    @wraps(view_func)
+    def inner(request, *args, **kwargs):
+        key = request.META.get('HTTP_IDEMPOTENCY_KEY', '').strip()
+        if request.method != 'POST' or not key:
+            return view_func(request, *args, **kwargs)
+
+        if len(key) > 255:
+            return Response({
+                'error': 'Idempotency-Key는 255자 이하여야 합니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        path = request.path[:255]
+        fingerprint = get_request_fingerprint(request)
+        now = timezone.now()
+
+        record = IdempotencyRecord.objects.filter(key=key, path=path).first()
+
+        # 만료된 키나 처리 도중 중단된 것으로 보이는 키는 없는 것으로 취급
+        if record is not None and (
+            record.expires_at <= now
+            or (record.status_code is None
+                and record.created_at <= now - timedelta(seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT))
+        ):
+            record.delete()
+            record = None
+
+        if record is not None:
+            if record.fingerprint != fingerprint:
+                return Response({
+                    'error': '이 Idempotency-Key는 다른 요청에 이미 사용되었습니다.'
+                }, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+            if record.status_code is None:
+                return Response({
+                    'error': '같은 Idempotency-Key로 보낸 요청을 아직 처리 중입니다.'
+                }, status=status.HTTP_409_CONFLICT)
+            return replay_response(record)
+
+        # 처리 중 행을 먼저 만들어 동시에 온 같은 키의 요청은 하나만 실행되도록 함
+        try:
+            with transaction.atomic():
+                record = IdempotencyRecord.objects.create(
+                    key=key, path=path, fingerprint=fingerprint,
+                    expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL),
+                )
+        except IntegrityError:
+            return Response({
+                'error': '같은 Idempotency-Key로 보낸 요청을 아직 처리 중입니다.'
+            }, status=status.HTTP_409_CONFLICT)
+
+        try:
+            response = view_func(request, *args, **kwargs)
+        except Exception:
+            record.delete()
+            raise
+
+        if status.is_success(response.status_code):
+            IdempotencyRecord.objects.filter(pk=record.pk).update(
+                status_code=response.status_code, response_body=response.data
+            )
+        else:
+            record.delete()
+        return response
+
+    return inner
+
+
+# 만료된 키를 삭제하는 함수
+def purge_expired_idempotency_records():
+    """
+    반환값: 삭제된 행 수
+    """
+    deleted, _ = IdempotencyRecord.objects.filter(expires_at__lte=timezone.now()).delete()
+    return deleted
@@ -0,0 +1,124 @@
+# 실행 중인 서버의 조회 API 처리량과 응답 시간을 측정하는 관리 명령어
+import http.client
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# Django 관리 명령어 기본 클래스를 가져옴
+from django.core.management.base import BaseCommand, CommandError
+
+
+# 기본으로 측정하는 조회 API 경로 (ASYNC_VIEWS로 비동기 처리되는 경로)
+DEFAULT_PATHS = (
+    '/api/accommodations/',
+    '/api/accommodations/ranking/',
+    '/api/accommodations/stats/',
+    '/api/votes/stats/',
+)
+
+
+# WSGI(gunicorn)와 ASGI(uvicorn) 배포의 조회 API 성능을 비교하는 관리 명령어
+class Command(BaseCommand):
+    """
+    사용법 (같은 DB로 두 서버를 띄운 뒤 각각 측정):
+    gunicorn travel_vote_backend.wsgi -w 2 -b 127.0.0.1:8001
+    ASYNC_VIEWS=true gunicorn travel_vote_backend.asgi:application -k uvicorn_worker.UvicornWorker -w 2 -b 127.0.0.1:8002
+    python manage.py benchmark_endpoints --url http://127.0.0.1:8001 --url http://127.0.0.1:8002
+
+    연결을 유지하는(keep-alive) 클라이언트를 --concurrency개 동시에 돌리며 경로마다 --requests번 요청
+    응답 캐시의 영향을 보려면 --path에 ?page= 처럼 매번 다른 쿼리를 주거나 캐시를 끈 서버로 측정
+    """
+
+    help = '실행 중인 서버의 조회 API 처리량(req/s)과 응답 시간(p50/p95/p99)을 측정합니다.'
+
+    # 명령어 옵션 정의
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            action='append',
+            dest='urls',
+            help='측정할 서버 주소 (여러 번 지정하면 차례로 측정해 비교, 기본값 http://127.0.0.1:8000)',
+        )
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            help=f'측정할 경로 (여러 번 지정 가능, 기본값 {", ".join(DEFAULT_PATHS)})',
+        )
+        parser.add_argument('--requests', type=int, default=500, help='경로마다 보낼 요청 수 (기본값 500)')
+        parser.add_argument('--concurrency', type=int, default=20, help='동시 연결 수 (기본값 20)')
+        parser.add_argument('--warmup', type=int, default=20, help='측정 전 경로마다 보낼 요청 수 (기본값 20)')
+
+    # 명령어 실행
+    def handle(self, *args, **options):
+        urls = options['urls'] or ['http://127.0.0.1:8000']
+        paths = options['paths'] or list(DEFAULT_PATHS)
+        if options['requests'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--requests와 --concurrency는 1 이상이어야 합니다.')
+
+        for url in urls:
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{url} (요청 {options['requests']}회, 동시 연결 {options['concurrency']}개)"
+            ))
+            self.stdout.write(f"{'경로':<40} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'오류':>5}")
+            for path in paths:
+                if options['warmup']:
+                    self.run_requests(url, path, options['warmup'], options['concurrency'])
+                result = self.run_requests(url, path, options['requests'], options['concurrency'])
+                self.stdout.write(
+                    f"{path:<40} {result['rps']:>8.1f} {result['p50']:>6.1f}ms {result['p95']:>6.1f}ms "
+                    f"{result['p99']:>6.1f}ms {result['errors']:>5}"
+                )
+
+    # 한 경로에 요청을 보내고 결과를 집계하는 메서드
+    def run_requests(self, url, path, total, concurrency):
+        """
+        반환값: {'rps', 'p50', 'p95', 'p99', 'errors'} (응답 시간 단위: ms)
+        """
+        parts = urlsplit(url)
+        remaining = iter(range(total))
+        lock = threading.Lock()
+        latencies = []
+        errors = []
+
+        # 연결 하나로 남은 요청을 차례로 보내는 작업 (연결마다 스레드 1개)
+        def worker():
+            connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+            while True:
+                with lock:
+                    if next(remaining, None) is None:
+                        break
+                started = time.perf_counter()
+                try:
+                    connection.request('GET', path, headers={'Accept': 'application/json'})
+                    response = connection.getresponse()
+                    response.read()
+                    if response.status != 200:
+                        errors.append(response.status)
+                        continue
+                except (OSError, http.client.HTTPException) as error:
+                    errors.append(error)
+                    connection.close()
+                    continue
+                latencies.append((time.perf_counter() - started) * 1000)
+            connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(concurrency):
+                executor.submit(worker)
+        elapsed = time.perf_counter() - started
+
+        if len(latencies) < 2:
+            raise CommandError(f'{url}{path} 요청이 모두 실패했습니다: {errors[:1]}')
+
+        cuts = statistics.quantiles(latencies, n=100)
+        return {
+            'rps': len(latencies) / elapsed,
+            'p50': cuts[49],
+            'p95': cuts[94],
+            'p99': cuts[98],
+            'errors': len(errors),
+        }
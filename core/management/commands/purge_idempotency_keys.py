@@ -0,0 +1,20 @@
+# Django 관리 명령어 기본 클래스를 가져옴
+from django.core.management.base import BaseCommand
+
+# 만료된 Idempotency-Key 삭제 함수
+from core.idempotency import purge_expired_idempotency_records
+
+
+# 만료된 Idempotency-Key 응답 기록을 삭제하는 관리 명령어
+class Command(BaseCommand):
+    """
+    사용법 (cron 등으로 주기적으로 실행):
+    python manage.py purge_idempotency_keys
+    """
+
+    help = '만료된 Idempotency-Key 응답 기록(IDEMPOTENCY_KEY_TTL 경과)을 삭제합니다.'
+
+    # 명령어 실행
+    def handle(self, *args, **options):
+        deleted = purge_expired_idempotency_records()
+        self.stdout.write(self.style.SUCCESS(f'만료된 Idempotency-Key {deleted}개를 삭제했습니다.'))
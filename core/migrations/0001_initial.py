@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TableVersion',
+            fields=[
+                ('table', models.CharField(max_length=64, primary_key=True, serialize=False, verbose_name='테이블')),
+                ('version', models.PositiveBigIntegerField(default=0, verbose_name='버전')),
+                ('updated_at', models.DateTimeField(verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '테이블 버전',
+                'verbose_name_plural': '테이블 버전들',
+                'db_table': 'table_versions',
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:45
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, verbose_name='키')),
+                ('path', models.CharField(max_length=255, verbose_name='경로')),
+                ('fingerprint', models.CharField(max_length=64, verbose_name='요청 지문')),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='응답 상태 코드')),
+                ('response_body', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True, verbose_name='응답 본문')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='만료일')),
+            ],
+            options={
+                'verbose_name': '멱등성 키',
+                'verbose_name_plural': '멱등성 키들',
+                'db_table': 'idempotency_records',
+                'unique_together': {('key', 'path')},
+            },
+        ),
+    ]
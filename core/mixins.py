@@ -0,0 +1,29 @@
+# 여러 앱의 API View에서 공통으로 사용하는 믹스인 모듈
+from .serializers import get_requested_fields
+
+
+# ?fields= / ?expand= 요청을 serializer와 쿼리셋에 전달하는 View 믹스인
+class RequestedFieldsMixin:
+    """
+    GenericAPIView와 함께 사용
+    - serializer context에 요청한 필드 트리(requested_fields)를 넣어 응답 필드를 줄임
+    - get_field_serializer()로 필드가 선택된 serializer를 받아 only()/prefetch 범위를 정할 수 있음
+    """
+
+    # 요청한 필드 트리를 반환하는 메서드 (파라미터가 없으면 None)
+    def get_requested_fields(self):
+        if not hasattr(self, '_requested_fields'):
+            self._requested_fields = get_requested_fields(self.request)
+        return self._requested_fields
+
+    # serializer에 넘길 context를 만드는 메서드 (오버라이드)
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['requested_fields'] = self.get_requested_fields()
+        return context
+
+    # 필드가 선택된 serializer 인스턴스를 반환하는 메서드 (필드 선택이 없으면 None)
+    def get_field_serializer(self):
+        if self.get_requested_fields() is None:
+            return None
+        return self.get_serializer_class()(context=self.get_serializer_context())
@@ -1,3 +1,79 @@
+# Django의 데이터베이스 모델 기능을 가져옴
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
-# Create your models here.
+
+# 테이블별 데이터 버전을 저장하는 모델 (조건부 GET의 ETag/Last-Modified 계산용)
+class TableVersion(models.Model):
+    """
+    테이블의 데이터가 바뀔 때마다 version을 1씩 올림 (core.versions.bump_table_versions)
+    응답을 만들지 않고도 '마지막으로 받은 뒤 바뀌었는지'를 쿼리 한 번으로 판단할 수 있음
+    """
+
+    # 테이블 이름 (예: 'accommodations', 'votes')
+    table = models.CharField(max_length=64, primary_key=True, verbose_name="테이블")
+
+    # 데이터가 바뀔 때마다 증가하는 버전 번호
+    version = models.PositiveBigIntegerField(default=0, verbose_name="버전")
+
+    # 마지막으로 바뀐 시각
+    updated_at = models.DateTimeField(verbose_name="수정일")
+
+    # 데이터베이스 테이블 설정을 위한 메타 클래스
+    class Meta:
+        # 실제 데이터베이스 테이블명
+        db_table = 'table_versions'
+
+        # 관리자 페이지에서 단수형으로 표시될 이름
+        verbose_name = "테이블 버전"
+
+        # 관리자 페이지에서 복수형으로 표시될 이름
+        verbose_name_plural = "테이블 버전들"
+
+    # 객체를 문자열로 표현할 때 사용되는 메서드
+    def __str__(self):
+        return f"{self.table} v{self.version}"
+
+
+# Idempotency-Key 헤더로 보낸 POST 요청의 응답을 저장하는 모델 (재시도 시 같은 응답 반환)
+class IdempotencyRecord(models.Model):
+    """
+    같은 키로 다시 온 요청은 뷰를 실행하지 않고 저장된 응답을 그대로 반환 (core.idempotency)
+    status_code가 비어 있으면 첫 요청이 아직 처리 중인 상태
+    expires_at이 지난 행은 없는 것으로 취급하고 purge_idempotency_keys 명령으로 삭제
+    """
+
+    # 클라이언트가 보낸 Idempotency-Key 값
+    key = models.CharField(max_length=255, verbose_name="키")
+
+    # 요청 경로 (같은 키라도 다른 API면 별개로 취급)
+    path = models.CharField(max_length=255, verbose_name="경로")
+
+    # 요청 내용의 지문 (같은 키로 다른 내용을 보냈는지 확인)
+    fingerprint = models.CharField(max_length=64, verbose_name="요청 지문")
+
+    # 저장된 응답 상태 코드와 본문
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name="응답 상태 코드")
+    response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder, verbose_name="응답 본문")
+
+    # 생성 시각과 만료 시각
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    expires_at = models.DateTimeField(db_index=True, verbose_name="만료일")
+
+    # 데이터베이스 테이블 설정을 위한 메타 클래스
+    class Meta:
+        # 실제 데이터베이스 테이블명
+        db_table = 'idempotency_records'
+
+        # 관리자 페이지에서 단수형으로 표시될 이름
+        verbose_name = "멱등성 키"
+
+        # 관리자 페이지에서 복수형으로 표시될 이름
+        verbose_name_plural = "멱등성 키들"
+
+        # 경로별로 키는 하나만 (동시에 같은 키로 온 요청은 하나만 처리)
+        unique_together = ['key', 'path']
+
+    # 객체를 문자열로 표현할 때 사용되는 메서드
+    def __str__(self):
+        return f"{self.path} [{self.key}]"
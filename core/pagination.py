@@ -0,0 +1,56 @@
+# 목록 API에서 공통으로 사용하는 페이지네이션 클래스 모듈
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+# 생성일 기준 커서(keyset) 페이지네이션
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    (created_at, id) 내림차순으로 정렬하고 마지막으로 본 위치 이후만 조회
+    OFFSET과 COUNT(*)를 사용하지 않으므로 깊은 페이지도 첫 페이지와 같은 비용으로 조회됨
+    (같은 생성일이 겹치는 경우에만 id 순서로 그 안에서 건너뜀)
+    응답 형식: {'next': 다음 페이지 URL, 'previous': 이전 페이지 URL, 'results': [...]}
+    """
+
+    # 정렬 기준 (모델의 복합 인덱스와 같은 순서)
+    ordering = ('-created_at', '-id')
+
+    # 한 페이지 크기를 ?page_size= 로 조절 가능 (최대 100)
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+# 요청에 따라 커서 방식과 페이지 번호 방식을 선택하는 페이지네이션
+class CursorOrPageNumberPagination(PageNumberPagination):
+    """
+    ?cursor= 파라미터가 있으면 커서 페이지네이션 사용 (첫 페이지는 ?cursor= 처럼 빈 값으로 요청)
+    없으면 기존과 같은 페이지 번호 방식 (?page=2) 그대로 동작하므로 기존 클라이언트는 변경 불필요
+    ?ordering= 이 함께 오면 필터가 적용한 정렬(마지막 기준은 id)을 커서 정렬로 사용하고,
+    없으면 (created_at, id) 내림차순
+    """
+
+    # 커서 방식으로 전환하는 쿼리 파라미터 이름
+    cursor_query_param = 'cursor'
+
+    # 요청한 정렬을 커서 정렬로 사용하는 쿼리 파라미터 이름 (필터가 쿼리셋에 적용한 정렬)
+    ordering_query_param = 'ordering'
+
+    # 커서 방식에서 사용할 페이지네이션 클래스
+    cursor_pagination_class = CreatedAtCursorPagination
+
+    # 현재 요청에서 사용 중인 커서 페이지네이션 (페이지 번호 방식이면 None)
+    cursor_paginator = None
+
+    # 쿼리셋을 페이지 단위로 잘라 반환하는 메서드 (오버라이드)
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param in request.query_params:
+            self.cursor_paginator = self.cursor_pagination_class()
+            if request.query_params.get(self.ordering_query_param) and queryset.query.order_by:
+                self.cursor_paginator.ordering = tuple(queryset.query.order_by)
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    # 페이지 정보를 포함한 응답을 만드는 메서드 (오버라이드)
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,120 @@
+# ?fields= / ?expand= 쿼리 파라미터로 응답 필드를 고를 수 있게 하는 serializer 모듈
+from rest_framework import serializers
+
+
+# 'id,name,accommodation.price' 형태의 문자열을 필드 트리로 바꾸는 함수
+def parse_field_tree(value, tree=None):
+    """
+    점(.)으로 중첩 serializer의 필드를 지정할 수 있음
+    예: 'id,rating,accommodation.name' -> {'id': None, 'rating': None, 'accommodation': {'name': None}}
+    값이 None인 항목은 해당 필드 전체(중첩이면 모든 하위 필드)를 의미
+    """
+    tree = {} if tree is None else tree
+    for path in value.split(','):
+        names = [name.strip() for name in path.split('.') if name.strip()]
+        node = tree
+        for depth, name in enumerate(names):
+            if depth == len(names) - 1:
+                # 'accommodation'과 'accommodation.name'이 함께 오면 전체 필드 우선
+                node[name] = None
+            elif node.get(name, {}) is None:
+                break
+            else:
+                node = node.setdefault(name, {})
+    return tree
+
+
+# 요청의 ?fields=, ?expand= 값으로 필드 트리를 만드는 함수
+def get_requested_fields(request):
+    """
+    반환값: None - 파라미터가 없으면 기존과 같은 전체 응답
+            dict - 응답에 포함할 필드 트리
+    ?fields= 를 지정하면 중첩 객체(이미지, 사용자, 숙소 등)는 fields나 expand에 적은 경우에만 포함됨
+    ?expand= 만 지정하면 기본 필드 전체에 더해 지정한 중첩 객체를 포함
+    """
+    if request is None or request.method != 'GET':
+        return None
+
+    fields = request.query_params.get('fields')
+    expand = request.query_params.get('expand')
+    if not fields and not expand:
+        return None
+
+    tree = parse_field_tree(fields) if fields else {'*': None}
+    if expand:
+        parse_field_tree(expand, tree)
+    return tree
+
+
+# 요청한 필드만 직렬화하는 serializer 믹스인
+class DynamicFieldsMixin:
+    """
+    ModelSerializer와 함께 사용 (class FooSerializer(DynamicFieldsMixin, serializers.ModelSerializer))
+    - 최상위 serializer는 context['requested_fields']를, 중첩 serializer는 부모가 넘겨준 하위 트리를 사용
+    - Meta.expandable_fields: ?fields= 없이 ?expand= 만 보냈을 때 expand에 적어야만 포함되는 중첩 필드
+    - Meta.field_sources: SerializerMethodField 등이 실제로 읽는 모델 필드 (only() 계산용)
+    """
+
+    # 부모 serializer가 지정한 필드 트리 (None이면 전체)
+    requested_fields = None
+
+    # 직렬화할 필드 목록을 만드는 메서드 (오버라이드)
+    def get_fields(self):
+        fields = super().get_fields()
+
+        requested = self.requested_fields
+        if requested is None and self._is_root_serializer():
+            requested = self.context.get('requested_fields')
+        if requested is None:
+            return fields
+
+        # ?expand= 만 보낸 경우 기본 필드는 모두 유지하고 expandable 필드만 선택
+        if '*' in requested:
+            expandable = getattr(self.Meta, 'expandable_fields', ())
+            keep = {name for name in fields if name not in expandable} | set(requested)
+        else:
+            keep = set(requested)
+
+        for name in list(fields):
+            if name not in keep:
+                fields.pop(name)
+
+        # 중첩 serializer에 하위 필드 트리 전달
+        for name, field in fields.items():
+            child = getattr(field, 'child', field)
+            if isinstance(child, DynamicFieldsMixin):
+                child.requested_fields = requested.get(name)
+
+        return fields
+
+    # 최상위 serializer인지 확인하는 메서드 (many=True면 ListSerializer가 부모)
+    def _is_root_serializer(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    # 직렬화할 필드들이 읽는 모델 필드 이름 목록을 반환하는 메서드
+    def get_model_field_names(self):
+        """
+        QuerySet.only()에 넘길 필드 이름 목록
+        (기본 키와 정방향 외래키 컬럼 포함, 역방향 관계/계산 필드는 제외)
+        """
+        opts = self.Meta.model._meta
+        concrete = {field.name for field in opts.concrete_fields}
+        sources = getattr(self.Meta, 'field_sources', {})
+
+        names = {opts.pk.name}
+        for name, field in self.fields.items():
+            if name in sources:
+                names.update(sources[name])
+                continue
+            source = field.source.split('.')[0]
+            if source in concrete:
+                names.add(source)
+        return sorted(names)
+
+    # 중첩 필드의 serializer 인스턴스를 반환하는 메서드 (포함되지 않으면 None)
+    def get_nested_serializer(self, name):
+        field = self.fields.get(name)
+        return getattr(field, 'child', field)
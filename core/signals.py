@@ -0,0 +1,28 @@
+# 모델이 저장/삭제될 때 테이블 버전을 올리는 시그널 모듈
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+# 테이블 버전 함수를 가져옴
+from .versions import bump_table_versions
+
+
+# 버전을 관리하는 모델 목록 (조건부 GET 응답에 사용되는 테이블)
+VERSIONED_MODELS = (
+    'users.User',
+    'accommodations.Accommodation',
+    'accommodations.AccommodationImage',
+    'votes.Vote',
+)
+
+
+# 모델이 저장/삭제될 때 해당 테이블 버전을 올리는 시그널 핸들러
+def bump_model_table_version(sender, **kwargs):
+    bump_table_versions(sender._meta.db_table)
+
+
+# 시그널 핸들러를 연결하는 함수 (CoreConfig.ready()에서 호출)
+def connect_version_signals():
+    for label in VERSIONED_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(bump_model_table_version, sender=model, dispatch_uid=f'table-version-save-{label}')
+        post_delete.connect(bump_model_table_version, sender=model, dispatch_uid=f'table-version-delete-{label}')
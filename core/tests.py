@@ -1,3 +1,301 @@
-from django.test import TestCase
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+from datetime import time
+from time import monotonic
 
-# Create your tests here.
+from django.core.cache import cache
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from accommodations.models import Accommodation
+from users.models import User
+from votes.models import Vote
+
+from .broker import RESYNC_EVENT, SUBSCRIBER_QUEUE_SIZE, CacheBroker, InProcessBroker, format_sse
+from .cache import get_or_compute
+from .idempotency import purge_expired_idempotency_records
+from .versions import bump_table_versions
+from .views import serve_media
+
+
+HASHED_NAME = 'accommodations/sha256/ab/cd/' + 'abcd' + '0' * 60 + '.jpg'
+VARIANT_NAME = 'accommodations/sha256/ab/cd/' + 'abcd' + '0' * 60 + '.thumb.webp'
+
+
+# 프로덕션 미디어 서빙 뷰의 캐시/조건부/범위 요청 처리를 확인하는 테스트
+class ServeMediaTests(SimpleTestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root, MEDIA_SENDFILE_BACKEND='')
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        for name in (HASHED_NAME, VARIANT_NAME, 'accommodations/1/room.jpg'):
+            full_path = os.path.join(self.media_root, name)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'wb') as media_file:
+                media_file.write(b'0123456789')
+        self.factory = RequestFactory()
+
+    def get(self, path, **headers):
+        meta = {f'HTTP_{name.upper()}': value for name, value in headers.items()}
+        return serve_media(self.factory.get(f'/media/{path}', **meta), path)
+
+    def test_hashed_file_is_immutable(self):
+        response = self.get(HASHED_NAME)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), b'0123456789')
+        self.assertEqual(response['ETag'], '"abcd' + '0' * 60 + '"')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+
+        legacy = self.get('accommodations/1/room.jpg')
+        self.assertNotIn('immutable', legacy['Cache-Control'])
+
+        # 파생본은 원본 해시를 이름에 쓰지만 다시 생성하면 내용이 바뀌므로 일반 파일처럼 캐시
+        variant = self.get(VARIANT_NAME)
+        self.assertNotIn('immutable', variant['Cache-Control'])
+        self.assertNotEqual(variant['ETag'], response['ETag'])
+
+    def test_conditional_request_returns_304(self):
+        etag = self.get(HASHED_NAME)['ETag']
+        response = self.get(HASHED_NAME, if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('immutable', response['Cache-Control'])
+
+        last_modified = self.get('accommodations/1/room.jpg')['Last-Modified']
+        response = self.get('accommodations/1/room.jpg', if_modified_since=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_range_requests(self):
+        response = self.get(HASHED_NAME, range='bytes=2-5')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), b'2345')
+        self.assertEqual(response['Content-Range'], 'bytes 2-5/10')
+
+        response = self.get(HASHED_NAME, range='bytes=-3')
+        self.assertEqual(b''.join(response.streaming_content), b'789')
+
+        response = self.get(HASHED_NAME, range='bytes=20-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */10')
+
+        # If-Range가 맞지 않으면 전체 파일을 보냄
+        response = self.get(HASHED_NAME, range='bytes=2-5', if_range='"other"')
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(MEDIA_SENDFILE_BACKEND='x-accel', MEDIA_ACCEL_REDIRECT_PREFIX='/protected-media/')
+    def test_x_accel_redirect(self):
+        response = self.get(HASHED_NAME)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{HASHED_NAME}')
+        self.assertEqual(response.content, b'')
+
+    def test_missing_and_traversal_paths_return_404(self):
+        with self.assertRaises(Http404):
+            self.get('accommodations/1/missing.jpg')
+        with self.assertRaises(Http404):
+            self.get('../settings.py')
+
+
+# 테이블 버전 기반 조건부 GET(ETag, 304)을 확인하는 테스트
+class ConditionalGetTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(name='민수')
+        self.accommodation = Accommodation.objects.create(
+            name='숙소', location='가평', price=100000, description='설명',
+            check_in=time(15), check_out=time(11),
+        )
+        self.url = reverse('accommodations:accommodation-list-create')
+
+    def test_unchanged_data_returns_304_without_running_view(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('no-cache', response['Cache-Control'])
+        self.assertTrue(response.has_header('Last-Modified'))
+
+        # 테이블 버전 조회 한 번으로 응답
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_changes_when_related_tables_change(self):
+        etag = self.client.get(self.url)['ETag']
+
+        # 투표가 바뀌면 숙소의 평점/투표 수가 바뀌므로 숙소 목록 ETag도 바뀜
+        Vote.objects.create(user=self.user, accommodation=self.accommodation, rating=8)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        # 시그널이 없는 경로(QuerySet.update 등)에서 직접 버전을 올린 경우
+        etag = response['ETag']
+        bump_table_versions('accommodation_images')
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_stats_endpoints_are_conditional(self):
+        for name in ('accommodations:accommodation-stats', 'votes:vote-stats', 'users:user-stats'):
+            etag = self.client.get(reverse(name))['ETag']
+            self.assertEqual(self.client.get(reverse(name), HTTP_IF_NONE_MATCH=etag).status_code, 304, name)
+
+
+# 테이블 버전 기반 응답 캐시를 확인하는 테스트
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'tests'}})
+class ResponseCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(name='민수')
+        self.accommodation = Accommodation.objects.create(
+            name='숙소', location='가평', price=100000, description='설명',
+            check_in=time(15), check_out=time(11),
+        )
+
+    def test_cached_stats_skip_aggregates_until_vote_changes(self):
+        url = reverse('votes:vote-stats')
+        self.assertEqual(self.client.get(url).json()['total_votes'], 0)
+
+        # 테이블 버전 조회만 실행
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url).json()['total_votes'], 0)
+
+        # 투표 저장 시그널이 버전을 올리므로 새 값으로 다시 계산
+        Vote.objects.create(user=self.user, accommodation=self.accommodation, rating=8)
+        self.assertEqual(self.client.get(url).json()['total_votes'], 1)
+
+    def test_popular_is_cached(self):
+        url = reverse('accommodations:popular-accommodations')
+        self.client.get(url)
+        with self.assertNumQueries(1):
+            self.client.get(url)
+
+    def test_concurrent_miss_waits_for_first_computation(self):
+        # 다른 요청이 잠금을 잡고 계산 중인 상황
+        cache.add('stats:lock', 1)
+        threading.Timer(0.1, cache.set, args=('stats', {'total': 1})).start()
+
+        computed = []
+        value = get_or_compute('stats', lambda: computed.append(1) or {'total': 2})
+        self.assertEqual(value, {'total': 1})
+        self.assertEqual(computed, [])
+
+    def test_waiter_stops_when_first_computation_fails(self):
+        # 잠금을 잡은 요청이 값을 저장하지 못하고(실패 응답, 예외) 잠금만 푼 상황
+        cache.add('stats:lock', 1)
+        threading.Timer(0.1, cache.delete, args=('stats:lock',)).start()
+
+        computed = []
+        started = monotonic()
+        with override_settings(RESPONSE_CACHE_LOCK_TIMEOUT=5):
+            value = get_or_compute('stats', lambda: computed.append(1) or {'total': 2})
+        self.assertEqual(value, {'total': 2})
+        self.assertEqual(computed, [1])
+        self.assertLess(monotonic() - started, 2)
+
+
+# Idempotency-Key 헤더로 재시도한 POST 요청이 한 번만 처리되는지 확인하는 테스트
+class IdempotencyTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(name='민수')
+        self.accommodation = Accommodation.objects.create(
+            name='숙소', location='가평', price=100000, description='설명',
+            check_in=time(15), check_out=time(11),
+        )
+
+    def post_vote(self, rating=7, key='vote-1'):
+        return self.client.post(
+            reverse('votes:vote-list-create'),
+            {'user_id': self.user.id, 'accommodation_id': self.accommodation.id, 'rating': rating},
+            content_type='application/json',
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+    def test_retry_returns_stored_response_without_writing(self):
+        first = self.post_vote()
+        self.assertEqual(first.status_code, 201)
+
+        # 저장된 응답 조회 1회만 실행
+        with self.assertNumQueries(1):
+            retry = self.post_vote()
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+
+    def test_reused_key_with_different_body_is_rejected(self):
+        self.post_vote()
+        response = self.post_vote(rating=3)
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Vote.objects.get().rating, 7)
+
+    def test_failed_requests_are_not_stored(self):
+        response = self.post_vote(rating=11)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.post_vote().status_code, 201)
+
+    def test_expired_keys_are_processed_again(self):
+        self.post_vote()
+        with override_settings(IDEMPOTENCY_KEY_TTL=-1):
+            self.post_vote(key='vote-2')
+        self.assertEqual(purge_expired_idempotency_records(), 1)
+
+
+# 실시간 이벤트 브로커의 발행/구독과 SSE 형식을 확인하는 테스트
+class LiveEventBrokerTests(SimpleTestCase):
+
+    def test_format_sse(self):
+        self.assertEqual(format_sse('ranking', {'id': 1}), 'event: ranking\ndata: {"id":1}\n\n')
+        self.assertEqual(format_sse(comment='keepalive'), ': keepalive\n\n')
+
+    def test_publish_from_another_thread_reaches_subscriber(self):
+        async def scenario():
+            broker = InProcessBroker()
+            subscription = broker.subscribe('ranking')
+            other = broker.subscribe('other')
+            thread = threading.Thread(target=broker.publish, args=('ranking', 'ranking', {'id': 1}))
+            thread.start()
+            event = await subscription.get(timeout=1)
+            thread.join()
+            broker.unsubscribe(subscription)
+            return event, await other.get(timeout=0.01), broker.subscriber_count()
+
+        event, other_event, remaining = asyncio.run(scenario())
+        self.assertEqual(event, {'event': 'ranking', 'data': {'id': 1}})
+        self.assertIsNone(other_event)
+        self.assertEqual(remaining, 1)
+
+    def test_slow_subscriber_gets_resync_instead_of_backlog(self):
+        async def scenario():
+            broker = InProcessBroker()
+            subscription = broker.subscribe('ranking')
+            for number in range(SUBSCRIBER_QUEUE_SIZE + 1):
+                broker.publish('ranking', 'ranking', {'id': number})
+            await asyncio.sleep(0)
+            return subscription.queue.qsize(), await subscription.get(timeout=1)
+
+        size, event = asyncio.run(scenario())
+        self.assertEqual(size, 1)
+        self.assertEqual(event['event'], RESYNC_EVENT)
+
+    @override_settings(LIVE_EVENTS_POLL_INTERVAL=0.01)
+    def test_cache_broker_relays_events_through_shared_cache(self):
+        cache.clear()
+
+        async def scenario():
+            subscriber_broker = CacheBroker()
+            subscription = subscriber_broker.subscribe('ranking')
+            # 폴링 작업이 현재 순번을 읽은 뒤 다른 워커에서 발행한 것처럼 별도 인스턴스로 발행
+            await asyncio.sleep(0.05)
+            CacheBroker().publish('ranking', 'ranking', {'id': 1})
+            event = await subscription.get(timeout=1)
+            subscriber_broker.unsubscribe(subscription)
+            return event
+
+        self.assertEqual(asyncio.run(scenario()), {'event': 'ranking', 'data': {'id': 1}})
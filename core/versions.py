@@ -0,0 +1,166 @@
+# 테이블 버전으로 조건부 GET(ETag / Last-Modified, 304 응답)을 처리하는 모듈
+import asyncio
+import hashlib
+from functools import partial, wraps
+
+# Django의 데이터베이스, 시간, 캐시 헤더 관련 기능을 가져옴
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import condition
+
+# 현재 앱의 모델을 가져옴
+from .models import TableVersion
+
+
+# 테이블 버전을 1씩 올리는 함수
+def bump_table_versions(*tables):
+    """
+    데이터가 바뀐 테이블의 버전을 올림 (현재 트랜잭션 안에서 실행되어 데이터 변경과 함께 커밋됨)
+    save()/delete()는 시그널(core.signals)이 자동으로 호출하고,
+    bulk_create()나 QuerySet.update()처럼 시그널이 없는 경로에서는 직접 호출해야 함
+    """
+    now = timezone.now()
+    for table in tables:
+        updated = TableVersion.objects.filter(table=table).update(
+            version=F('version') + 1, updated_at=now
+        )
+        if updated:
+            continue
+        # 처음 바뀐 테이블이면 행을 만듦 (동시에 만들어졌으면 다시 올림)
+        try:
+            with transaction.atomic():
+                TableVersion.objects.create(table=table, version=1, updated_at=now)
+        except IntegrityError:
+            TableVersion.objects.filter(table=table).update(
+                version=F('version') + 1, updated_at=now
+            )
+
+    # 캐시된 ID 집합도 지움 (커밋 전에 다른 요청이 이전 값으로 다시 채울 수 있어 커밋 후 한 번 더)
+    from .cache import CACHED_ID_TABLES, invalidate_cached_ids
+    for table in tables:
+        if table in CACHED_ID_TABLES:
+            invalidate_cached_ids(table)
+            transaction.on_commit(partial(invalidate_cached_ids, table))
+
+
+# 테이블 버전들로 ETag와 마지막 수정 시각을 계산하는 함수
+def get_table_validators(tables):
+    """
+    쿼리 한 번으로 (ETag 문자열, 마지막 수정 시각) 반환
+    한 번도 바뀐 적 없는 테이블은 버전 0으로 취급
+    """
+    return _build_table_validators(tables, TableVersion.objects.filter(table__in=tables))
+
+
+# get_table_validators()의 비동기 버전 (비동기 View용)
+async def aget_table_validators(tables):
+    rows = [row async for row in TableVersion.objects.filter(table__in=tables)]
+    return _build_table_validators(tables, rows)
+
+
+# 조회한 테이블 버전 행들로 (ETag, 마지막 수정 시각)을 만드는 함수
+def _build_table_validators(tables, rows):
+    rows = {row.table: row for row in rows}
+
+    # 버전과 함께 수정 시각도 넣어, DB를 복원해 버전 번호가 되돌아가도 같은 ETag가 나오지 않도록 함
+    key = ';'.join(
+        f"{table}:{rows[table].version}:{rows[table].updated_at.isoformat()}" if table in rows else f"{table}:0"
+        for table in sorted(tables)
+    )
+    etag = hashlib.sha1(key.encode()).hexdigest()[:20]
+    last_modified = max((row.updated_at for row in rows.values()), default=None)
+    return etag, last_modified
+
+
+# 한 요청 안에서 테이블 버전 조회 결과를 재사용하는 함수
+def get_request_table_validators(request, tables):
+    """
+    조건부 GET과 응답 캐시가 같은 요청에서 테이블 버전을 중복 조회하지 않도록 요청 객체에 저장
+    반환값: get_table_validators()와 동일
+    """
+    cached = getattr(request, '_table_validators', None)
+    if cached is None:
+        cached = {}
+        request._table_validators = cached
+    key = tuple(sorted(tables))
+    if key not in cached:
+        cached[key] = get_table_validators(tables)
+    return cached[key]
+
+
+# get_request_table_validators()의 비동기 버전 (같은 요청 객체의 저장값을 공유)
+async def aget_request_table_validators(request, tables):
+    cached = getattr(request, '_table_validators', None)
+    if cached is None:
+        cached = {}
+        request._table_validators = cached
+    key = tuple(sorted(tables))
+    if key not in cached:
+        cached[key] = await aget_table_validators(tables)
+    return cached[key]
+
+
+# 테이블 버전으로 조건부 GET을 처리하는 데코레이터
+def conditional_on_tables(*tables):
+    """
+    GET/HEAD 요청에 ETag, Last-Modified 헤더를 붙이고
+    If-None-Match / If-Modified-Since가 현재 버전과 같으면 뷰(쿼리, serializer)를 실행하지 않고 304 반환
+    함수형 뷰: @api_view 아래에 사용 (async def 뷰에도 사용 가능)
+    클래스형 뷰: @method_decorator(conditional_on_tables(...), name='get')
+    같은 URL이면 같은 응답이 나오므로 테이블 버전만으로 ETag를 만듦
+    """
+    # 한 요청에서 ETag와 Last-Modified를 계산할 때 쿼리를 한 번만 실행
+    def etag_func(request, *args, **kwargs):
+        return get_request_table_validators(request, tables)[0]
+
+    def last_modified_func(request, *args, **kwargs):
+        return get_request_table_validators(request, tables)[1]
+
+    def decorator(view_func):
+        if asyncio.iscoroutinefunction(view_func):
+            return _async_conditional(view_func, tables)
+
+        conditional_view = condition(etag_func=etag_func, last_modified_func=last_modified_func)(view_func)
+
+        @wraps(view_func)
+        def inner(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(request, *args, **kwargs)
+            response = conditional_view(request, *args, **kwargs)
+            # 브라우저가 임의로 캐시를 재사용하지 않고 매번 ETag로 재검증하도록 지정
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+
+        return inner
+
+    return decorator
+
+
+# 비동기 뷰용 조건부 GET 처리 (django.views.decorators.http.condition과 같은 규칙)
+def _async_conditional(view_func, tables):
+    @wraps(view_func)
+    async def inner(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return await view_func(request, *args, **kwargs)
+
+        etag, last_modified = await aget_request_table_validators(request, tables)
+        etag = quote_etag(etag)
+        last_modified = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = await view_func(request, *args, **kwargs)
+            # 비동기 뷰가 처리를 동기 뷰에 넘기는 경우(None)는 그대로 전달
+            if response is None:
+                return None
+
+        if last_modified and not response.has_header('Last-Modified'):
+            response.headers['Last-Modified'] = http_date(last_modified)
+        response.headers.setdefault('ETag', etag)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    return inner
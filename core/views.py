@@ -1,3 +1,174 @@
-from django.shortcuts import render
+# 업로드된 미디어 파일(숙소 이미지 등)을 프로덕션에서 서빙하는 뷰 모듈
+import mimetypes
+import os
+import re
+from urllib.parse import quote
 
-# Create your views here.
+# Django 설정 및 HTTP 관련 기능을 가져옴
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.http import require_http_methods
+
+# 내용 해시 경로 판별 함수를 가져옴
+from accommodations.storage import is_content_addressed
+
+
+# 'Range: bytes=시작-끝' 헤더 형식 (단일 구간만 지원)
+RANGE_HEADER_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+# 범위 요청 응답을 읽을 때 사용하는 청크 크기
+RANGE_CHUNK_SIZE = 64 * 1024
+
+
+# 파일 상태로부터 강한 ETag를 만드는 함수
+def _media_etag(path, stat):
+    # 해시 경로는 파일 이름 자체가 내용의 해시이므로 그대로 사용 (내용이 바뀌면 경로가 바뀜)
+    if is_content_addressed(path):
+        return '"%s"' % os.path.splitext(os.path.basename(path))[0]
+    # 그 외 파일은 수정 시각과 크기로 구분 (파일은 항상 통째로 교체되므로 충분함)
+    return '"%x-%x"' % (stat.st_mtime_ns, stat.st_size)
+
+
+# 미디어 응답에 공통 헤더를 설정하는 함수
+def _set_media_headers(response, path, stat, etag):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    response['Accept-Ranges'] = 'bytes'
+    # 해시 경로는 내용이 절대 바뀌지 않으므로 브라우저와 CDN이 1년간 재검증 없이 캐시
+    if is_content_addressed(path):
+        response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    else:
+        response['Cache-Control'] = f'public, max-age={settings.MEDIA_CACHE_MAX_AGE}'
+    return response
+
+
+# Range 헤더를 해석해 (시작, 끝) 바이트 위치를 반환하는 함수
+def _parse_range(header, size):
+    """
+    반환값: (start, end) - 끝 위치 포함
+            None - 헤더가 없거나 지원하지 않는 형식 (전체 파일 응답)
+            False - 파일 크기를 벗어난 범위 (416 응답)
+    """
+    match = RANGE_HEADER_RE.match(header.strip()) if header else None
+    if not match:
+        return None
+
+    start, end = match.groups()
+    if not start and not end:
+        return None
+
+    # 'bytes=-500': 마지막 500바이트
+    if not start:
+        length = int(end)
+        if not length or not size:
+            return False
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = int(end) if end else size - 1
+    if start >= size or end < start:
+        return False
+    return start, min(end, size - 1)
+
+
+# If-Range 조건이 맞는지 확인하는 함수 (맞지 않으면 범위 대신 전체 파일을 보냄)
+def _if_range_matches(request, etag, stat):
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    if if_range.startswith('"') or if_range.startswith('W/'):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == int(stat.st_mtime)
+
+
+# 파일의 일부분만 청크 단위로 읽는 제너레이터
+def _read_range(full_path, start, length):
+    with open(full_path, 'rb') as media_file:
+        media_file.seek(start)
+        while length > 0:
+            chunk = media_file.read(min(RANGE_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+# 미디어 파일을 서빙하는 뷰 (django.views.static.serve 대체)
+@require_http_methods(['GET', 'HEAD'])
+def serve_media(request, path):
+    """
+    GET/HEAD /media/{경로}
+    - 강한 ETag, Last-Modified로 If-None-Match / If-Modified-Since 조건부 요청에 304 응답
+    - 'Range: bytes=...' 요청에 206 부분 응답
+    - 내용 해시 경로('accommodations/sha256/...')는 immutable 장기 캐시
+    - MEDIA_SENDFILE_BACKEND 설정 시 파일 전송을 nginx/Apache에 맡겨 gunicorn 워커를 바로 반환
+    """
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404('파일을 찾을 수 없습니다.')
+
+    try:
+        stat = os.stat(full_path)
+    except OSError:
+        raise Http404('파일을 찾을 수 없습니다.')
+    if not os.path.isfile(full_path):
+        raise Http404('파일을 찾을 수 없습니다.')
+
+    etag = _media_etag(path, stat)
+
+    # 조건부 요청 처리 (변경되지 않았으면 본문 없이 304)
+    # (조건에 걸리지 않으면 넘겨준 응답이 그대로 반환되므로 상태 코드로 구분)
+    conditional = get_conditional_response(
+        request, etag=etag, last_modified=int(stat.st_mtime),
+        response=_set_media_headers(HttpResponse(), path, stat, etag),
+    )
+    if conditional.status_code in (304, 412):
+        return conditional
+
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+
+    # 프런트 웹 서버가 파일을 직접 보내도록 위임 (Range/전송은 웹 서버가 처리)
+    backend = settings.MEDIA_SENDFILE_BACKEND
+    if backend in ('x-accel', 'x-sendfile'):
+        response = HttpResponse(content_type=content_type)
+        if backend == 'x-accel':
+            prefix = settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip('/')
+            response['X-Accel-Redirect'] = f'{prefix}/{quote(path)}'
+        else:
+            response['X-Sendfile'] = full_path
+        return _set_media_headers(response, path, stat, etag)
+
+    # 범위 요청 처리
+    byte_range = None
+    if request.method == 'GET' and _if_range_matches(request, etag, stat):
+        byte_range = _parse_range(request.headers.get('Range'), stat.st_size)
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{stat.st_size}'
+        return _set_media_headers(response, path, stat, etag)
+
+    if byte_range:
+        start, end = byte_range
+        length = end - start + 1
+        response = StreamingHttpResponse(
+            _read_range(full_path, start, length), status=206, content_type=content_type,
+        )
+        response['Content-Length'] = str(length)
+        response['Content-Range'] = f'bytes {start}-{end}/{stat.st_size}'
+    elif request.method == 'HEAD':
+        response = HttpResponse(content_type=content_type)
+        response['Content-Length'] = str(stat.st_size)
+    else:
+        # FileResponse는 WSGI 서버의 sendfile(wsgi.file_wrapper)로 전송됨
+        response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+
+    if encoding:
+        response['Content-Encoding'] = encoding
+    return _set_media_headers(response, path, stat, etag)
@@ -5,6 +5,10 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
+
+실시간 랭킹 스트림(/api/votes/stream/)은 ASGI 서버에서만 연결을 유지함
+(WSGI 서버에서는 스냅샷만 보내고 종료). 워커가 여러 개면 LIVE_EVENTS_BROKER=cache와
+공유 캐시(CACHE_BACKEND=file 또는 db)를 함께 설정
 """
 
 import os
@@ -28,6 +28,7 @@ INSTALLED_APPS = [
     # Third party apps
     'rest_framework',
     'corsheaders',
+    'django_filters',
     
     # Local apps
     'users',
@@ -114,6 +115,77 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# 미디어 파일 서빙 설정 (DEBUG=False일 때 core.views.serve_media 사용)
+# 비워두면 Django가 직접 전송 / x-accel: nginx X-Accel-Redirect / x-sendfile: Apache·lighttpd X-Sendfile
+MEDIA_SENDFILE_BACKEND = config('MEDIA_SENDFILE_BACKEND', default='')
+# x-accel 사용 시 nginx의 internal location 경로 (예: location /protected-media/ { internal; alias /app/media/; })
+MEDIA_ACCEL_REDIRECT_PREFIX = config('MEDIA_ACCEL_REDIRECT_PREFIX', default='/protected-media/')
+# 해시 경로가 아닌 기존 미디어 파일의 브라우저 캐시 시간(초)
+MEDIA_CACHE_MAX_AGE = config('MEDIA_CACHE_MAX_AGE', default=3600, cast=int)
+
+# 숙소 이미지 저장 방식
+# hashed: 내용 해시 경로에 저장해 같은 파일을 한 번만 저장 / legacy: 'accommodations/숙소ID/파일명'
+ACCOMMODATION_IMAGE_STORAGE_MODE = config('ACCOMMODATION_IMAGE_STORAGE_MODE', default='hashed')
+
+# 숙소 이미지 파생본 처리 설정
+# thread: 웹 프로세스 안의 스레드 풀에서 처리 / worker: manage.py process_images 워커가 처리 / sync: 즉시 처리
+IMAGE_PROCESSING_BACKEND = config('IMAGE_PROCESSING_BACKEND', default='thread')
+IMAGE_PROCESSING_WORKERS = config('IMAGE_PROCESSING_WORKERS', default=2, cast=int)
+
+# 투표 통계용 평점 분포 요약 테이블(VoteSummary) 사용 여부
+# 끄면 통계 요청마다 투표 테이블을 GROUP BY로 집계 (다시 켤 때는 manage.py rebuild_vote_aggregates 실행)
+VOTE_SUMMARY_ENABLED = config('VOTE_SUMMARY_ENABLED', default=True, cast=bool)
+
+# 투표 이벤트 몇 개마다 숙소별 집계 스냅샷을 만들지 (과거 시점 랭킹 재계산의 시작점, 0이면 자동 생성 안 함)
+VOTE_SNAPSHOT_INTERVAL = config('VOTE_SNAPSHOT_INTERVAL', default=1000, cast=int)
+
+# 캐시 설정 (통계/인기 숙소 API 응답 캐시)
+# locmem: 프로세스별 메모리 (기본) / file: 여러 워커가 공유하는 파일 캐시 / db: 공유 DB 캐시 (manage.py createcachetable 필요)
+# 캐시 키에 테이블 버전이 포함되므로 어떤 백엔드를 써도 데이터가 바뀐 뒤 오래된 응답을 내보내지 않음
+CACHE_BACKEND = config('CACHE_BACKEND', default='locmem')
+CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'travel-vote'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', os.path.join(BASE_DIR, 'cache')),
+    'db': ('django.core.cache.backends.db.DatabaseCache', 'django_cache'),
+}
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND][0],
+        'LOCATION': config('CACHE_LOCATION', default=CACHE_BACKENDS[CACHE_BACKEND][1]),
+    }
+}
+
+# 응답 캐시 유지 시간(초)과 캐시 재계산 잠금 시간(초)
+RESPONSE_CACHE_TIMEOUT = config('RESPONSE_CACHE_TIMEOUT', default=300, cast=int)
+RESPONSE_CACHE_LOCK_TIMEOUT = config('RESPONSE_CACHE_LOCK_TIMEOUT', default=10, cast=int)
+
+# 사용자/숙소 ID 집합 캐시 유지 시간(초) (투표 저장 시 존재 여부 확인용)
+ID_SET_CACHE_TIMEOUT = config('ID_SET_CACHE_TIMEOUT', default=300, cast=int)
+
+# 투표 추이(/api/votes/trend/)의 끝난 구간 집계 캐시 유지 시간(초)
+# (지난 투표가 수정/삭제되면 같은 캐시를 쓰는 워커에는 바로 반영되고, 워커별 로컬 메모리 캐시라면 다른 워커에는 이 시간 뒤 반영)
+VOTE_TREND_CACHE_TIMEOUT = config('VOTE_TREND_CACHE_TIMEOUT', default=600, cast=int)
+
+# Idempotency-Key 응답 보관 시간(초)과 처리 중 상태를 중단된 것으로 볼 시간(초)
+IDEMPOTENCY_KEY_TTL = config('IDEMPOTENCY_KEY_TTL', default=86400, cast=int)
+IDEMPOTENCY_LOCK_TIMEOUT = config('IDEMPOTENCY_LOCK_TIMEOUT', default=60, cast=int)
+
+# 조회 API(숙소 목록/상세/랭킹/통계, 사용자별 투표)를 비동기 View로 처리할지 여부
+# ASGI 서버(Procfile.asgi)에서만 켬 (WSGI 서버에서는 기존 동기 DRF View가 더 빠름)
+ASYNC_VIEWS = config('ASYNC_VIEWS', default=False, cast=bool)
+
+# 실시간 랭킹 스트림(Server-Sent Events, /api/votes/stream/) 설정 (ASGI 서버에서만 연결 유지)
+# inprocess: 워커 1개 안에서만 전달 / cache: 공유 캐시(CACHE_BACKEND=file 또는 db)를 거쳐 여러 워커에 전달
+LIVE_EVENTS_ENABLED = config('LIVE_EVENTS_ENABLED', default=True, cast=bool)
+LIVE_EVENTS_BROKER = config('LIVE_EVENTS_BROKER', default='inprocess')
+# 커밋 후 랭킹 계산/발행을 실행할 곳 (thread: 발행 전용 스레드 / sync: 요청 스레드, 테스트용)
+LIVE_EVENTS_PUBLISH_BACKEND = config('LIVE_EVENTS_PUBLISH_BACKEND', default='thread')
+# cache 브로커가 새 이벤트를 확인하는 간격(초)
+LIVE_EVENTS_POLL_INTERVAL = config('LIVE_EVENTS_POLL_INTERVAL', default=1.0, cast=float)
+# 연결 유지용 주석을 보내는 간격(초)과 한 연결의 최대 유지 시간(초, 끝나면 브라우저가 자동 재연결)
+LIVE_EVENTS_KEEPALIVE = config('LIVE_EVENTS_KEEPALIVE', default=15, cast=int)
+LIVE_EVENTS_MAX_AGE = config('LIVE_EVENTS_MAX_AGE', default=300, cast=int)
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -139,6 +211,13 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_CREDENTIALS = True
 
+# 재시도 시 같은 응답을 받기 위한 Idempotency-Key 요청 헤더 허용
+from corsheaders.defaults import default_headers
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
+
+# 저장된 응답을 다시 보냈는지 알려주는 응답 헤더를 프론트엔드에서 읽을 수 있도록 허용
+CORS_EXPOSE_HEADERS = ['Idempotent-Replayed']
+
 # 로그 설정
 LOGGING = {
     'version': 1,
@@ -1,7 +1,9 @@
 # Django의 관리자 사이트와 URL 관련 기능을 가져옴
 from django.contrib import admin
 from django.urls import path, include, re_path # re_path 추가
-from django.views.static import serve # serve 뷰 임포트
+
+# 프로덕션용 미디어 서빙 뷰 (ETag, Range, 장기 캐시 지원)
+from core.views import serve_media
 
 # 미디어 파일 서빙을 위한 기능을 가져옴
 from django.conf import settings
@@ -16,10 +18,11 @@ urlpatterns = [
 ]
 
 # 미디어 파일을 서빙하기 위한 설정 (프로덕션에서도 강제)
-# DEBUG=False일 때 static 헬퍼는 작동하지 않으므로, serve 뷰를 직접 사용
+# DEBUG=False일 때 static 헬퍼는 작동하지 않으므로, serve_media 뷰를 직접 사용
+# (MEDIA_SENDFILE_BACKEND 설정 시 실제 전송은 nginx/Apache가 담당)
 if not settings.DEBUG:
     urlpatterns += [
-        re_path(r'^media/(?P<path>.*)', serve, {'document_root': settings.MEDIA_ROOT}),
+        re_path(r'^media/(?P<path>.*)', serve_media, name='serve-media'),
     ]
 
 # 개발 환경에서만 정적 파일 서빙 설정
@@ -48,11 +51,13 @@ GET    /api/accommodations/                        - 모든 숙소 목록 조회
 POST   /api/accommodations/                        - 새로운 숙소 생성
 GET    /api/accommodations/stats/                  - 숙소 통계 정보
 GET    /api/accommodations/popular/                - 인기 숙소 목록
+GET    /api/accommodations/ranking/                - 숙소 랭킹 (method, limit, offset)
 GET    /api/accommodations/{id}/                   - 특정 숙소 정보 조회
 PUT    /api/accommodations/{id}/                   - 특정 숙소 정보 수정
 DELETE /api/accommodations/{id}/                   - 특정 숙소 삭제
 GET    /api/accommodations/{id}/images/            - 특정 숙소의 이미지 목록
 POST   /api/accommodations/{id}/images/upload/     - 숙소 이미지 업로드
+POST   /api/accommodations/{id}/images/bulk-upload/ - 숙소 이미지 일괄 업로드
 GET    /api/accommodations/{id}/votes/             - 특정 숙소의 투표 목록
 GET    /api/accommodations/{id}/comments/          - 특정 숙소의 댓글 목록
 DELETE /api/accommodations/images/{id}/            - 특정 이미지 삭제
@@ -77,6 +82,22 @@ DELETE /api/comments/{id}/             - 특정 댓글 삭제
 GET    /admin/                         - Django 관리자 페이지
 GET    /docs/                          - API 문서 페이지
 
+=== 페이지네이션 ===
+/api/accommodations/, /api/votes/, /api/users/{id}/votes/, /api/accommodations/{id}/votes/
+  ?page=2                - 페이지 번호 방식 (기본, count 포함)
+  ?cursor=&page_size=50  - 커서 방식 (생성일 기준, 응답의 next/previous URL로 이동, count 없음)
+
+=== 투표 목록 형식 (/api/votes/, /api/users/{id}/votes/, /api/accommodations/{id}/votes/) ===
+  기본                               - {id, user_id, accommodation_id, rating, created_at, updated_at}
+  ?include=users,accommodations     - 응답에 'users', 'accommodations' (ID별로 한 번씩) 추가
+  ?nested=true                      - 사용자/숙소 정보를 투표마다 중첩하는 기존 형식
+
+=== 필드 선택 (숙소/이미지/투표 목록·상세 GET) ===
+  ?fields=id,name,price             - 지정한 필드만 응답 (조회 컬럼도 줄어듦)
+  ?fields=id,accommodation.name     - 점(.)으로 중첩 객체의 필드 지정
+  ?expand=images                    - 중첩 객체는 fields나 expand에 적은 경우에만 포함
+
 === 미디어 파일 ===
-GET    /media/accommodations/{id}/{파일명}  - 업로드된 숙소 이미지 파일
+GET    /media/accommodations/sha256/{xx}/{yy}/{해시}.{확장자} - 업로드된 숙소 이미지 파일 (1년 immutable 캐시)
+GET    /media/accommodations/{id}/{파일명}  - 기존 방식으로 업로드된 숙소 이미지 파일
 """
\ No newline at end of file
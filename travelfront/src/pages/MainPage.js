@@ -429,7 +429,7 @@ const MainPage = () => {
               <div className="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 gap-2">
                 {console.log('Users:', users, 'Current Accommodation Votes:', currentAccommodationVotes)}
                 {users.map((user) => {
-                  const hasVoted = currentAccommodationVotes.some(vote => vote.user.id === user.id);
+                  const hasVoted = currentAccommodationVotes.some(vote => vote.user_id === user.id);
                   return (
                     <div
                       key={user.id}
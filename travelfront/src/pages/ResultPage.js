@@ -10,6 +10,9 @@ import { Settings, Edit, Crown, Medal, Award } from 'lucide-react';
 // Context Hook
 import { useApp } from '../context/AppContext';
 
+// 실시간 랭킹 스트림 구독
+import voteService from '../services/voteService';
+
 // 유틸리티 함수
 import { formatPrice } from '../utils/helpers';
 
@@ -34,6 +37,8 @@ const ResultPage = () => {
         participationRate: 0,
         totalAccommodations: 0,
     });
+    // 실시간 스트림으로 받은 숙소별 최신 집계 ({ 숙소ID: { vote_count, average_rating } })
+    const [liveStats, setLiveStats] = useState({});
 
     // 컴포넌트 마운트 시 데이터 로드 및 결과 계산
     useEffect(() => {
@@ -42,16 +47,33 @@ const ResultPage = () => {
     }, []); // 빈 배열: 컴포넌트 마운트 시 한 번만 실행
 
     useEffect(() => {
-        // accommodations가 업데이트될 때마다 결과 계산
+        // 다른 사람이 투표하면 전체 목록을 다시 불러오지 않고 바뀐 숙소의 집계만 반영
+        const unsubscribe = voteService.subscribeToRanking((rows) => {
+            setLiveStats((previous) => {
+                const next = { ...previous };
+                rows.forEach((row) => {
+                    next[row.id] = { vote_count: row.vote_count, average_rating: row.average_rating };
+                });
+                return next;
+            });
+        });
+        return unsubscribe; // 페이지를 떠나면 연결 종료
+    }, []);
+
+    useEffect(() => {
+        // accommodations 또는 실시간 집계가 업데이트될 때마다 결과 계산
         if (accommodations.length > 0) {
             calculateResults();
         }
-    }, [accommodations]); // accommodations가 변경될 때만 calculateResults 호출
+    }, [accommodations, liveStats]);
 
     // 결과 계산 및 정렬
     const calculateResults = () => {
+        // 실시간 스트림으로 받은 최신 집계를 덮어씀
+        const merged = accommodations.map((acc) => ({ ...acc, ...liveStats[acc.id] }));
+
         // 평균 평점 기준으로 내림차순 정렬
-        const sorted = [...accommodations].sort((a, b) => {
+        const sorted = [...merged].sort((a, b) => {
             // 평점이 같으면 투표 수로 비교
             if (b.average_rating === a.average_rating) {
                 return (b.vote_count || 0) - (a.vote_count || 0);
@@ -62,8 +84,8 @@ const ResultPage = () => {
         setSortedAccommodations(sorted);
 
         // 전체 통계 계산
-        const totalVotes = accommodations.reduce((sum, acc) => sum + (acc.vote_count || 0), 0);
-        const totalRating = accommodations.reduce((sum, acc) => sum + (acc.average_rating || 0), 0);
+        const totalVotes = merged.reduce((sum, acc) => sum + (acc.vote_count || 0), 0);
+        const totalRating = merged.reduce((sum, acc) => sum + (acc.average_rating || 0), 0);
         const averageRating = accommodations.length > 0 ? totalRating / accommodations.length : 0;
         const participationRate = (totalVotes / (14 * accommodations.length)) * 100; // 14명 기준
 
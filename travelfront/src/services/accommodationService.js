@@ -84,6 +84,31 @@ const accommodationService = {
         }
     },
 
+    // 숙소 이미지 여러 장 일괄 업로드 (관리자 전용)
+    uploadImages: async (accommodationId, imageFiles, altTexts = []) => {
+        try {
+            const formData = new FormData();
+            imageFiles.forEach((imageFile, index) => {
+                formData.append('images', imageFile);
+                formData.append('alt_text', altTexts[index] || '');
+            });
+
+            const response = await api.post(
+                `/accommodations/${accommodationId}/images/bulk-upload/`,
+                formData,
+                {
+                    headers: {
+                        'Content-Type': 'multipart/form-data',
+                    },
+                }
+            );
+            return response.data;
+        } catch (error) {
+            console.error('이미지 일괄 업로드 실패:', error);
+            throw error;
+        }
+    },
+
     // 숙소 이미지 목록 조회
     getAccommodationImages: async (accommodationId) => {
         try {
@@ -126,6 +151,17 @@ const accommodationService = {
             console.error('인기 숙소 조회 실패:', error);
             throw error;
         }
+    },
+
+    // 숙소 랭킹 조회 (method: mean | bayesian | wilson, limit, offset)
+    getRanking: async (params = {}) => {
+        try {
+            const response = await api.get('/accommodations/ranking/', { params });
+            return response.data;
+        } catch (error) {
+            console.error('숙소 랭킹 조회 실패:', error);
+            throw error;
+        }
     }
 };
 
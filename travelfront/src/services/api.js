@@ -16,6 +16,11 @@ const api = axios.create({
 // 요청 인터셉터 (모든 API 요청 전에 실행)
 api.interceptors.request.use(
     (config) => {
+        // POST 요청에는 Idempotency-Key를 붙여 재시도해도 서버에서 한 번만 처리되도록 함
+        // (같은 config로 재시도하면 처음 만든 키를 그대로 사용)
+        if (config.method === 'post' && !config.headers['Idempotency-Key'] && window.crypto?.randomUUID) {
+            config.headers['Idempotency-Key'] = window.crypto.randomUUID();
+        }
         console.log(`API 요청: ${config.method?.toUpperCase()} ${config.url}`);
         return config;
     },
@@ -37,4 +42,7 @@ api.interceptors.response.use(
     }
 );
 
+// EventSource처럼 axios를 쓰지 않는 요청에서도 같은 서버 주소를 사용하도록 내보냄
+export { API_BASE_URL };
+
 export default api;
\ No newline at end of file
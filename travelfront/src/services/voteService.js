@@ -1,5 +1,5 @@
 // API 인스턴스 import
-import api from './api';
+import api, { API_BASE_URL } from './api';
 
 // 투표 관련 API 서비스 객체
 const voteService = {
@@ -29,6 +29,20 @@ const voteService = {
         }
     },
 
+    // 여러 숙소 투표를 한 번에 생성 또는 수정 (votes: [{ accommodation_id, rating }, ...])
+    submitVotes: async (userId, votes) => {
+        try {
+            const response = await api.post('/votes/batch/', {
+                user_id: userId,
+                votes: votes
+            });
+            return response.data;
+        } catch (error) {
+            console.error('일괄 투표 실패:', error);
+            throw error;
+        }
+    },
+
     // 특정 투표 조회
     getVoteById: async (voteId) => {
         try {
@@ -73,6 +87,20 @@ const voteService = {
         }
     },
 
+    // 실시간 랭킹 스트림 구독 (onRows: 바뀐 숙소 행 목록을 받는 콜백, 반환값: 구독 해지 함수)
+    // 처음에는 전체 랭킹(snapshot), 이후에는 투표가 저장될 때마다 바뀐 숙소만(ranking) 전달
+    subscribeToRanking: (onRows) => {
+        if (!window.EventSource) {
+            return () => {};
+        }
+        const source = new EventSource(`${API_BASE_URL}/votes/stream/`);
+        source.addEventListener('snapshot', (event) => onRows(JSON.parse(event.data).results));
+        source.addEventListener('ranking', (event) => onRows(JSON.parse(event.data).changed));
+        // 연결이 끊기면 EventSource가 자동으로 다시 연결하고 새 스냅샷을 받음
+        source.onerror = () => console.warn('실시간 랭킹 연결이 끊어졌습니다. 다시 연결합니다.');
+        return () => source.close();
+    },
+
     // 투표 통계 정보 조회
     getVoteStats: async () => {
         try {
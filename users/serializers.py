@@ -1,12 +1,15 @@
 # Django REST Framework의 serializers 모듈을 가져옴
 from rest_framework import serializers
 
+# ?fields= / ?expand= 지원 믹스인
+from core.serializers import DynamicFieldsMixin
+
 # 현재 앱의 User 모델을 가져옴
 from .models import User
 
 
 # 기본 User 정보를 JSON으로 변환하는 Serializer
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     사용자 정보를 JSON 형태로 직렬화/역직렬화하는 클래스
     GET 요청 시 사용자 정보를 JSON으로 반환
@@ -6,6 +6,8 @@ from . import views
 
 # votes 앱에서 필요한 뷰들 가져오기 (accommodations가 아닌 votes에서!)
 from votes.views import user_activity_summary, UserVoteListView
+from votes.async_views import user_votes
+from core.async_views import select_view
 
 # 앱 이름 설정
 app_name = 'users'
@@ -20,5 +22,5 @@ urlpatterns = [
 
     # votes 앱에서 가져온 함수와 클래스들 사용
     path('users/<int:user_id>/activity/', user_activity_summary, name='user-activity'),
-    path('users/<int:user_id>/votes/', UserVoteListView.as_view(), name='user-votes'),
+    path('users/<int:user_id>/votes/', select_view(user_votes, UserVoteListView.as_view()), name='user-votes'),
 ]
\ No newline at end of file
@@ -8,6 +8,13 @@ from rest_framework.response import Response
 
 # Django의 단축 함수들을 가져옴
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+
+# 테이블 버전 기반 조건부 GET (ETag / Last-Modified, 304)
+from core.versions import conditional_on_tables
+
+# 테이블 버전 기반 응답 캐시
+from core.cache import cache_response_on_tables
 
 # 현재 앱의 모델과 serializers를 가져옴
 from .models import User
@@ -15,6 +22,7 @@ from .serializers import UserSerializer, UserCreateSerializer, UserLoginSerializ
 
 
 # 모든 사용자 조회 및 새 사용자 생성을 위한 API View
+@method_decorator(conditional_on_tables('users'), name='get')
 class UserListCreateView(generics.ListCreateAPIView):
     """
     GET: 모든 사용자 목록 조회
@@ -186,6 +194,8 @@ def check_admin(request, user_id):
 
 # 사용자 통계 정보를 위한 함수형 API View
 @api_view(['GET'])
+@conditional_on_tables('users')
+@cache_response_on_tables('users')
 def user_stats(request):
     """
     사용자 통계 정보 조회
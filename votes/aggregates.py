@@ -0,0 +1,148 @@
+# 투표 변경 사항을 숙소의 집계 컬럼(vote_count, rating_sum)에 반영하는 모듈
+from collections import defaultdict, namedtuple
+
+# Django의 데이터베이스 관련 기능을 가져옴
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+
+# 다른 앱의 모델과 테이블 버전 함수를 가져옴
+from accommodations.models import Accommodation
+from core.versions import bump_table_versions
+
+# 평점 분포 요약 테이블 함수
+from .summary import apply_summary_changes, vote_summary_enabled
+
+# 실시간 랭킹 스트림 발행 예약 함수
+from .live import schedule_ranking_update
+
+# 투표 이벤트 기록 함수
+from .history import record_vote_events
+
+# 투표 추이의 지난 구간 캐시 무효화 함수
+from .trend import invalidate_vote_trend
+
+
+# 하나의 투표 변경을 표현하는 자료형
+# 생성: old_rating=None, 삭제: new_rating=None, 수정: 둘 다 값 존재
+VoteChange = namedtuple('VoteChange', ['user_id', 'accommodation_id', 'old_rating', 'new_rating'])
+
+
+# 투표 변경 목록을 숙소 집계 컬럼에 반영하는 함수
+def apply_vote_changes(changes):
+    """
+    투표 변경 목록을 숙소별 변화량으로 합산한 뒤 UPDATE 한 번으로 반영
+    (여러 숙소가 바뀐 일괄 투표는 CASE 식으로 숙소 수와 관계없이 한 번)
+    F() 표현식을 사용하므로 동시에 들어온 투표끼리 값을 덮어쓰지 않음
+    changes: VoteChange 목록
+    """
+    # 숙소 ID -> [투표 수 변화량, 평점 합계 변화량]
+    deltas = defaultdict(lambda: [0, 0])
+
+    for change in changes:
+        if change.old_rating is not None:
+            deltas[change.accommodation_id][0] -= 1
+            deltas[change.accommodation_id][1] -= change.old_rating
+        if change.new_rating is not None:
+            deltas[change.accommodation_id][0] += 1
+            deltas[change.accommodation_id][1] += change.new_rating
+
+    # 평점만 같은 값으로 다시 저장된 경우처럼 변화가 없는 숙소는 제외
+    deltas = {
+        accommodation_id: delta for accommodation_id, delta in deltas.items() if delta[0] or delta[1]
+    }
+
+    if len(deltas) == 1:
+        [(accommodation_id, (count_delta, sum_delta))] = deltas.items()
+        Accommodation.objects.filter(pk=accommodation_id).update(
+            vote_count=F('vote_count') + count_delta,
+            rating_sum=F('rating_sum') + sum_delta,
+        )
+    elif deltas:
+        # 숙소별 변화량을 CASE 식으로 한 번에 반영
+        def delta_case(position):
+            return Case(
+                *[When(pk=accommodation_id, then=Value(delta[position])) for accommodation_id, delta in deltas.items()],
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+
+        Accommodation.objects.filter(pk__in=deltas).update(
+            vote_count=F('vote_count') + delta_case(0),
+            rating_sum=F('rating_sum') + delta_case(1),
+        )
+
+    # 투표 이벤트도 같은 트랜잭션에서 추가 (과거 시점 랭킹 재계산용)
+    record_vote_events(changes)
+
+    # 평점 분포 요약 테이블도 같은 트랜잭션에서 갱신
+    if vote_summary_enabled():
+        apply_summary_changes(changes)
+
+    # 지난 구간의 투표가 바뀌었으면 커밋 후 추이 캐시 무효화
+    invalidate_vote_trend(changes)
+
+    # 커밋 후 실시간 스트림 구독자에게 랭킹 변화량 발행
+    if deltas:
+        schedule_ranking_update()
+
+
+# 실제 투표 테이블 기준의 집계값을 숙소마다 계산하는 서브쿼리들을 만드는 함수
+def _actual_aggregate_subqueries(vote_model):
+    votes = vote_model.objects.filter(
+        accommodation=OuterRef('pk')
+    ).order_by().values('accommodation')
+
+    actual_count = Coalesce(
+        Subquery(votes.annotate(total=Count('id')).values('total'), output_field=IntegerField()),
+        Value(0),
+    )
+    actual_sum = Coalesce(
+        Subquery(votes.annotate(total=Sum('rating')).values('total'), output_field=IntegerField()),
+        Value(0),
+    )
+    return actual_count, actual_sum
+
+
+# 투표 테이블에서 집계 컬럼을 처음부터 다시 계산하는 함수
+def rebuild_vote_aggregates():
+    """
+    모든 숙소의 vote_count, rating_sum을 투표 테이블 기준으로 다시 계산
+    숙소 수와 관계없이 UPDATE 한 번으로 처리
+    반환값: 갱신된 숙소 수
+    """
+    from .models import Vote
+
+    actual_count, actual_sum = _actual_aggregate_subqueries(Vote)
+
+    with transaction.atomic():
+        updated = Accommodation.objects.update(
+            vote_count=actual_count,
+            rating_sum=actual_sum,
+        )
+        # QuerySet.update()는 시그널이 없으므로 테이블 버전을 직접 올림
+        bump_table_versions('accommodations')
+        return updated
+
+
+# 저장된 집계 컬럼과 실제 투표 테이블이 어긋난 숙소를 찾는 함수
+def find_vote_aggregate_drift():
+    """
+    저장된 집계값과 실제 집계값이 다른 숙소 목록을 반환
+    반환값: [{'id', 'name', 'vote_count', 'actual_count', 'rating_sum', 'actual_sum'}, ...]
+    """
+    from .models import Vote
+
+    actual_count, actual_sum = _actual_aggregate_subqueries(Vote)
+
+    return list(
+        Accommodation.objects.annotate(
+            actual_count=actual_count,
+            actual_sum=actual_sum,
+        ).exclude(
+            vote_count=F('actual_count'),
+            rating_sum=F('actual_sum'),
+        ).order_by('id').values(
+            'id', 'name', 'vote_count', 'actual_count', 'rating_sum', 'actual_sum'
+        )
+    )
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class VotesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'votes'
+
+    def ready(self):
+        # 투표 변경 시 숙소 집계 컬럼을 갱신하는 시그널 핸들러 등록
+        from . import signals  # noqa: F401
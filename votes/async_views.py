@@ -0,0 +1,68 @@
+# ASGI 서버용 투표 조회 API 비동기 View 모음 (settings.ASYNC_VIEWS가 켜져 있을 때 urls.py에서 사용)
+
+# 비동기 View 공통 도구
+from core.async_views import async_read_view, json_response, paginate_page_number
+from core.cache import cache_response_on_tables
+from core.versions import conditional_on_tables
+
+# 현재 앱의 serializer, 평점 분포 함수, 동기 View를 가져옴
+from .serializers import VoteCompactSerializer
+from .summary import aget_rating_histogram, aget_voter_count, summarize_histogram
+from . import views
+
+# 다른 앱의 모델을 가져옴
+from users.models import User
+
+
+# 투표 통계 조회
+@async_read_view(views.vote_stats, params=('accommodation_id',))
+@conditional_on_tables('votes', 'users')
+@cache_response_on_tables('votes', 'users')
+async def vote_stats(request):
+    """
+    URL: /api/votes/stats/ (응답은 vote_stats와 같음)
+    잘못된 accommodation_id의 400 응답은 동기 View가 만듦
+    """
+    accommodation_id = request.GET.get('accommodation_id')
+    if accommodation_id is not None and not accommodation_id.isdigit():
+        return None
+
+    histogram = await aget_rating_histogram(int(accommodation_id) if accommodation_id else None)
+    rating_distribution = {str(rating): count for rating, count in histogram.items()}
+    total_votes, average_rating = summarize_histogram(histogram)
+
+    total_users = await User.objects.acount()
+    voted_users = total_votes if accommodation_id else await aget_voter_count()
+    participation_rate = (voted_users / total_users * 100) if total_users > 0 else 0
+
+    return json_response({
+        'total_votes': total_votes,
+        'average_rating': round(average_rating, 1),
+        'rating_distribution': rating_distribution,
+        'participation_rate': round(participation_rate, 1),
+        'voted_users': voted_users,
+        'total_users': total_users,
+        'message': '투표 통계 정보입니다.'
+    })
+
+
+# 특정 사용자의 투표 목록 조회 (기본 간단한 형식과 ?page= 만 비동기로 처리)
+@async_read_view(views.UserVoteListView.as_view(), params=('page',))
+@conditional_on_tables(*views.VOTE_LIST_TABLES)
+async def user_votes(request, user_id):
+    """
+    URL: /api/users/{user_id}/votes/
+    응답은 UserVoteListView의 기본 응답과 같음 (?include= / ?nested= / ?cursor= 는 동기 View가 처리)
+    """
+    context = {'request': request, 'requested_fields': None}
+    queryset = views.get_vote_queryset(VoteCompactSerializer(context=context)).filter(
+        user_id=user_id
+    ).order_by('-created_at', '-id')
+
+    page = await paginate_page_number(request, queryset)
+    if page is None:
+        return None
+    votes, pagination = page
+
+    serializer = VoteCompactSerializer(votes, many=True, context=context)
+    return json_response({**pagination, 'results': serializer.data})
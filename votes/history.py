@@ -0,0 +1,213 @@
+# 투표 이벤트 기록과 과거 시점의 숙소 집계/랭킹 재계산을 담당하는 모듈
+import logging
+import math
+from datetime import timedelta
+
+# Django 설정, 트랜잭션, 시간 관련 기능을 가져옴
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+# 다른 앱의 모델을 가져옴
+from accommodations.models import Accommodation
+
+# 현재 앱의 모델을 가져옴
+from .models import VoteEvent, VoteSnapshot
+
+
+# 스냅샷에 넣지 않을 최근 이벤트 구간
+# (PostgreSQL에서는 먼저 ID를 받은 트랜잭션이 나중에 커밋될 수 있어, 아직 커밋되지 않은 이벤트를 건너뛴 스냅샷이 생기지 않도록 함)
+SNAPSHOT_SAFETY_LAG = timedelta(minutes=1)
+
+# 이벤트를 다시 적용할 때 한 번에 읽어 올 행 수
+REPLAY_CHUNK_SIZE = 2000
+
+logger = logging.getLogger(__name__)
+
+
+# 투표 변경의 이벤트 종류를 반환하는 함수
+def get_event_kind(change):
+    if change.old_rating is None:
+        return VoteEvent.CREATED
+    if change.new_rating is None:
+        return VoteEvent.DELETED
+    return VoteEvent.UPDATED
+
+
+# 투표 변경 목록을 이벤트 테이블에 추가하는 함수
+def record_vote_events(changes):
+    """
+    apply_vote_changes()에서 호출 (투표 변경과 같은 트랜잭션, INSERT 한 번)
+    평점이 그대로인 변경은 기록하지 않음
+    새 이벤트 ID가 VOTE_SNAPSHOT_INTERVAL의 배수를 지나면 커밋 후 스냅샷을 만듦
+    """
+    now = timezone.now()
+    events = VoteEvent.objects.bulk_create([
+        VoteEvent(
+            kind=get_event_kind(change),
+            user_id=change.user_id,
+            accommodation_id=change.accommodation_id,
+            old_rating=change.old_rating,
+            new_rating=change.new_rating,
+            created_at=now,
+        )
+        for change in changes
+        if change.old_rating != change.new_rating
+    ])
+
+    interval = settings.VOTE_SNAPSHOT_INTERVAL
+    if not interval or not events or events[0].pk is None:
+        return events
+
+    first_id, last_id = events[0].pk, events[-1].pk
+    if (first_id - 1) // interval != last_id // interval:
+        transaction.on_commit(_take_snapshot_after_commit)
+    return events
+
+
+# 커밋 후 스냅샷 생성 중 오류가 나도 투표 응답에는 영향을 주지 않도록 하는 함수
+def _take_snapshot_after_commit():
+    try:
+        take_vote_snapshot()
+    except Exception:
+        logger.exception('투표 스냅샷 생성 실패')
+
+
+# 특정 이벤트까지 반영한 숙소별 집계를 계산하는 함수
+def get_aggregates_as_of(event_id):
+    """
+    event_id 이하의 가장 가까운 스냅샷에서 시작해 그 이후 이벤트만 다시 적용
+    반환값: {숙소 ID: [투표 수, 평점 합계]} (투표가 있는 숙소만)
+    """
+    snapshot = VoteSnapshot.objects.filter(event_id__lte=event_id).order_by('-event_id').first()
+
+    aggregates = {}
+    start = 0
+    if snapshot is not None:
+        aggregates = {int(key): list(value) for key, value in snapshot.aggregates.items()}
+        start = snapshot.event_id
+
+    events = VoteEvent.objects.filter(id__gt=start, id__lte=event_id).order_by('id').values_list(
+        'accommodation_id', 'old_rating', 'new_rating'
+    )
+    for accommodation_id, old_rating, new_rating in events.iterator(chunk_size=REPLAY_CHUNK_SIZE):
+        aggregate = aggregates.setdefault(accommodation_id, [0, 0])
+        if old_rating is not None:
+            aggregate[0] -= 1
+            aggregate[1] -= old_rating
+        if new_rating is not None:
+            aggregate[0] += 1
+            aggregate[1] += new_rating
+
+    return {accommodation_id: value for accommodation_id, value in aggregates.items() if value[0]}
+
+
+# 현재까지의 이벤트로 스냅샷을 만드는 함수
+def take_vote_snapshot(event_id=None):
+    """
+    event_id: 스냅샷에 반영할 마지막 이벤트 ID
+              (None이면 SNAPSHOT_SAFETY_LAG보다 오래된 이벤트 중 마지막 이벤트)
+    반환값: VoteSnapshot (반영할 이벤트가 없으면 None)
+    """
+    if event_id is None:
+        event_id = VoteEvent.objects.filter(
+            created_at__lte=timezone.now() - SNAPSHOT_SAFETY_LAG
+        ).aggregate(last=Max('id'))['last']
+    if not event_id:
+        return None
+
+    existing = VoteSnapshot.objects.filter(event_id=event_id).first()
+    if existing is not None:
+        return existing
+
+    aggregates = get_aggregates_as_of(event_id)
+    snapshot, _ = VoteSnapshot.objects.get_or_create(
+        event_id=event_id,
+        defaults={'aggregates': {str(key): value for key, value in aggregates.items()}},
+    )
+    return snapshot
+
+
+# 시각을 그 시각까지 발생한 마지막 이벤트 ID로 바꾸는 함수
+def get_event_id_at(moment):
+    """
+    반환값: moment 이전(포함)의 마지막 이벤트 ID (이벤트가 없으면 0)
+    """
+    return VoteEvent.objects.filter(created_at__lte=moment).order_by('-created_at', '-id').values_list(
+        'id', flat=True
+    ).first() or 0
+
+
+# 숙소별 집계로 랭킹 점수를 계산하는 함수 (AccommodationQuerySet.with_score와 같은 식)
+def calculate_score(vote_count, rating_sum, method, prior_mean, prior_weight, z=1.96):
+    if not vote_count:
+        return float(prior_mean) if method == 'bayesian' else 0.0
+
+    mean = rating_sum / vote_count
+    if method == 'mean':
+        return mean
+    if method == 'bayesian':
+        return (prior_mean * prior_weight + rating_sum) / (prior_weight + vote_count)
+
+    # wilson: 평점을 0~1로 정규화한 신뢰구간 하한을 다시 1~10점으로 환산
+    p = (mean - 1.0) / 9.0
+    z2 = z * z
+    lower_bound = (
+        p + z2 / 2 / vote_count
+        - z * math.sqrt((p * (1.0 - p) + z2 / 4 / vote_count) / vote_count)
+    ) / (1.0 + z2 / vote_count)
+    return 1.0 + lower_bound * 9.0
+
+
+# 특정 이벤트 시점의 숙소 랭킹을 계산하는 함수
+def get_ranking_as_of(event_id, method='bayesian', prior_weight=None):
+    """
+    랭킹 대상: 그 시점에 투표가 있던 숙소 + 그 시점 이전에 등록된 현재 숙소
+    (이후 삭제된 숙소는 이름 없이 ID만 표시)
+    반환값: (prior_mean, prior_weight, [{'id', 'name', 'score', 'vote_count', 'rating_sum', 'rank', 'tie_group'}, ...])
+            (행 형식은 accommodations.views.get_ranking_queryset과 같아 build_ranking_response에 그대로 사용)
+    """
+    aggregates = get_aggregates_as_of(event_id)
+
+    # 기준 시각 (이벤트가 없으면 현재)
+    moment = VoteEvent.objects.filter(id=event_id).values_list('created_at', flat=True).first() or timezone.now()
+    names = dict(
+        Accommodation.objects.filter(created_at__lte=moment).order_by().values_list('id', 'name')
+    )
+    missing = set(aggregates) - set(names)
+    if missing:
+        names.update(Accommodation.objects.filter(id__in=missing).order_by().values_list('id', 'name'))
+
+    accommodation_ids = set(names) | set(aggregates)
+
+    # 전체 평균 평점과 숙소당 평균 투표 수 (AccommodationQuerySet.rating_prior와 같은 식)
+    total_votes = sum(count for count, _ in aggregates.values())
+    total_sum = sum(rating_sum for _, rating_sum in aggregates.values())
+    prior_mean, default_prior_weight = (
+        (total_sum / total_votes, total_votes / len(accommodation_ids)) if total_votes else (0.0, 0.0)
+    )
+    if prior_weight is None:
+        prior_weight = default_prior_weight
+
+    rows = []
+    for accommodation_id in accommodation_ids:
+        vote_count, rating_sum = aggregates.get(accommodation_id, (0, 0))
+        rows.append({
+            'id': accommodation_id,
+            'name': names.get(accommodation_id),
+            'score': calculate_score(vote_count, rating_sum, method, prior_mean, prior_weight),
+            'vote_count': vote_count,
+            'rating_sum': rating_sum,
+        })
+
+    # 점수 순, 투표 수 순, ID 순 정렬 후 순위(1, 1, 3)와 동점 그룹(1, 1, 2) 계산
+    rows.sort(key=lambda row: (-row['score'], -row['vote_count'], row['id']))
+    previous_score, rank, tie_group = None, 0, 0
+    for position, row in enumerate(rows, start=1):
+        if row['score'] != previous_score:
+            previous_score, rank, tie_group = row['score'], position, tie_group + 1
+        row['rank'] = rank
+        row['tie_group'] = tie_group
+
+    return prior_mean, prior_weight, rows
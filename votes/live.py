@@ -0,0 +1,212 @@
+# 투표 변경 후 숙소 랭킹 변화량을 실시간 스트림(SSE) 구독자에게 발행하는 모듈
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Django 설정, 캐시, 트랜잭션 기능을 가져옴
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+
+# 다른 앱의 모델과 발행/구독 브로커를 가져옴
+from accommodations.models import Accommodation
+from core.broker import RESYNC_EVENT, InProcessBroker, format_sse, get_broker
+
+# 동기 ORM 함수를 비동기 코드에서 호출하기 위한 함수
+from asgiref.sync import sync_to_async
+
+
+# 랭킹 이벤트 채널 이름
+RANKING_CHANNEL = 'ranking'
+
+# 마지막으로 발행한 랭킹을 저장하는 캐시 키 (변화량 계산 기준)
+RANKING_SNAPSHOT_KEY = 'live:ranking'
+
+# 랭킹 계산-비교-저장을 한 번에 하나만 실행하기 위한 잠금 키와 '다시 계산 필요' 표시 키
+RANKING_LOCK_KEY = 'live:ranking:lock'
+RANKING_PENDING_KEY = 'live:ranking:pending'
+
+# 스트림 랭킹 계산 방식 (랭킹 API 기본값과 같음)
+RANKING_METHOD = 'bayesian'
+
+logger = logging.getLogger(__name__)
+
+# 커밋 후 랭킹 발행을 요청 스레드 밖에서 실행하는 스레드 풀 (처음 사용할 때 생성)
+_executor = None
+
+# 아직 시작하지 않은 발행 작업이 대기 중인지 표시 (그 작업이 이후 커밋도 함께 반영하므로 더 넣지 않음)
+_publish_queued = threading.Event()
+
+
+# 현재 랭킹을 {숙소 ID: 행} 형태로 계산하는 함수
+def get_ranking_rows():
+    """
+    저장된 집계 컬럼으로 점수/순위를 계산 (사전 분포 집계 1회 + 랭킹 쿼리 1회)
+    행: {'id', 'rank', 'score', 'vote_count', 'average_rating'}
+    """
+    prior_mean, prior_weight = Accommodation.objects.rating_prior()
+    ranking = Accommodation.objects.ranked(
+        RANKING_METHOD, prior_mean=prior_mean, prior_weight=prior_weight
+    ).values('id', 'vote_count', 'rating_sum', 'score', 'rank')
+
+    rows = {}
+    for row in ranking:
+        rows[row['id']] = {
+            'id': row['id'],
+            'rank': row['rank'],
+            'score': round(row['score'], 3),
+            'vote_count': row['vote_count'],
+            'average_rating': round(row['rating_sum'] / row['vote_count'], 1) if row['vote_count'] else 0,
+        }
+    return rows
+
+
+# 스트림 연결 직후 보내는 전체 랭킹 스냅샷을 만드는 함수
+def get_ranking_snapshot():
+    rows = get_ranking_rows()
+    return {'method': RANKING_METHOD, 'results': list(rows.values())}
+
+
+# 이전 랭킹과 현재 랭킹의 차이를 계산하는 함수
+def diff_ranking(previous, current):
+    """
+    반환값: {'changed': [바뀌거나 새로 생긴 행, ...], 'removed': [삭제된 숙소 ID, ...]}
+    전체 평균이 바뀌면 다른 숙소의 점수/순위도 함께 바뀌므로 투표된 숙소만이 아닌 전체를 비교
+    """
+    changed = [row for accommodation_id, row in current.items() if previous.get(accommodation_id) != row]
+    removed = sorted(accommodation_id for accommodation_id in previous if accommodation_id not in current)
+    return {'changed': changed, 'removed': removed}
+
+
+# 현재 랭킹을 계산해 바뀐 부분만 발행하는 함수
+def publish_ranking_update():
+    """
+    커밋 후 실행 (반환값: 마지막으로 발행한 변화량, 바뀐 것이 없으면 None)
+    같은 프로세스 안에만 전달하는 브로커인데 구독자가 없으면 계산하지 않음
+    (기준 랭킹이 오래되어도 다음 비교에서 변화량이 더 많이 잡힐 뿐 결과는 맞음)
+
+    계산-비교-저장은 잠금(cache.add) 안에서 하나씩 실행
+    (동시에 계산하면 늦게 끝난 오래된 랭킹이 기준 랭킹을 덮어쓰고 투표 전 값으로 되돌리는 변화량을 보낼 수 있음)
+    잠금을 얻지 못하면 '다시 계산 필요' 표시만 남기고, 잠금을 가진 쪽이 표시가 없어질 때까지 다시 계산
+    (잠금 안의 계산은 앞선 계산보다 늦게 시작하므로 항상 같거나 더 최신 상태를 읽음, 여러 커밋은 한 번으로 합쳐짐)
+    """
+    broker = get_broker()
+    if type(broker) is InProcessBroker and not broker.subscriber_count():
+        return None
+
+    cache.set(RANKING_PENDING_KEY, 1, None)
+    delta = None
+    while cache.add(RANKING_LOCK_KEY, 1, settings.RESPONSE_CACHE_LOCK_TIMEOUT):
+        try:
+            while cache.delete(RANKING_PENDING_KEY):
+                delta = _publish_ranking_delta(broker) or delta
+        finally:
+            cache.delete(RANKING_LOCK_KEY)
+        # 잠금을 놓기 직전에 표시를 남기고 잠금을 얻지 못한 요청이 있으면 이어서 처리
+        if cache.get(RANKING_PENDING_KEY) is None:
+            break
+    return delta
+
+
+# 현재 랭킹과 기준 랭킹의 차이를 발행하고 기준 랭킹을 바꾸는 함수 (잠금 안에서만 호출)
+def _publish_ranking_delta(broker):
+    current = get_ranking_rows()
+    previous = cache.get(RANKING_SNAPSHOT_KEY)
+    cache.set(RANKING_SNAPSHOT_KEY, current, None)
+
+    # 기준 랭킹이 없으면 (서버 시작 직후/캐시 만료) 전체를 변화량으로 보냄
+    delta = diff_ranking(previous or {}, current)
+    if not delta['changed'] and not delta['removed']:
+        return None
+
+    broker.publish(RANKING_CHANNEL, 'ranking', delta)
+    return delta
+
+
+# 현재 트랜잭션이 커밋된 뒤 랭킹 변화량을 발행하도록 예약하는 함수
+def schedule_ranking_update():
+    """
+    apply_vote_changes()에서 호출 (투표 생성/수정/삭제, 일괄 투표 모두 이 경로를 거침)
+    롤백되면 발행하지 않고, 커밋된 데이터만 구독자에게 보임
+    LIVE_EVENTS_PUBLISH_BACKEND 설정에 따라 처리
+        'thread' - 발행 전용 스레드에서 처리해 투표 응답이 랭킹 계산을 기다리지 않음 (기본값)
+        'sync'   - 커밋 직후 현재 스레드에서 바로 처리 (테스트/디버깅용)
+    """
+    if not settings.LIVE_EVENTS_ENABLED:
+        return
+    if settings.LIVE_EVENTS_PUBLISH_BACKEND == 'sync':
+        transaction.on_commit(_publish_after_commit)
+    else:
+        transaction.on_commit(_submit_publish)
+
+
+# 발행 스레드 풀을 반환하는 함수 (스레드 1개: 발행 작업끼리 잠금을 다툴 필요가 없음)
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='live-ranking')
+    return _executor
+
+
+# 발행 작업을 스레드 풀에 넣는 함수 (이미 대기 중인 작업이 있으면 그 작업이 이번 커밋도 반영)
+def _submit_publish():
+    if _publish_queued.is_set():
+        return
+    _publish_queued.set()
+    _get_executor().submit(_publish_in_thread)
+
+
+# 스레드 풀에서 실행되는 발행 함수 (스레드별 DB 연결 정리 포함)
+def _publish_in_thread():
+    # 계산을 시작하기 전에 표시를 지워 이후 커밋은 새 작업을 넣도록 함
+    _publish_queued.clear()
+    close_old_connections()
+    try:
+        _publish_after_commit()
+    finally:
+        close_old_connections()
+
+
+# 커밋 후 발행 중 오류가 나도 투표 응답에는 영향을 주지 않도록 하는 함수
+def _publish_after_commit():
+    try:
+        publish_ranking_update()
+    except Exception:
+        logger.exception('실시간 랭킹 발행 실패')
+
+
+# 스냅샷 이벤트 문자열을 만드는 함수 (브라우저 재연결 대기 시간 retry 포함)
+def format_snapshot_event(snapshot):
+    return format_sse('snapshot', snapshot, retry=settings.LIVE_EVENTS_KEEPALIVE * 1000)
+
+
+# 랭킹 스트림 응답 본문을 만드는 비동기 제너레이터
+async def ranking_event_stream(snapshot, subscription):
+    """
+    1. 전체 랭킹 스냅샷 (event: snapshot)
+    2. 투표가 커밋될 때마다 바뀐 행만 (event: ranking)
+    3. 이벤트가 없으면 LIVE_EVENTS_KEEPALIVE초마다 연결 유지용 주석
+    구독자는 스레드 없이 이벤트 루프에서 대기열만 기다리므로 유휴 연결 비용이 작음
+    LIVE_EVENTS_MAX_AGE초가 지나면 응답을 끝내고 브라우저(EventSource)가 retry 후 재연결
+    (끊어진 클라이언트의 구독이 계속 남지 않도록 연결 수명을 제한)
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.LIVE_EVENTS_MAX_AGE
+    try:
+        yield format_snapshot_event(snapshot)
+        while loop.time() < deadline:
+            timeout = min(settings.LIVE_EVENTS_KEEPALIVE, deadline - loop.time())
+            event = await subscription.get(timeout)
+            if event is None:
+                # 최대 유지 시간이 끝나 기다림이 멈춘 경우는 바로 종료
+                if loop.time() < deadline:
+                    yield format_sse(comment='keepalive')
+            elif event['event'] == RESYNC_EVENT:
+                # 대기열이 넘친 느린 구독자는 전체 스냅샷을 다시 받음
+                snapshot = await sync_to_async(get_ranking_snapshot)()
+                yield format_snapshot_event(snapshot)
+            else:
+                yield format_sse(event['event'], event['data'])
+    finally:
+        get_broker().unsubscribe(subscription)
@@ -0,0 +1,59 @@
+# Django 관리 명령어 기본 클래스를 가져옴
+from django.core.management.base import BaseCommand, CommandError
+
+# 스트리밍 내보내기 공통 함수를 가져옴
+from core.export import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, iter_export
+
+# 현재 앱의 모델과 내보내기 컬럼을 가져옴
+from votes.models import Vote
+from votes.views import VOTE_EXPORT_FIELDS
+
+
+# 전체 투표를 CSV / NDJSON 파일로 내보내는 관리 명령어
+class Command(BaseCommand):
+    """
+    사용법:
+    python manage.py export_votes > votes.csv
+    python manage.py export_votes --format ndjson --output votes.ndjson
+    /api/votes/export/와 같은 내용 (dumpdata와 달리 전체를 메모리에 올리지 않고 chunk-size개씩 기록)
+    """
+
+    help = '전체 투표를 CSV 또는 NDJSON으로 내보냅니다.'
+
+    # 명령어 옵션 정의
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format',
+            default='csv',
+            choices=list(EXPORT_FORMATS),
+            help='내보낼 형식 (기본값 csv)',
+        )
+        parser.add_argument('--output', help='저장할 파일 경로 (기본값: 표준 출력)')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help=f'DB에서 한 번에 읽을 행 수 (기본값 {EXPORT_CHUNK_SIZE})',
+        )
+
+    # 명령어 실행
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size는 1 이상이어야 합니다.')
+
+        lines = iter_export(
+            Vote.objects.order_by('id'), VOTE_EXPORT_FIELDS, options['format'], options['chunk_size']
+        )
+
+        # 표준 출력: self.stdout은 줄 끝에 줄바꿈을 붙이므로 ending=''으로 그대로 기록
+        if not options['output']:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+
+        count = -1 if options['format'] == 'csv' else 0
+        with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+            for line in lines:
+                output.write(line)
+                count += 1
+        self.stdout.write(self.style.SUCCESS(f"투표 {count}개를 {options['output']}에 저장했습니다."))
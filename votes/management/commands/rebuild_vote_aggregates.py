@@ -0,0 +1,54 @@
+# Django 관리 명령어 기본 클래스를 가져옴
+from django.core.management.base import BaseCommand, CommandError
+
+# 현재 앱의 집계 함수들을 가져옴
+from votes.aggregates import find_vote_aggregate_drift, rebuild_vote_aggregates
+from votes.summary import rebuild_vote_summary, vote_summary_enabled
+
+
+# 숙소 투표 집계 컬럼을 다시 계산하고 어긋남(drift)을 점검하는 관리 명령어
+class Command(BaseCommand):
+    """
+    사용법:
+    python manage.py rebuild_vote_aggregates          # 어긋남 보고 후 전체 재계산
+    python manage.py rebuild_vote_aggregates --check  # 재계산 없이 점검만 (어긋나면 실패 코드 반환)
+    loaddata 등 시그널을 거치지 않고 투표가 들어간 경우 실행
+    """
+
+    help = '숙소의 투표 집계 컬럼(vote_count, rating_sum)과 평점 분포 요약을 투표 테이블 기준으로 다시 계산합니다.'
+
+    # 명령어 옵션 정의
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='재계산하지 않고 어긋난 숙소만 보고합니다.',
+        )
+
+    # 명령어 실행
+    def handle(self, *args, **options):
+        drift = find_vote_aggregate_drift()
+
+        # 어긋난 숙소 목록 출력
+        for row in drift:
+            self.stdout.write(
+                f"[어긋남] {row['name']} (ID {row['id']}): "
+                f"투표 수 {row['vote_count']} -> {row['actual_count']}, "
+                f"평점 합계 {row['rating_sum']} -> {row['actual_sum']}"
+            )
+
+        if options['check']:
+            if drift:
+                raise CommandError(f'{len(drift)}개 숙소의 집계값이 투표 테이블과 다릅니다.')
+            self.stdout.write(self.style.SUCCESS('모든 숙소의 집계값이 일치합니다.'))
+            return
+
+        updated = rebuild_vote_aggregates()
+        self.stdout.write(self.style.SUCCESS(
+            f'{updated}개 숙소의 집계값을 다시 계산했습니다. (어긋났던 숙소: {len(drift)}개)'
+        ))
+
+        # 평점 분포 요약 테이블 재생성
+        if vote_summary_enabled():
+            rows = rebuild_vote_summary()
+            self.stdout.write(self.style.SUCCESS(f'평점 분포 요약 {rows}행을 다시 만들었습니다.'))
@@ -0,0 +1,66 @@
+# Django 관리 명령어 기본 클래스를 가져옴
+from django.core.management.base import BaseCommand, CommandError
+
+# 현재 앱의 이벤트 기록 함수와 모델을 가져옴
+from votes.history import get_aggregates_as_of, take_vote_snapshot
+from votes.models import Vote, VoteEvent
+
+
+# 투표 이벤트 스냅샷을 만들고 이벤트 기록을 점검하는 관리 명령어
+class Command(BaseCommand):
+    """
+    사용법:
+    python manage.py snapshot_votes                # 1분 이상 지난 마지막 이벤트까지 스냅샷 생성
+    python manage.py snapshot_votes --event-id 500 # 특정 이벤트까지 스냅샷 생성
+    python manage.py snapshot_votes --check        # 이벤트를 모두 다시 적용한 결과가 현재 투표와 같은지 점검
+    스냅샷은 VOTE_SNAPSHOT_INTERVAL개 이벤트마다 자동으로도 만들어짐
+    """
+
+    help = '투표 이벤트를 숙소별 집계 스냅샷으로 저장하거나, 이벤트 기록이 현재 투표와 일치하는지 점검합니다.'
+
+    # 명령어 옵션 정의
+    def add_arguments(self, parser):
+        parser.add_argument('--event-id', type=int, help='스냅샷에 반영할 마지막 이벤트 ID')
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='스냅샷을 만들지 않고 이벤트 재적용 결과를 투표 테이블과 비교합니다.',
+        )
+
+    # 명령어 실행
+    def handle(self, *args, **options):
+        if options['check']:
+            self.check_events()
+            return
+
+        snapshot = take_vote_snapshot(options['event_id'])
+        if snapshot is None:
+            self.stdout.write('스냅샷에 반영할 이벤트가 없습니다.')
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f'이벤트 {snapshot.event_id}까지의 스냅샷을 저장했습니다. (숙소 {len(snapshot.aggregates)}개)'
+        ))
+
+    # 전체 이벤트를 다시 적용한 집계와 투표 테이블을 비교하는 메서드
+    def check_events(self):
+        last_event_id = VoteEvent.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        replayed = get_aggregates_as_of(last_event_id)
+
+        actual = {}
+        for accommodation_id, rating in Vote.objects.order_by().values_list('accommodation_id', 'rating'):
+            aggregate = actual.setdefault(accommodation_id, [0, 0])
+            aggregate[0] += 1
+            aggregate[1] += rating
+
+        drift = sorted(
+            accommodation_id for accommodation_id in set(replayed) | set(actual)
+            if replayed.get(accommodation_id) != actual.get(accommodation_id)
+        )
+        for accommodation_id in drift:
+            self.stdout.write(
+                f'[어긋남] 숙소 ID {accommodation_id}: '
+                f'이벤트 {replayed.get(accommodation_id, [0, 0])} / 투표 {actual.get(accommodation_id, [0, 0])}'
+            )
+        if drift:
+            raise CommandError(f'{len(drift)}개 숙소의 이벤트 기록이 투표 테이블과 다릅니다.')
+        self.stdout.write(self.style.SUCCESS(f'이벤트 {last_event_id}개까지의 기록이 현재 투표와 일치합니다.'))
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('votes', '0002_delete_comment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['-created_at', '-id'], name='votes_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='votes_user_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['accommodation', '-created_at', '-id'], name='votes_accom_created_id_idx'),
+        ),
+    ]
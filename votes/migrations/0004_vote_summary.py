@@ -0,0 +1,52 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:34
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_vote_summary(apps, schema_editor):
+    # 기존 투표 데이터로 전체/숙소별/사용자별 평점 분포와 투표한 사용자 수 채우기
+    Vote = apps.get_model('votes', 'Vote')
+    VoteSummary = apps.get_model('votes', 'VoteSummary')
+
+    votes = Vote.objects.order_by()
+    rows = [
+        VoteSummary(scope='all', rating=row['rating'], count=row['total'])
+        for row in votes.values('rating').annotate(total=Count('id'))
+    ]
+    rows += [
+        VoteSummary(scope=f"accommodation:{row['accommodation_id']}", rating=row['rating'], count=row['total'])
+        for row in votes.values('accommodation_id', 'rating').annotate(total=Count('id'))
+    ]
+    rows += [
+        VoteSummary(scope=f"user:{row['user_id']}", rating=row['rating'], count=row['total'])
+        for row in votes.values('user_id', 'rating').annotate(total=Count('id'))
+    ]
+    rows.append(VoteSummary(scope='voters', rating=0, count=votes.values('user_id').distinct().count()))
+    VoteSummary.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('votes', '0003_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VoteSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=40, verbose_name='집계 범위')),
+                ('rating', models.PositiveSmallIntegerField(verbose_name='평점')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='투표 수')),
+            ],
+            options={
+                'verbose_name': '투표 요약',
+                'verbose_name_plural': '투표 요약들',
+                'db_table': 'vote_summaries',
+                'unique_together': {('scope', 'rating')},
+            },
+        ),
+        migrations.RunPython(backfill_vote_summary, migrations.RunPython.noop),
+    ]
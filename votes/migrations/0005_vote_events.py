@@ -0,0 +1,68 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:58
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+def backfill_vote_events(apps, schema_editor):
+    # 기존 투표를 마지막 수정 시각 순서의 생성 이벤트로 채우기 (이후 이벤트를 다시 적용하면 현재 집계와 같아짐)
+    Vote = apps.get_model('votes', 'Vote')
+    VoteEvent = apps.get_model('votes', 'VoteEvent')
+
+    votes = Vote.objects.order_by('updated_at', 'id').values_list('user_id', 'accommodation_id', 'rating', 'updated_at')
+    VoteEvent.objects.bulk_create(
+        (
+            VoteEvent(
+                kind=1,
+                user_id=user_id,
+                accommodation_id=accommodation_id,
+                new_rating=rating,
+                created_at=updated_at,
+            )
+            for user_id, accommodation_id, rating, updated_at in votes.iterator(chunk_size=2000)
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('votes', '0004_vote_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VoteSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_id', models.BigIntegerField(unique=True, verbose_name='마지막 이벤트 ID')),
+                ('aggregates', models.JSONField(default=dict, verbose_name='숙소별 집계')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+            options={
+                'verbose_name': '투표 스냅샷',
+                'verbose_name_plural': '투표 스냅샷들',
+                'db_table': 'vote_snapshots',
+            },
+        ),
+        migrations.CreateModel(
+            name='VoteEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.PositiveSmallIntegerField(choices=[(1, '생성'), (2, '수정'), (3, '삭제')], verbose_name='종류')),
+                ('user_id', models.IntegerField(verbose_name='사용자 ID')),
+                ('accommodation_id', models.IntegerField(verbose_name='숙소 ID')),
+                ('old_rating', models.PositiveSmallIntegerField(null=True, verbose_name='이전 평점')),
+                ('new_rating', models.PositiveSmallIntegerField(null=True, verbose_name='새 평점')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='발생일')),
+            ],
+            options={
+                'verbose_name': '투표 이벤트',
+                'verbose_name_plural': '투표 이벤트들',
+                'db_table': 'vote_events',
+                'indexes': [models.Index(fields=['accommodation_id', 'id'], name='vote_events_accom_id_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_vote_events, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 03:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('votes', '0005_vote_events'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['created_at', 'accommodation', 'rating'], name='votes_created_trend_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['updated_at', 'accommodation', 'rating'], name='votes_updated_trend_idx'),
+        ),
+    ]
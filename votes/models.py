@@ -1,5 +1,6 @@
 # Django의 데이터베이스 모델 기능을 가져옴
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 
 # 입력값 유효성 검사를 위한 밸리데이터 가져옴
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -56,8 +57,181 @@ class Vote(models.Model):
         # 기본 정렬 순서 (생성일 기준 내림차순 - 최신 것부터)
         ordering = ['-created_at']
 
+        # 커서 페이지네이션 정렬 순서와 같은 복합 인덱스 (전체 / 사용자별 / 숙소별 목록)
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='votes_created_id_idx'),
+            models.Index(fields=['user', '-created_at', '-id'], name='votes_user_created_id_idx'),
+            models.Index(fields=['accommodation', '-created_at', '-id'], name='votes_accom_created_id_idx'),
+            # 시간 구간별 투표 추이 (범위 조건 + 숙소 조건 + 평점 합계를 인덱스만 읽어 계산)
+            models.Index(fields=['created_at', 'accommodation', 'rating'], name='votes_created_trend_idx'),
+            models.Index(fields=['updated_at', 'accommodation', 'rating'], name='votes_updated_trend_idx'),
+        ]
+
     # 객체를 문자열로 표현할 때 사용되는 메서드
     def __str__(self):
         return f"{self.user.name} - {self.accommodation.name} ({self.rating}점)"
 
+    # 데이터베이스에서 불러온 인스턴스를 만드는 메서드 (오버라이드)
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        DB에서 읽은 시점의 숙소/평점을 기억해 두는 메서드
+        수정/삭제 시 숙소 집계 컬럼에 반영할 변화량을 계산하는 데 사용
+        """
+        instance = super().from_db(db, field_names, values)
+        instance.remember_saved_state()
+        return instance
+
+    # 현재 DB에 저장된 상태를 기억하는 메서드
+    def remember_saved_state(self):
+        # 지연 로딩(defer)된 필드는 추가 쿼리를 피하기 위해 None으로 기억
+        self._saved_accommodation_id = self.__dict__.get('accommodation_id')
+        self._saved_rating = self.__dict__.get('rating')
+
+    # 저장된 상태를 (숙소 ID, 평점) 형태로 반환하는 메서드
+    def get_saved_state(self):
+        return (
+            getattr(self, '_saved_accommodation_id', None),
+            getattr(self, '_saved_rating', None),
+        )
+
+    # 투표 저장 메서드 (오버라이드)
+    def save(self, *args, **kwargs):
+        """
+        투표를 저장하는 메서드
+        투표 저장과 숙소 집계 컬럼 갱신(post_save 시그널)이 하나의 트랜잭션으로 처리되도록 묶음
+        DB에서 불러오지 않았거나 평점/숙소가 지연 로딩된 인스턴스를 수정하는 경우
+        저장 전의 행을 잠그고 읽어 변화량 계산에 사용 (새 투표로 잘못 집계되지 않도록)
+        """
+        with transaction.atomic(using=kwargs.get('using')):
+            if self.pk is not None and not kwargs.get('force_insert') and None in self.get_saved_state():
+                saved = Vote.objects.db_manager(kwargs.get('using')).select_for_update().filter(
+                    pk=self.pk
+                ).values_list('accommodation_id', 'rating').first()
+                if saved is not None:
+                    self._saved_accommodation_id, self._saved_rating = saved
+            super().save(*args, **kwargs)
+
+
+# 평점 분포를 미리 집계해 두는 모델 (투표 통계를 투표 테이블을 읽지 않고 조회하기 위함)
+class VoteSummary(models.Model):
+    """
+    범위(scope)별, 평점별 투표 수를 저장 (투표 생성/수정/삭제 시 votes.summary에서 증감)
+    scope 값:
+        'all'               - 전체 투표
+        'accommodation:{id}' - 특정 숙소의 투표
+        'user:{id}'          - 특정 사용자의 투표
+        'voters'             - 투표한 사용자 수 (rating=0 한 행만 사용)
+    """
+
+    # 집계 범위를 나타내는 키
+    scope = models.CharField(max_length=40, verbose_name="집계 범위")
+
+    # 평점 (1~10, 'voters' 범위는 0)
+    rating = models.PositiveSmallIntegerField(verbose_name="평점")
+
+    # 해당 범위에서 이 평점을 준 투표 수
+    count = models.PositiveIntegerField(default=0, verbose_name="투표 수")
+
+    # 데이터베이스 테이블 설정을 위한 메타 클래스
+    class Meta:
+        # 실제 데이터베이스 테이블명
+        db_table = 'vote_summaries'
+
+        # 관리자 페이지에서 단수형으로 표시될 이름
+        verbose_name = "투표 요약"
+
+        # 관리자 페이지에서 복수형으로 표시될 이름
+        verbose_name_plural = "투표 요약들"
+
+        # 범위와 평점 조합은 한 행만 존재 (이 인덱스로 범위별 분포를 바로 조회)
+        unique_together = ['scope', 'rating']
+
+    # 객체를 문자열로 표현할 때 사용되는 메서드
+    def __str__(self):
+        return f"{self.scope} {self.rating}점: {self.count}"
+
+
+# 투표 변경 이력을 추가만 하는(append-only) 모델 (과거 시점 랭킹 재계산, 증분 소비자용)
+class VoteEvent(models.Model):
+    """
+    투표 생성/수정/삭제마다 한 행씩, 투표 변경과 같은 트랜잭션에서 기록 (votes.history)
+    사용자/숙소가 삭제되어도 이력이 남도록 외래키 대신 정수 ID만 저장
+    id 순서가 이벤트 순서 (증분 소비자는 마지막으로 읽은 id 이후만 조회)
+    """
+
+    # 이벤트 종류
+    CREATED = 1
+    UPDATED = 2
+    DELETED = 3
+    KIND_CHOICES = [
+        (CREATED, '생성'),
+        (UPDATED, '수정'),
+        (DELETED, '삭제'),
+    ]
+
+    # 이벤트 종류 (1: 생성, 2: 수정, 3: 삭제)
+    kind = models.PositiveSmallIntegerField(choices=KIND_CHOICES, verbose_name="종류")
+
+    # 투표한 사용자 ID와 투표 대상 숙소 ID
+    user_id = models.IntegerField(verbose_name="사용자 ID")
+    accommodation_id = models.IntegerField(verbose_name="숙소 ID")
+
+    # 변경 전/후 평점 (생성이면 변경 전, 삭제면 변경 후가 비어 있음)
+    old_rating = models.PositiveSmallIntegerField(null=True, verbose_name="이전 평점")
+    new_rating = models.PositiveSmallIntegerField(null=True, verbose_name="새 평점")
+
+    # 이벤트 발생 시각 (시각 기준 조회를 위해 인덱스 추가)
+    created_at = models.DateTimeField(default=timezone.now, db_index=True, verbose_name="발생일")
+
+    # 데이터베이스 테이블 설정을 위한 메타 클래스
+    class Meta:
+        # 실제 데이터베이스 테이블명
+        db_table = 'vote_events'
+
+        # 관리자 페이지에서 단수형으로 표시될 이름
+        verbose_name = "투표 이벤트"
+
+        # 관리자 페이지에서 복수형으로 표시될 이름
+        verbose_name_plural = "투표 이벤트들"
+
+        # 숙소별 이벤트를 순서대로 읽기 위한 인덱스
+        indexes = [
+            models.Index(fields=['accommodation_id', 'id'], name='vote_events_accom_id_idx'),
+        ]
+
+    # 객체를 문자열로 표현할 때 사용되는 메서드
+    def __str__(self):
+        return f"#{self.id} {self.get_kind_display()} 사용자 {self.user_id} -> 숙소 {self.accommodation_id}"
+
+
+# 특정 이벤트까지 반영한 숙소별 집계를 주기적으로 저장하는 모델 (과거 시점 재계산의 시작점)
+class VoteSnapshot(models.Model):
+    """
+    event_id까지의 이벤트를 모두 반영한 숙소별 [투표 수, 평점 합계]
+    과거 시점 랭킹은 그 시점 이전의 가장 가까운 스냅샷에서 이후 이벤트만 다시 적용해 계산
+    """
+
+    # 마지막으로 반영한 이벤트 ID
+    event_id = models.BigIntegerField(unique=True, verbose_name="마지막 이벤트 ID")
+
+    # 숙소별 집계 {"숙소 ID": [투표 수, 평점 합계]} (투표가 있는 숙소만)
+    aggregates = models.JSONField(default=dict, verbose_name="숙소별 집계")
 
+    # 스냅샷 생성 날짜와 시간
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+
+    # 데이터베이스 테이블 설정을 위한 메타 클래스
+    class Meta:
+        # 실제 데이터베이스 테이블명
+        db_table = 'vote_snapshots'
+
+        # 관리자 페이지에서 단수형으로 표시될 이름
+        verbose_name = "투표 스냅샷"
+
+        # 관리자 페이지에서 복수형으로 표시될 이름
+        verbose_name_plural = "투표 스냅샷들"
+
+    # 객체를 문자열로 표현할 때 사용되는 메서드
+    def __str__(self):
+        return f"이벤트 #{self.event_id}까지의 스냅샷"
@@ -5,8 +5,17 @@ from rest_framework import serializers
 from django.utils import timezone
 import datetime
 
-# 현재 앱의 모델들을 가져옴
+# Django의 데이터베이스 오류를 가져옴
+from django.db import IntegrityError
+
+# 현재 앱의 모델과 투표 저장 함수를 가져옴
 from .models import Vote
+from .upsert import upsert_votes
+
+# ?fields= / ?expand= 지원 믹스인과 ID 집합 캐시
+from core.cache import get_cached_ids
+
+from core.serializers import DynamicFieldsMixin
 
 # 다른 앱의 serializers를 가져옴 (상호 참조)
 from users.serializers import UserSerializer
@@ -14,7 +23,7 @@ from accommodations.serializers import AccommodationSerializer
 
 
 # 투표 정보를 JSON으로 변환하는 기본 Serializer
-class VoteSerializer(serializers.ModelSerializer):
+class VoteSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     투표 정보를 JSON 형태로 직렬화/역직렬화하는 클래스
     투표한 사용자, 숙소 정보, 평점 등을 포함
@@ -43,6 +52,14 @@ class VoteSerializer(serializers.ModelSerializer):
         # 수정할 수 없는 필드들 (읽기 전용)
         read_only_fields = ['id', 'created_at', 'updated_at']
 
+        # ?fields= 없이 ?expand= 만 보낸 경우 expand에 적어야 포함되는 중첩 필드
+        expandable_fields = ('user', 'accommodation')
+
+        # 계산 필드가 읽는 모델 필드 (?fields= 요청 시 only() 계산용)
+        field_sources = {
+            'time_since': ('created_at',),
+        }
+
     # 투표 시간을 "2분 전", "1시간 전" 형태로 표시하는 메서드
     def get_time_since(self, obj):
         """
@@ -68,13 +85,47 @@ class VoteSerializer(serializers.ModelSerializer):
             return "방금 전"
 
 
+# 투표 목록에서 기본으로 사용하는 간단한 Serializer
+class VoteCompactSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """
+    사용자/숙소를 중첩하지 않고 ID만 포함하는 투표 목록용 클래스
+    사용자/숙소 정보가 필요하면 ?include=users,accommodations 로 응답에 한 번씩만 따로 받음
+    """
+
+    # 투표한 사용자와 숙소의 ID (조인 없이 외래키 컬럼 값 사용)
+    user_id = serializers.IntegerField(read_only=True)
+    accommodation_id = serializers.IntegerField(read_only=True)
+
+    # Serializer 설정을 위한 메타 클래스
+    class Meta:
+        # 연결할 모델 지정
+        model = Vote
+
+        # JSON에 포함할 필드들 지정
+        fields = ['id', 'user_id', 'accommodation_id', 'rating', 'created_at', 'updated_at']
+
+        # 수정할 수 없는 필드들 (읽기 전용)
+        read_only_fields = fields
+
+        # 외래키 ID 필드가 읽는 모델 필드 (?fields= 요청 시 only() 계산용)
+        field_sources = {
+            'user_id': ('user',),
+            'accommodation_id': ('accommodation',),
+        }
+
+
 # 새로운 투표 생성 시 사용하는 Serializer
 class VoteCreateSerializer(serializers.ModelSerializer):
     """
     새로운 투표를 생성할 때 사용하는 클래스
     사용자가 숙소에 점수를 매길 때 사용
+    사용자/숙소 존재 여부는 캐시된 ID 집합으로 확인하고, 저장은 INSERT ... ON CONFLICT 한 문장으로 처리
     """
 
+    # 존재하지 않는 사용자/숙소일 때의 오류 메시지
+    MISSING_USER_MESSAGE = "존재하지 않는 사용자입니다."
+    MISSING_ACCOMMODATION_MESSAGE = "존재하지 않는 숙소입니다."
+
     # 외래키 필드들을 ID로 받기 위한 필드 (입력용)
     user_id = serializers.IntegerField(help_text="투표하는 사용자의 ID")
     accommodation_id = serializers.IntegerField(help_text="투표 대상 숙소의 ID")
@@ -95,11 +146,9 @@ class VoteCreateSerializer(serializers.ModelSerializer):
         """
         from users.models import User
 
-        try:
-            # 해당 ID의 사용자가 존재하는지 확인
-            User.objects.get(id=value)
-        except User.DoesNotExist:
-            raise serializers.ValidationError("존재하지 않는 사용자입니다.")
+        # 캐시된 ID 집합에 없을 때만 DB에서 확인 (다른 워커에서 방금 만든 사용자일 수 있음)
+        if value not in get_cached_ids(User) and not User.objects.filter(id=value).exists():
+            raise serializers.ValidationError(self.MISSING_USER_MESSAGE)
 
         # 유효한 ID면 그대로 반환
         return value
@@ -112,11 +161,9 @@ class VoteCreateSerializer(serializers.ModelSerializer):
         """
         from accommodations.models import Accommodation
 
-        try:
-            # 해당 ID의 숙소가 존재하는지 확인
-            Accommodation.objects.get(id=value)
-        except Accommodation.DoesNotExist:
-            raise serializers.ValidationError("존재하지 않는 숙소입니다.")
+        # 캐시된 ID 집합에 없을 때만 DB에서 확인 (다른 워커에서 방금 만든 숙소일 수 있음)
+        if value not in get_cached_ids(Accommodation) and not Accommodation.objects.filter(id=value).exists():
+            raise serializers.ValidationError(self.MISSING_ACCOMMODATION_MESSAGE)
 
         # 유효한 ID면 그대로 반환
         return value
@@ -138,28 +185,119 @@ class VoteCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """
         새로운 투표를 생성하는 메서드
-        중복 투표 시 기존 투표를 업데이트
+        중복 투표 시 기존 투표를 업데이트 (INSERT ... ON CONFLICT (user_id, accommodation_id) DO UPDATE)
         validated_data: 유효성 검사를 통과한 데이터
         """
-        # ID를 실제 객체로 변환
-        user_id = validated_data.pop('user_id')
-        accommodation_id = validated_data.pop('accommodation_id')
+        user_id = validated_data['user_id']
+        accommodation_id = validated_data['accommodation_id']
+        rating = validated_data['rating']
+
+        try:
+            upsert_votes(user_id, {accommodation_id: rating})
+        except IntegrityError:
+            # 캐시에는 있었지만 그 사이 삭제된 사용자/숙소 (외래키 제약 조건 오류)
+            raise serializers.ValidationError(self.get_missing_reference_errors(user_id, accommodation_id))
 
+        # 응답에 필요한 값만 가진 투표 객체 반환 (사용자/숙소를 다시 조회하지 않음)
+        return Vote(user_id=user_id, accommodation_id=accommodation_id, rating=rating)
+
+    # 외래키 오류를 필드별 검증 오류 메시지로 바꾸는 메서드
+    def get_missing_reference_errors(self, user_id, accommodation_id):
         from users.models import User
         from accommodations.models import Accommodation
 
-        # ID로 실제 객체 가져오기
-        user = User.objects.get(id=user_id)
-        accommodation = Accommodation.objects.get(id=accommodation_id)
+        errors = {}
+        if not User.objects.filter(id=user_id).exists():
+            errors['user_id'] = [self.MISSING_USER_MESSAGE]
+        if not Accommodation.objects.filter(id=accommodation_id).exists():
+            errors['accommodation_id'] = [self.MISSING_ACCOMMODATION_MESSAGE]
+        return errors or {'error': '투표를 저장하지 못했습니다.'}
 
-        # 기존 투표가 있으면 업데이트, 없으면 생성 (중복 투표 방지)
-        vote, created = Vote.objects.update_or_create(
-            user=user,
-            accommodation=accommodation,
-            defaults={'rating': validated_data['rating']}
-        )
 
-        # 생성/업데이트된 투표 반환
-        return vote
+# 일괄 투표 한 건의 입력 형식을 정의하는 Serializer
+class VoteBatchItemSerializer(serializers.Serializer):
+    """
+    {"accommodation_id": 숙소ID, "rating": 평점}
+    숙소 존재 여부와 평점 범위는 항목별 결과로 알려주기 위해 VoteBatchSerializer에서 한 번에 검사
+    """
+
+    # 투표 대상 숙소의 ID
+    accommodation_id = serializers.IntegerField(help_text="투표 대상 숙소의 ID")
+
+    # 평점 (1~10)
+    rating = serializers.IntegerField(help_text="평점 (1~10)")
+
+
+# 한 사용자의 여러 투표를 한 번에 저장하는 Serializer
+class VoteBatchSerializer(serializers.Serializer):
+    """
+    {"user_id": 사용자ID, "votes": [{"accommodation_id": 숙소ID, "rating": 평점}, ...]}
+    - 숙소 ID는 IN 쿼리 한 번으로 확인
+    - 기존 투표는 한 번에 조회하고, 저장은 (user, accommodation) 기준 bulk upsert 한 번으로 처리 (votes.upsert)
+    - 잘못된 항목은 저장하지 않고 항목별 결과에 오류로 표시 (나머지 항목은 저장)
+    """
+
+    # 한 번에 보낼 수 있는 최대 투표 수
+    MAX_ITEMS = 100
+
+    # 투표하는 사용자의 ID
+    user_id = serializers.IntegerField(help_text="투표하는 사용자의 ID")
+
+    # 투표 목록
+    votes = VoteBatchItemSerializer(many=True, allow_empty=False, max_length=MAX_ITEMS)
+
+    # 사용자 ID 유효성 검사
+    def validate_user_id(self, value):
+        from users.models import User
+
+        # 해당 ID의 사용자가 존재하는지 확인
+        if not User.objects.filter(id=value).exists():
+            raise serializers.ValidationError("존재하지 않는 사용자입니다.")
+
+        # 유효한 ID면 그대로 반환
+        return value
 
+    # 투표 목록을 한 번에 저장하는 메서드 (오버라이드)
+    def create(self, validated_data):
+        """
+        반환값: 입력 순서와 같은 항목별 결과 목록
+        [{"accommodation_id", "rating", "status": created/updated/unchanged/error, "error"(오류일 때)}, ...]
+        """
+        from accommodations.models import Accommodation
+
+        user_id = validated_data['user_id']
+        items = validated_data['votes']
+
+        # 요청에 포함된 숙소 중 실제로 존재하는 숙소 (IN 쿼리 한 번)
+        requested_ids = {item['accommodation_id'] for item in items}
+        existing_accommodations = set(
+            Accommodation.objects.filter(id__in=requested_ids).order_by().values_list('id', flat=True)
+        )
 
+        # 항목별 검사 (같은 숙소가 여러 번 있으면 처음 항목만 사용)
+        results = []
+        accepted = {}
+        for item in items:
+            accommodation_id, rating = item['accommodation_id'], item['rating']
+            result = {'accommodation_id': accommodation_id, 'rating': rating}
+            if accommodation_id not in existing_accommodations:
+                result.update(status='error', error="존재하지 않는 숙소입니다.")
+            elif rating < 1 or rating > 10:
+                result.update(status='error', error="평점은 1점에서 10점 사이여야 합니다.")
+            elif accommodation_id in accepted:
+                result.update(status='error', error="같은 숙소에 대한 투표가 여러 번 포함되어 있습니다.")
+            else:
+                accepted[accommodation_id] = result
+            results.append(result)
+
+        if not accepted:
+            return results
+
+        # 기존 평점 조회 1회 + bulk upsert 1회 (집계/요약/테이블 버전 갱신 포함)
+        statuses = upsert_votes(user_id, {
+            accommodation_id: result['rating'] for accommodation_id, result in accepted.items()
+        })
+        for accommodation_id, result in accepted.items():
+            result['status'] = statuses[accommodation_id]
+
+        return results
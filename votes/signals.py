@@ -0,0 +1,70 @@
+# Django의 시그널 기능을 가져옴
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# 현재 앱의 모델과 집계 함수를 가져옴
+from .aggregates import VoteChange, apply_vote_changes
+from .models import Vote
+from .summary import accommodation_scope, delete_summary_scope, user_scope
+
+# 다른 앱의 모델들을 가져옴
+from accommodations.models import Accommodation
+from users.models import User
+
+
+# 투표가 생성/수정될 때 숙소 집계 컬럼을 갱신하는 시그널 핸들러
+@receiver(post_save, sender=Vote)
+def update_aggregates_on_vote_save(sender, instance, created, raw=False, **kwargs):
+    """
+    투표 저장 직후 실행 (Vote.save의 트랜잭션 안에서 실행됨)
+    raw: loaddata로 불러오는 경우 True (이때는 rebuild_vote_aggregates 명령으로 재계산)
+    """
+    if raw:
+        return
+
+    old_accommodation_id, old_rating = (None, None) if created else instance.get_saved_state()
+
+    if old_accommodation_id is not None and old_accommodation_id != instance.accommodation_id:
+        # 다른 숙소로 옮겨진 투표는 기존 숙소에서 삭제 + 새 숙소에 생성으로 처리
+        changes = [
+            VoteChange(instance.user_id, old_accommodation_id, old_rating, None),
+            VoteChange(instance.user_id, instance.accommodation_id, None, instance.rating),
+        ]
+    else:
+        changes = [VoteChange(instance.user_id, instance.accommodation_id, old_rating, instance.rating)]
+
+    apply_vote_changes(changes)
+
+    # 다음 저장 시 변화량 계산을 위해 현재 상태를 기억
+    instance.remember_saved_state()
+
+
+# 투표가 삭제될 때 숙소 집계 컬럼을 갱신하는 시그널 핸들러
+@receiver(post_delete, sender=Vote)
+def update_aggregates_on_vote_delete(sender, instance, **kwargs):
+    """
+    투표 삭제 직후 실행 (사용자/숙소 삭제로 인한 연쇄 삭제 포함, 삭제 트랜잭션 안에서 실행됨)
+    """
+    saved_accommodation_id, saved_rating = instance.get_saved_state()
+
+    apply_vote_changes([
+        VoteChange(
+            instance.user_id,
+            saved_accommodation_id or instance.accommodation_id,
+            saved_rating if saved_rating is not None else instance.rating,
+            None,
+        )
+    ])
+
+
+# 숙소가 삭제될 때 해당 숙소의 평점 분포 요약 행을 정리하는 시그널 핸들러
+@receiver(post_delete, sender=Accommodation)
+def delete_accommodation_vote_summary(sender, instance, **kwargs):
+    # 연쇄 삭제된 투표의 시그널이 먼저 실행되어 투표 수는 이미 0
+    delete_summary_scope(accommodation_scope(instance.pk))
+
+
+# 사용자가 삭제될 때 해당 사용자의 평점 분포 요약 행을 정리하는 시그널 핸들러
+@receiver(post_delete, sender=User)
+def delete_user_vote_summary(sender, instance, **kwargs):
+    delete_summary_scope(user_scope(instance.pk))
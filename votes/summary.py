@@ -0,0 +1,220 @@
+# 평점 분포 요약 테이블(VoteSummary)을 관리하고 투표 통계를 계산하는 모듈
+from collections import Counter, defaultdict
+
+# Django 설정 및 데이터베이스 관련 기능을 가져옴
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Sum, Value, When
+
+# 현재 앱의 모델을 가져옴
+from .models import Vote, VoteSummary
+
+
+# 전체 투표와 투표한 사용자 수를 나타내는 범위 키
+GLOBAL_SCOPE = 'all'
+VOTERS_SCOPE = 'voters'
+
+# 평점 범위
+RATINGS = range(1, 11)
+
+
+# 숙소별 범위 키를 만드는 함수
+def accommodation_scope(accommodation_id):
+    return f'accommodation:{accommodation_id}'
+
+
+# 사용자별 범위 키를 만드는 함수
+def user_scope(user_id):
+    return f'user:{user_id}'
+
+
+# 요약 테이블을 사용할지 확인하는 함수
+def vote_summary_enabled():
+    return settings.VOTE_SUMMARY_ENABLED
+
+
+# 요약 테이블의 한 행에 변화량을 더하는 함수
+def _add_to_summary(scope, rating, delta):
+    updated = VoteSummary.objects.filter(scope=scope, rating=rating).update(count=F('count') + delta)
+    if updated or delta < 0:
+        return
+    # 처음 생기는 행이면 만듦 (동시에 만들어졌으면 다시 더함)
+    try:
+        with transaction.atomic():
+            VoteSummary.objects.create(scope=scope, rating=rating, count=delta)
+    except IntegrityError:
+        VoteSummary.objects.filter(scope=scope, rating=rating).update(count=F('count') + delta)
+
+
+# 요약 테이블의 여러 행에 변화량을 한 번에 더하는 함수
+def _add_many_to_summary(deltas):
+    """
+    deltas: {(scope, rating): 변화량}
+    이미 있는 행은 CASE 식 UPDATE 한 번으로, 없는 행은 bulk_create 한 번으로 반영
+    (일괄 투표처럼 여러 행이 바뀔 때 행마다 쿼리를 보내지 않도록)
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if len(deltas) <= 1:
+        for (scope, rating), delta in deltas.items():
+            _add_to_summary(scope, rating, delta)
+        return
+
+    keys = Q()
+    for scope, rating in deltas:
+        keys |= Q(scope=scope, rating=rating)
+    existing = set(VoteSummary.objects.filter(keys).values_list('scope', 'rating'))
+
+    if existing:
+        VoteSummary.objects.filter(keys).update(count=F('count') + Case(
+            *[
+                When(scope=scope, rating=rating, then=Value(deltas[(scope, rating)]))
+                for scope, rating in existing
+            ],
+            default=Value(0),
+            output_field=IntegerField(),
+        ))
+
+    missing = {key: delta for key, delta in deltas.items() if key not in existing and delta > 0}
+    if not missing:
+        return
+    try:
+        with transaction.atomic():
+            VoteSummary.objects.bulk_create([
+                VoteSummary(scope=scope, rating=rating, count=delta) for (scope, rating), delta in missing.items()
+            ])
+    except IntegrityError:
+        # 동시에 같은 행이 만들어진 경우 행마다 다시 반영
+        for (scope, rating), delta in missing.items():
+            _add_to_summary(scope, rating, delta)
+
+
+# 투표 변경 목록을 요약 테이블에 반영하는 함수
+def apply_summary_changes(changes):
+    """
+    votes.aggregates.apply_vote_changes()에서 호출 (같은 트랜잭션 안에서 실행)
+    전체/숙소별/사용자별 평점 행을 증감하고, 사용자의 투표 수가 0을 넘나들면 투표한 사용자 수를 갱신
+    changes: VoteChange 목록
+    """
+    deltas = Counter()
+    user_deltas = defaultdict(int)
+
+    for change in changes:
+        for rating, sign in ((change.old_rating, -1), (change.new_rating, 1)):
+            if rating is None:
+                continue
+            deltas[(GLOBAL_SCOPE, rating)] += sign
+            deltas[(accommodation_scope(change.accommodation_id), rating)] += sign
+            deltas[(user_scope(change.user_id), rating)] += sign
+            user_deltas[change.user_id] += sign
+
+    _add_many_to_summary(deltas)
+
+    # 사용자별 행은 이 함수에서만 바뀌므로 갱신 후 합계로 변경 전 투표 수를 알 수 있음
+    # (연쇄 삭제처럼 투표 행이 먼저 한꺼번에 지워져도 정확함)
+    voters_delta = 0
+    for user_id, delta in user_deltas.items():
+        if not delta:
+            continue
+        after = VoteSummary.objects.filter(scope=user_scope(user_id)).aggregate(total=Sum('count'))['total'] or 0
+        before = after - delta
+        if before <= 0 < after:
+            voters_delta += 1
+        elif after <= 0 < before:
+            voters_delta -= 1
+
+    if voters_delta:
+        _add_to_summary(VOTERS_SCOPE, 0, voters_delta)
+
+
+# 투표 테이블에서 요약 테이블을 처음부터 다시 만드는 함수
+def rebuild_vote_summary():
+    """
+    GROUP BY 쿼리로 전체/숙소별/사용자별 평점 분포와 투표한 사용자 수를 다시 계산
+    반환값: 생성된 요약 행 수
+    """
+    votes = Vote.objects.order_by()
+    rows = [
+        VoteSummary(scope=GLOBAL_SCOPE, rating=row['rating'], count=row['total'])
+        for row in votes.values('rating').annotate(total=Count('id'))
+    ]
+    rows += [
+        VoteSummary(scope=accommodation_scope(row['accommodation_id']), rating=row['rating'], count=row['total'])
+        for row in votes.values('accommodation_id', 'rating').annotate(total=Count('id'))
+    ]
+    rows += [
+        VoteSummary(scope=user_scope(row['user_id']), rating=row['rating'], count=row['total'])
+        for row in votes.values('user_id', 'rating').annotate(total=Count('id'))
+    ]
+    rows.append(VoteSummary(
+        scope=VOTERS_SCOPE, rating=0, count=votes.values('user_id').distinct().count()
+    ))
+
+    with transaction.atomic():
+        VoteSummary.objects.all().delete()
+        VoteSummary.objects.bulk_create(rows, batch_size=500)
+    return len(rows)
+
+
+# 숙소/사용자가 삭제될 때 해당 범위의 요약 행을 정리하는 함수
+def delete_summary_scope(scope):
+    VoteSummary.objects.filter(scope=scope).delete()
+
+
+# 평점 분포를 반환하는 함수
+def get_rating_histogram(accommodation_id=None):
+    """
+    요약 테이블을 사용하면 범위의 평점 행(최대 10개)만 읽고,
+    사용하지 않으면 투표 테이블에서 GROUP BY rating 한 번으로 계산
+    반환값: {1: 투표수, 2: 투표수, ..., 10: 투표수}
+    """
+    histogram = dict.fromkeys(RATINGS, 0)
+    for rating, count in _rating_count_rows(accommodation_id):
+        histogram[rating] = count
+    return histogram
+
+
+# get_rating_histogram()의 비동기 버전 (비동기 View용)
+async def aget_rating_histogram(accommodation_id=None):
+    histogram = dict.fromkeys(RATINGS, 0)
+    async for rating, count in _rating_count_rows(accommodation_id):
+        histogram[rating] = count
+    return histogram
+
+
+# 평점별 투표 수 (평점, 투표 수) 행을 조회하는 쿼리셋을 만드는 함수
+def _rating_count_rows(accommodation_id):
+    if vote_summary_enabled():
+        scope = GLOBAL_SCOPE if accommodation_id is None else accommodation_scope(accommodation_id)
+        return VoteSummary.objects.filter(scope=scope).values_list('rating', 'count')
+
+    votes = Vote.objects.order_by()
+    if accommodation_id is not None:
+        votes = votes.filter(accommodation_id=accommodation_id)
+    return votes.values('rating').annotate(total=Count('id')).values_list('rating', 'total')
+
+
+# 투표한 사용자 수를 반환하는 함수
+def get_voter_count():
+    if vote_summary_enabled():
+        row = VoteSummary.objects.filter(scope=VOTERS_SCOPE, rating=0).values_list('count', flat=True).first()
+        return row or 0
+    return Vote.objects.values('user_id').distinct().count()
+
+
+# get_voter_count()의 비동기 버전 (비동기 View용)
+async def aget_voter_count():
+    if vote_summary_enabled():
+        row = await VoteSummary.objects.filter(scope=VOTERS_SCOPE, rating=0).values_list('count', flat=True).afirst()
+        return row or 0
+    return await Vote.objects.values('user_id').distinct().acount()
+
+
+# 평점 분포로부터 투표 수와 평균 평점을 계산하는 함수
+def summarize_histogram(histogram):
+    """
+    반환값: (전체 투표 수, 평균 평점)
+    """
+    total = sum(histogram.values())
+    if not total:
+        return 0, 0
+    return total, sum(rating * count for rating, count in histogram.items()) / total
@@ -1,3 +1,755 @@
-from django.test import TestCase
+import csv
+import json
+import tempfile
+from io import StringIO
+from datetime import time, timedelta
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from unittest import mock
+from django.urls import reverse
+from django.utils import timezone
+
+from accommodations.models import Accommodation
+from users.models import User
+
+from core.broker import get_broker
+
+from . import async_views
+from . import live
+from .live import RANKING_SNAPSHOT_KEY
+from .history import get_aggregates_as_of, take_vote_snapshot
+from .trend import truncate_to_bucket
+from .models import Vote, VoteEvent, VoteSnapshot, VoteSummary
+from .summary import get_rating_histogram, get_voter_count, rebuild_vote_summary
+
+
+# 투표 목록의 커서/페이지 번호 겸용 페이지네이션을 확인하는 테스트
+class VotePaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [User.objects.create(name=f'{i:02d}') for i in range(5)]
+        cls.accommodations = [
+            Accommodation.objects.create(
+                name=f'숙소 {i}', location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+            for i in range(5)
+        ]
+        for user in cls.users:
+            for accommodation in cls.accommodations:
+                Vote.objects.create(user=user, accommodation=accommodation, rating=7)
+
+    def test_page_number_clients_are_unchanged(self):
+        response = self.client.get(reverse('votes:vote-list-create'), {'page': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 25)
+        self.assertEqual(len(response.data['results']), 5)
+
+    def test_cursor_walks_every_vote_once_without_count(self):
+        url = f"{reverse('votes:vote-list-create')}?cursor=&page_size=10"
+        seen = []
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('count', response.data)
+            self.assertFalse(any('COUNT(' in query['sql'] for query in queries))
+            seen += [vote['id'] for vote in response.data['results']]
+            url = response.data['next']
+
+        expected = list(Vote.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_cursor_on_nested_lists(self):
+        user = self.users[0]
+        response = self.client.get(reverse('users:user-votes', args=[user.id]), {'cursor': '', 'page_size': 2})
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
+
+        response = self.client.get(response.data['next'])
+        self.assertTrue(all(vote['user_id'] == user.id for vote in response.data['results']))
+
+
+# 투표 목록의 간단한 형식과 사이드로딩을 확인하는 테스트
+class VoteListFormatTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(name='민수')
+        cls.accommodations = [
+            Accommodation.objects.create(
+                name=f'숙소 {i}', location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+            for i in range(2)
+        ]
+        for accommodation in cls.accommodations:
+            Vote.objects.create(user=cls.user, accommodation=accommodation, rating=8)
+
+    def test_compact_format_is_default(self):
+        response = self.client.get(reverse('users:user-votes', args=[self.user.id]))
+        vote = response.data['results'][0]
+        self.assertEqual(
+            set(vote), {'id', 'user_id', 'accommodation_id', 'rating', 'created_at', 'updated_at'}
+        )
+        self.assertNotIn('users', response.data)
+
+    def test_sideloaded_relations_are_deduplicated(self):
+        response = self.client.get(
+            reverse('users:user-votes', args=[self.user.id]), {'include': 'users,accommodations'}
+        )
+        self.assertEqual(list(response.data['users']), [self.user.id])
+        self.assertEqual(response.data['users'][self.user.id]['name'], '민수')
+        self.assertEqual(
+            set(response.data['accommodations']), {accommodation.id for accommodation in self.accommodations}
+        )
+
+    def test_nested_flag_restores_previous_shape(self):
+        response = self.client.get(reverse('votes:vote-list-create'), {'nested': 'true'})
+        vote = response.data['results'][0]
+        self.assertEqual(vote['user']['id'], self.user.id)
+        self.assertIn('images', vote['accommodation'])
+
+
+# 숙소의 투표 집계 컬럼(vote_count, rating_sum)이 투표 변경을 따라가는지 확인하는 테스트
+class VoteAggregateTests(TestCase):
+
+    def setUp(self):
+        self.users = [User.objects.create(name=f'{i:02d}') for i in range(2)]
+        self.accommodations = [
+            Accommodation.objects.create(
+                name=f'숙소 {i}', location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+            for i in range(2)
+        ]
+
+    def aggregates(self, accommodation):
+        accommodation.refresh_from_db(fields=['vote_count', 'rating_sum'])
+        return accommodation.vote_count, accommodation.rating_sum
+
+    def test_cascaded_deletes_update_aggregates(self):
+        first, second = self.accommodations
+        Vote.objects.create(user=self.users[0], accommodation=first, rating=8)
+        Vote.objects.create(user=self.users[1], accommodation=first, rating=4)
+        Vote.objects.create(user=self.users[1], accommodation=second, rating=6)
+
+        # 사용자 삭제로 그 사용자의 투표가 연쇄 삭제되면 각 숙소의 집계에서 빠짐
+        self.users[1].delete()
+        self.assertEqual(self.aggregates(first), (1, 8))
+        self.assertEqual(self.aggregates(second), (0, 0))
+
+        # 숙소 삭제로 인한 연쇄 삭제는 다른 숙소의 집계를 바꾸지 않음
+        Vote.objects.create(user=self.users[0], accommodation=second, rating=9)
+        first.delete()
+        self.assertEqual(self.aggregates(second), (1, 9))
+        call_command('rebuild_vote_aggregates', '--check', stdout=StringIO())
+
+    def test_detail_view_update_and_delete(self):
+        accommodation = self.accommodations[0]
+        vote = Vote.objects.create(user=self.users[0], accommodation=accommodation, rating=8)
+        url = reverse('votes:vote-detail', args=[vote.id])
+
+        response = self.client.patch(url, {'rating': 3}, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.aggregates(accommodation), (1, 3))
+
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.aggregates(accommodation), (0, 0))
+
+    def test_saving_unloaded_or_deferred_vote_counts_as_update(self):
+        accommodation = self.accommodations[0]
+        vote = Vote.objects.create(user=self.users[0], accommodation=accommodation, rating=5)
+
+        # DB에서 불러오지 않고 기본 키만 지정한 인스턴스로 덮어쓰기
+        Vote(
+            id=vote.id, user=self.users[0], accommodation=accommodation, rating=7, created_at=vote.created_at
+        ).save()
+        self.assertEqual(self.aggregates(accommodation), (1, 7))
+
+        # 평점을 지연 로딩한 인스턴스로 수정
+        deferred = Vote.objects.only('id', 'user', 'accommodation').get(pk=vote.id)
+        deferred.rating = 9
+        deferred.save()
+        self.assertEqual(self.aggregates(accommodation), (1, 9))
+
+        # 숙소를 지연 로딩한 인스턴스로 다른 숙소로 옮기기
+        moved = Vote.objects.only('id', 'user', 'rating').get(pk=vote.id)
+        moved.accommodation = self.accommodations[1]
+        moved.save()
+        self.assertEqual(self.aggregates(accommodation), (0, 0))
+        self.assertEqual(self.aggregates(self.accommodations[1]), (1, 9))
+        call_command('rebuild_vote_aggregates', '--check', stdout=StringIO())
+
+    def test_rebuild_command_reports_and_fixes_drift(self):
+        accommodation = self.accommodations[0]
+        Vote.objects.create(user=self.users[0], accommodation=accommodation, rating=8)
+        # 시그널을 거치지 않은 변경으로 집계를 어긋나게 만듦
+        Accommodation.objects.filter(pk=accommodation.pk).update(vote_count=5, rating_sum=40)
+
+        output = StringIO()
+        with self.assertRaises(CommandError):
+            call_command('rebuild_vote_aggregates', '--check', stdout=output)
+        self.assertIn(f'(ID {accommodation.id})', output.getvalue())
+        self.assertEqual(self.aggregates(accommodation), (5, 40))
+
+        call_command('rebuild_vote_aggregates', stdout=StringIO())
+        self.assertEqual(self.aggregates(accommodation), (1, 8))
+        call_command('rebuild_vote_aggregates', '--check', stdout=StringIO())
+
+
+# 평점 분포 요약 테이블의 증분 갱신과 투표 통계 API를 확인하는 테스트
+class VoteSummaryTests(TestCase):
+
+    def setUp(self):
+        self.users = [User.objects.create(name=f'{i:02d}') for i in range(3)]
+        self.accommodations = [
+            Accommodation.objects.create(
+                name=f'숙소 {i}', location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+            for i in range(2)
+        ]
+
+    def summary_rows(self):
+        return set(VoteSummary.objects.filter(count__gt=0).values_list('scope', 'rating', 'count'))
+
+    def test_incremental_summary_matches_rebuild(self):
+        vote = Vote.objects.create(user=self.users[0], accommodation=self.accommodations[0], rating=8)
+        Vote.objects.create(user=self.users[0], accommodation=self.accommodations[1], rating=8)
+        Vote.objects.create(user=self.users[1], accommodation=self.accommodations[0], rating=3)
+        vote.rating = 5
+        vote.save()
+        # 사용자 삭제로 인한 연쇄 삭제
+        self.users[1].delete()
+
+        self.assertEqual(get_rating_histogram()[5], 1)
+        self.assertEqual(get_rating_histogram(self.accommodations[1].id)[8], 1)
+        self.assertEqual(get_voter_count(), 1)
+
+        incremental = self.summary_rows()
+        rebuild_vote_summary()
+        self.assertEqual(incremental, self.summary_rows())
+
+    def test_vote_stats_reads_summary_rows(self):
+        for user in self.users:
+            Vote.objects.create(user=user, accommodation=self.accommodations[0], rating=7)
+
+        # 테이블 버전 + 평점 분포 + 사용자 수 + 투표한 사용자 수
+        with self.assertNumQueries(4):
+            data = self.client.get(reverse('votes:vote-stats')).json()
+        self.assertEqual(data['total_votes'], 3)
+        self.assertEqual(data['average_rating'], 7.0)
+        self.assertEqual(data['rating_distribution']['7'], 3)
+        self.assertEqual(data['voted_users'], 3)
+
+        data = self.client.get(reverse('votes:vote-stats'), {'accommodation_id': self.accommodations[1].id}).json()
+        self.assertEqual(data['total_votes'], 0)
+
+    @override_settings(VOTE_SUMMARY_ENABLED=False)
+    def test_group_by_fallback(self):
+        Vote.objects.create(user=self.users[0], accommodation=self.accommodations[0], rating=9)
+        self.assertFalse(VoteSummary.objects.filter(count__gt=0).exists())
+        self.assertEqual(get_rating_histogram()[9], 1)
+        self.assertEqual(get_voter_count(), 1)
+
+
+# 일괄 투표 API를 확인하는 테스트
+class VoteBatchTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(name='민수')
+        self.accommodations = [
+            Accommodation.objects.create(
+                name=f'숙소 {i}', location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+            for i in range(12)
+        ]
+
+    def post(self, votes):
+        return self.client.post(
+            reverse('votes:vote-batch'), {'user_id': self.user.id, 'votes': votes}, content_type='application/json'
+        )
+
+    def test_batch_upserts_and_reports_each_item(self):
+        first = self.accommodations[0]
+        Vote.objects.create(user=self.user, accommodation=first, rating=3)
+        Vote.objects.create(user=self.user, accommodation=self.accommodations[1], rating=6)
+
+        response = self.post([
+            {'accommodation_id': first.id, 'rating': 9},
+            {'accommodation_id': self.accommodations[1].id, 'rating': 6},
+            {'accommodation_id': self.accommodations[2].id, 'rating': 7},
+            {'accommodation_id': 999999, 'rating': 7},
+            {'accommodation_id': self.accommodations[3].id, 'rating': 11},
+            {'accommodation_id': self.accommodations[2].id, 'rating': 1},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result['status'] for result in response.data['results']],
+            ['updated', 'unchanged', 'created', 'error', 'error', 'error'],
+        )
+        self.assertEqual(Vote.objects.get(user=self.user, accommodation=first).rating, 9)
+        self.assertEqual(Vote.objects.filter(user=self.user).count(), 3)
+
+        # 집계 컬럼과 평점 분포 요약도 함께 갱신
+        first.refresh_from_db()
+        self.assertEqual((first.vote_count, first.rating_sum), (1, 9))
+        self.assertEqual(get_rating_histogram()[9], 1)
+        self.assertEqual(get_rating_histogram()[3], 0)
+        self.assertEqual(get_voter_count(), 1)
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        votes = [{'accommodation_id': accommodation.id, 'rating': 8} for accommodation in self.accommodations]
+        # 테이블 버전/투표한 사용자 수 행이 처음 만들어지는 요청은 제외하고 비교
+        self.post(votes[:1])
+        with CaptureQueriesContext(connection) as small:
+            self.post(votes[1:3])
+        with CaptureQueriesContext(connection) as large:
+            response = self.post(votes[3:])
+        self.assertEqual(response.data['created'], 9)
+        self.assertEqual(len(small), len(large))
+
+        accommodation = Accommodation.objects.get(pk=self.accommodations[5].pk)
+        self.assertEqual((accommodation.vote_count, accommodation.rating_sum), (1, 8))
+
+    def test_unknown_user_is_rejected(self):
+        response = self.client.post(
+            reverse('votes:vote-batch'),
+            {'user_id': 999999, 'votes': [{'accommodation_id': self.accommodations[0].id, 'rating': 5}]},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.data)
+
+
+# 단일 투표 등록의 upsert 처리를 확인하는 테스트
+class VoteUpsertTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(name='민수')
+        self.accommodation = Accommodation.objects.create(
+            name='숙소', location='가평', price=100000, description='설명',
+            check_in=time(15), check_out=time(11),
+        )
+
+    def post(self, **data):
+        payload = {'user_id': self.user.id, 'accommodation_id': self.accommodation.id, 'rating': 7, **data}
+        return self.client.post(reverse('votes:vote-list-create'), payload, content_type='application/json')
+
+    def test_create_then_update_keeps_one_row(self):
+        response = self.post()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            response.data, {'user_id': self.user.id, 'accommodation_id': self.accommodation.id, 'rating': 7}
+        )
+
+        vote = Vote.objects.get()
+        self.post(rating=4)
+        updated = Vote.objects.get()
+        self.assertEqual((updated.pk, updated.rating, updated.created_at), (vote.pk, 4, vote.created_at))
+
+        self.accommodation.refresh_from_db()
+        self.assertEqual((self.accommodation.vote_count, self.accommodation.rating_sum), (1, 4))
+        self.assertEqual(get_rating_histogram()[4], 1)
+        self.assertEqual(get_rating_histogram()[7], 0)
+
+    def test_same_first_vote_racing_is_counted_once(self):
+        from . import upsert
+
+        # 다른 요청이 같은 첫 투표를 먼저 커밋하고, 이 요청은 잠금을 기다렸다가 이어서 실행되는 상황
+        real_lock = upsert.lock_user_votes
+        competing = []
+
+        def lock_after_competing_commit(user_id):
+            if not competing:
+                competing.append(None)
+                competing[0] = upsert.upsert_votes(user_id, {self.accommodation.id: 7})
+            real_lock(user_id)
+
+        with mock.patch.object(upsert, 'lock_user_votes', side_effect=lock_after_competing_commit):
+            statuses = upsert.upsert_votes(self.user.id, {self.accommodation.id: 7})
+
+        self.assertEqual(competing, [{self.accommodation.id: 'created'}])
+        self.assertEqual(statuses, {self.accommodation.id: 'unchanged'})
+        self.accommodation.refresh_from_db()
+        self.assertEqual((self.accommodation.vote_count, self.accommodation.rating_sum), (1, 7))
+        self.assertEqual(get_rating_histogram()[7], 1)
+        self.assertEqual(VoteEvent.objects.count(), 1)
+
+    def test_double_submit_with_new_idempotency_keys_counts_once(self):
+        for key in ('click-1', 'click-2'):
+            self.client.post(
+                reverse('votes:vote-list-create'),
+                {'user_id': self.user.id, 'accommodation_id': self.accommodation.id, 'rating': 7},
+                content_type='application/json', headers={'Idempotency-Key': key},
+            )
+        self.accommodation.refresh_from_db()
+        self.assertEqual((self.accommodation.vote_count, self.accommodation.rating_sum), (1, 7))
+        self.assertEqual(list(VoteEvent.objects.values_list('kind', flat=True)), [VoteEvent.CREATED])
+
+    def test_existence_checks_use_cached_ids(self):
+        self.post()
+        with CaptureQueriesContext(connection) as queries:
+            self.post(rating=9)
+        self.assertFalse(any('FROM "users"' in query['sql'] for query in queries))
+        self.assertFalse(any('FROM "accommodations"' in query['sql'] for query in queries))
+
+    def test_missing_references_keep_korean_messages(self):
+        response = self.post(user_id=999999, accommodation_id=999999)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['user_id'], ['존재하지 않는 사용자입니다.'])
+        self.assertEqual(response.data['accommodation_id'], ['존재하지 않는 숙소입니다.'])
+
+        # 캐시가 만들어진 뒤 생성된 사용자도 DB 확인으로 통과
+        self.post()
+        other = User.objects.create(name='지수')
+        self.assertEqual(self.post(user_id=other.id).status_code, 201)
+
+
+# 실시간 랭킹 스트림(SSE)을 확인하는 테스트
+@override_settings(LIVE_EVENTS_PUBLISH_BACKEND='sync')
+class VoteStreamTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(name='민수')
+        self.accommodations = [
+            Accommodation.objects.create(
+                name=f'숙소 {i}', location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+            for i in range(2)
+        ]
+
+    @staticmethod
+    def parse_event(chunk):
+        lines = dict(line.split(': ', 1) for line in chunk.decode().strip().splitlines() if ': ' in line)
+        return lines.get('event'), json.loads(lines['data']) if 'data' in lines else None
+
+    def test_wsgi_request_gets_snapshot_and_closes(self):
+        response = self.client.get(reverse('votes:vote-stream'))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        chunks = list(response.streaming_content)
+        self.assertEqual(len(chunks), 1)
+        event, data = self.parse_event(chunks[0])
+        self.assertEqual(event, 'snapshot')
+        self.assertEqual({row['id'] for row in data['results']}, {a.id for a in self.accommodations})
+
+    def test_post_is_not_allowed(self):
+        self.assertEqual(self.client.post(reverse('votes:vote-stream')).status_code, 405)
+
+    def test_vote_without_subscribers_skips_ranking_query(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Vote.objects.create(user=self.user, accommodation=self.accommodations[0], rating=9)
+        self.assertIsNone(cache.get(RANKING_SNAPSHOT_KEY))
+
+    def test_overlapping_publishes_never_store_an_older_ranking(self):
+        # 구독자가 있는 것처럼 (구독자가 없으면 계산 자체를 건너뜀)
+        patcher = mock.patch.object(type(get_broker()), 'subscriber_count', return_value=1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # 첫 계산 도중 다른 커밋의 발행이 들어오면 따로 계산하지 않고, 첫 계산이 끝난 뒤 한 번 더 계산
+        real_rows = live.get_ranking_rows
+        overlapping = []
+
+        def rows_with_overlapping_commit():
+            rows = real_rows()
+            if not overlapping:
+                Vote.objects.create(user=self.user, accommodation=self.accommodations[1], rating=10)
+                overlapping.append(live.publish_ranking_update())
+            return rows
+
+        Vote.objects.create(user=self.user, accommodation=self.accommodations[0], rating=2)
+        with mock.patch.object(live, 'get_ranking_rows', side_effect=rows_with_overlapping_commit) as rows:
+            live.publish_ranking_update()
+
+        self.assertEqual(overlapping, [None])
+        self.assertEqual(rows.call_count, 2)
+        self.assertEqual(cache.get(RANKING_SNAPSHOT_KEY), real_rows())
+        self.assertIsNone(cache.get(live.RANKING_LOCK_KEY))
+
+    @override_settings(LIVE_EVENTS_MAX_AGE=0.5)
+    async def test_committed_vote_is_pushed_as_delta(self):
+        response = await self.async_client.get(reverse('votes:vote-stream'))
+        stream = response.streaming_content
+        event, data = self.parse_event(await anext(stream))
+        self.assertEqual(event, 'snapshot')
+        self.assertEqual(get_broker().subscriber_count(), 1)
+
+        def vote():
+            with self.captureOnCommitCallbacks(execute=True):
+                Vote.objects.create(user=self.user, accommodation=self.accommodations[0], rating=9)
+
+        await sync_to_async(vote)()
+        event, data = self.parse_event(await anext(stream))
+        self.assertEqual(event, 'ranking')
+        changed = {row['id']: row for row in data['changed']}
+        self.assertEqual(changed[self.accommodations[0].id]['vote_count'], 1)
+        self.assertEqual(changed[self.accommodations[0].id]['rank'], 1)
+        self.assertEqual(data['removed'], [])
+
+        # 최대 유지 시간이 지나면 응답이 끝나고 구독도 해지
+        self.assertEqual([chunk async for chunk in stream], [])
+        self.assertEqual(get_broker().subscriber_count(), 0)
+
+
+# ASGI용 비동기 조회 View가 동기 View와 같은 응답을 주는지 확인하는 테스트
+class VoteAsyncViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = AsyncRequestFactory()
+        self.users = [User.objects.create(name=f'{i:02d}') for i in range(2)]
+        accommodations = [
+            Accommodation.objects.create(
+                name=f'숙소 {i}', location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+            for i in range(22)
+        ]
+        for i, accommodation in enumerate(accommodations):
+            Vote.objects.create(user=self.users[0], accommodation=accommodation, rating=i % 10 + 1)
+
+    async def assertSameResponse(self, view, path, **kwargs):
+        sync_response = await self.async_client.get(path)
+        async_response = await view(self.factory.get(path), **kwargs)
+        # 동기 View로 넘긴 DRF 응답은 서버(핸들러)가 렌더링하므로 직접 호출한 테스트에서 렌더링
+        if hasattr(async_response, 'render'):
+            async_response.render()
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(json.loads(async_response.content), json.loads(sync_response.content))
+
+    async def test_stats_and_user_votes_match_sync_views(self):
+        stats_url = reverse('votes:vote-stats')
+        await self.assertSameResponse(async_views.vote_stats, stats_url)
+        await self.assertSameResponse(async_views.vote_stats, f'{stats_url}?accommodation_id=x')
+
+        user_id = self.users[0].id
+        votes_url = reverse('users:user-votes', args=[user_id])
+        await self.assertSameResponse(async_views.user_votes, votes_url, user_id=user_id)
+        await self.assertSameResponse(async_views.user_votes, f'{votes_url}?page=2', user_id=user_id)
+        await self.assertSameResponse(async_views.user_votes, f'{votes_url}?include=users', user_id=user_id)
+
+
+# 투표 이벤트 기록과 과거 시점 랭킹을 확인하는 테스트
+class VoteEventTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.users = [User.objects.create(name=f'{i:02d}') for i in range(3)]
+        self.accommodations = [
+            Accommodation.objects.create(
+                name=f'숙소 {i}', location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+            for i in range(3)
+        ]
+
+    def vote(self, user, accommodation, rating):
+        return Vote.objects.update_or_create(user=user, accommodation=accommodation, defaults={'rating': rating})[0]
+
+    def history_ranking(self, **params):
+        return self.client.get(reverse('votes:vote-history-ranking'), params)
+
+    def test_create_update_delete_are_recorded(self):
+        self.vote(self.users[0], self.accommodations[0], 7)
+        self.vote(self.users[0], self.accommodations[0], 7)
+        self.vote(self.users[0], self.accommodations[0], 3).delete()
+
+        events = list(VoteEvent.objects.order_by('id').values_list('kind', 'old_rating', 'new_rating'))
+        self.assertEqual(events, [
+            (VoteEvent.CREATED, None, 7),
+            (VoteEvent.UPDATED, 7, 3),
+            (VoteEvent.DELETED, 3, None),
+        ])
+
+        response = self.client.get(reverse('votes:vote-events'), {'after': 0, 'limit': 2})
+        self.assertEqual([event['kind'] for event in response.data['results']], ['created', 'updated'])
+        self.assertTrue(response.data['has_more'])
+        response = self.client.get(reverse('votes:vote-events'), {'after': response.data['last_event_id']})
+        self.assertEqual([event['kind'] for event in response.data['results']], ['deleted'])
+        self.assertFalse(response.data['has_more'])
+
+    def test_latest_history_matches_current_ranking(self):
+        for i, user in enumerate(self.users):
+            for j, accommodation in enumerate(self.accommodations[:2]):
+                self.vote(user, accommodation, (i + j * 4) % 10 + 1)
+
+        for method in ('mean', 'bayesian', 'wilson'):
+            current = self.client.get(reverse('accommodations:accommodation-ranking'), {'method': method}).data
+            history = self.history_ranking(method=method).data
+            self.assertEqual(history['results'], current['results'])
+            self.assertEqual(history['prior'], current['prior'])
+            self.assertEqual(history['count'], current['count'])
+
+    def test_ranking_as_of_earlier_event(self):
+        self.vote(self.users[0], self.accommodations[0], 9)
+        first_event_id = VoteEvent.objects.get().id
+        self.vote(self.users[0], self.accommodations[0], 2)
+        self.vote(self.users[1], self.accommodations[1], 8)
+
+        response = self.history_ranking(event_id=first_event_id, method='mean')
+        self.assertEqual(response.data['event_id'], first_event_id)
+        top = response.data['results'][0]
+        self.assertEqual((top['id'], top['vote_count'], top['average_rating']), (self.accommodations[0].id, 1, 9.0))
+
+        # 시각으로 조회해도 같은 결과
+        at = VoteEvent.objects.get(id=first_event_id).created_at.isoformat()
+        self.assertEqual(self.history_ranking(at=at, method='mean').data['results'], response.data['results'])
+
+        self.assertEqual(self.history_ranking(at='어제').status_code, 400)
+        self.assertEqual(self.history_ranking(event_id=1, at=at).status_code, 400)
+
+    def test_snapshot_replay_matches_full_replay(self):
+        self.vote(self.users[0], self.accommodations[0], 5)
+        self.vote(self.users[1], self.accommodations[1], 6)
+        snapshot = take_vote_snapshot(VoteEvent.objects.order_by('-id').first().id)
+        self.vote(self.users[0], self.accommodations[0], 10)
+        Vote.objects.filter(user=self.users[1]).first().delete()
+        self.vote(self.users[2], self.accommodations[2], 4)
+
+        last_event_id = VoteEvent.objects.order_by('-id').first().id
+        with_snapshot = get_aggregates_as_of(last_event_id)
+        snapshot.delete()
+        self.assertFalse(VoteSnapshot.objects.exists())
+        self.assertEqual(with_snapshot, get_aggregates_as_of(last_event_id))
+        self.assertEqual(with_snapshot, {self.accommodations[0].id: [1, 10], self.accommodations[2].id: [1, 4]})
+
+    @override_settings(VOTE_SNAPSHOT_INTERVAL=2)
+    def test_snapshot_is_taken_every_interval(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.vote(self.users[0], self.accommodations[0], 5)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.vote(self.users[1], self.accommodations[0], 6)
+        self.assertTrue(callbacks)
+
+
+# 시간 구간별 투표 추이를 확인하는 테스트
+class VoteTrendTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.users = [User.objects.create(name=f'{i:02d}') for i in range(4)]
+        self.accommodations = [
+            Accommodation.objects.create(
+                name=f'숙소 {i}', location='가평', price=100000, description='설명',
+                check_in=time(15), check_out=time(11),
+            )
+            for i in range(2)
+        ]
+        # 3시간 전 구간에 2표, 2시간 전 구간에 1표, 현재 구간에 1표
+        current = truncate_to_bucket(timezone.now(), 'hour')
+        for user, accommodation, rating, hours_ago in (
+            (self.users[0], self.accommodations[0], 4, 3),
+            (self.users[1], self.accommodations[0], 8, 3),
+            (self.users[2], self.accommodations[1], 9, 2),
+            (self.users[3], self.accommodations[0], 3, 0),
+        ):
+            vote = Vote.objects.create(user=user, accommodation=accommodation, rating=rating)
+            moment = current - timedelta(hours=hours_ago) + timedelta(minutes=5)
+            Vote.objects.filter(pk=vote.pk).update(created_at=moment, updated_at=moment)
+
+    def trend(self, url=None, **params):
+        return self.client.get(url or reverse('votes:vote-trend'), {'buckets': 4, 'window': 2, **params})
+
+    def test_hourly_counts_and_rolling_average(self):
+        response = self.trend()
+        self.assertEqual(response.status_code, 200)
+        buckets = response.data['buckets']
+        self.assertEqual([bucket['vote_count'] for bucket in buckets], [2, 1, 0, 1])
+        self.assertEqual([bucket['average_rating'] for bucket in buckets], [6.0, 9.0, None, 3.0])
+        self.assertEqual([bucket['rolling_average'] for bucket in buckets], [6.0, 7.0, 9.0, 3.0])
+        self.assertEqual(response.data['total_votes'], 4)
+
+        url = reverse('accommodations:accommodation-trend', args=[self.accommodations[0].id])
+        buckets = self.trend(url).data['buckets']
+        self.assertEqual([bucket['vote_count'] for bucket in buckets], [2, 0, 0, 1])
+
+        daily = self.trend(interval='day', buckets=1, window=1).data['buckets']
+        self.assertEqual(len(daily), 1)
+
+    def test_closed_buckets_are_cached_until_old_vote_changes(self):
+        self.trend()
+
+        # 시그널 없이 바꾼 지난 구간은 캐시된 값이 그대로 사용되고 현재 구간만 다시 계산
+        Vote.objects.filter(user=self.users[2]).update(rating=1)
+        with CaptureQueriesContext(connection) as queries:
+            buckets = self.trend().data['buckets']
+        self.assertEqual(buckets[1]['average_rating'], 9.0)
+        self.assertEqual(len([query for query in queries if 'GROUP BY' in query['sql']]), 1)
+
+        # 지난 투표를 수정하면 커밋 후 캐시가 무효화됨
+        with self.captureOnCommitCallbacks(execute=True):
+            vote = Vote.objects.get(user=self.users[0])
+            vote.rating = 10
+            vote.save(update_fields=['rating'])
+        buckets = self.trend().data['buckets']
+        self.assertEqual(buckets[0]['average_rating'], 9.0)
+        self.assertEqual(buckets[1]['average_rating'], 1.0)
+
+    def test_invalid_params(self):
+        self.assertEqual(self.trend(interval='week').status_code, 400)
+        self.assertEqual(self.trend(buckets=0).status_code, 400)
+        self.assertEqual(self.trend(by='deleted').status_code, 400)
+        self.assertEqual(self.trend(buckets=1000, window=100).status_code, 400)
+        url = reverse('accommodations:accommodation-trend', args=[999999])
+        self.assertEqual(self.trend(url).status_code, 404)
+
+
+# 투표 CSV / NDJSON 내보내기를 확인하는 테스트
+class VoteExportTests(TestCase):
+
+    def setUp(self):
+        users = [User.objects.create(name=f'{i:02d}') for i in range(3)]
+        accommodation = Accommodation.objects.create(
+            name='숙소', location='가평', price=100000, description='설명',
+            check_in=time(15), check_out=time(11),
+        )
+        self.votes = [
+            Vote.objects.create(user=user, accommodation=accommodation, rating=i + 5)
+            for i, user in enumerate(users)
+        ]
+
+    def export(self, **params):
+        response = self.client.get(reverse('votes:vote-export'), params)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_csv_and_ndjson_stream_every_vote(self):
+        response, content = self.export()
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual([int(row['id']) for row in rows], [vote.id for vote in self.votes])
+        self.assertEqual([row['rating'] for row in rows], ['5', '6', '7'])
+
+        response, content = self.export(format='ndjson')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0]['user_id'], self.votes[0].user_id)
+        self.assertEqual(lines[0]['created_at'], timezone.localtime(self.votes[0].created_at).isoformat())
+
+        self.assertEqual(self.client.get(reverse('votes:vote-export'), {'format': 'xml'}).status_code, 400)
+
+    def test_export_command_writes_same_rows(self):
+        _, content = self.export(format='ndjson')
+        with tempfile.NamedTemporaryFile('r', suffix='.ndjson', encoding='utf-8') as output:
+            call_command('export_votes', format='ndjson', output=output.name, chunk_size=1, stdout=StringIO())
+            self.assertEqual(output.read(), content)
+
+        stdout = StringIO()
+        call_command('export_votes', stdout=stdout)
+        self.assertEqual(stdout.getvalue(), self.export()[1])
@@ -0,0 +1,158 @@
+# 시간 구간(시간별/일별) 투표 추이를 계산하고 지난 구간의 집계를 캐시하는 모듈
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from uuid import uuid4
+
+# Django 설정, 캐시, 데이터베이스, 시간 관련 기능을 가져옴
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+
+# 지원하는 구간 단위와 기본 구간 수, 이동 평균에 쓰는 기본 구간 수
+TREND_INTERVALS = {
+    'hour': {'buckets': 48, 'window': 24},
+    'day': {'buckets': 30, 'window': 7},
+}
+
+# 한 번에 조회할 수 있는 최대 구간 수 (이동 평균용 이전 구간 포함)
+MAX_TREND_BUCKETS = 1000
+
+# 구간을 나누는 기준 시각 (created: 처음 투표한 시각, updated: 마지막으로 투표를 바꾼 시각)
+TREND_FIELDS = {
+    'created': 'created_at',
+    'updated': 'updated_at',
+}
+
+# 끝난 지 이 시간이 지나지 않은 구간은 캐시하지 않음 (구간이 끝나기 직전에 시작된 트랜잭션이 늦게 커밋될 수 있음)
+TREND_CACHE_LAG = timedelta(minutes=1)
+
+# 지난 구간 캐시 전체를 무효화할 때 바꾸는 세대 값의 캐시 키
+TREND_GENERATION_KEY = 'vote_trend:generation'
+
+
+# 시각이 속한 구간의 시작 시각을 구하는 함수 (현재 시간대 기준)
+def truncate_to_bucket(moment, interval):
+    local = timezone.localtime(moment)
+    if interval == 'hour':
+        return local.replace(minute=0, second=0, microsecond=0)
+    return local.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+# 다음/이전 구간의 시작 시각을 구하는 함수 (steps: 이동할 구간 수, 음수면 이전 구간)
+def shift_bucket(start, interval, steps=1):
+    """
+    시간 단위는 UTC로 더해 일광 절약 시간 전환에도 정확히 1시간씩 이동
+    일 단위는 현지 날짜로 더한 뒤 그날 0시로 변환
+    """
+    if interval == 'hour':
+        moment = start.astimezone(dt_timezone.utc) + timedelta(hours=steps)
+        return timezone.localtime(moment)
+    day = start.date() + timedelta(days=steps)
+    return timezone.make_aware(datetime.combine(day, time()))
+
+
+# 지난 구간 캐시의 현재 세대 값을 반환하는 함수
+def get_trend_generation():
+    """
+    세대 값이 캐시에서 사라지면 새 값을 만들어 이전 구간 캐시를 모두 버림 (오래된 값을 다시 쓰지 않음)
+    """
+    generation = cache.get(TREND_GENERATION_KEY)
+    if generation is None:
+        cache.add(TREND_GENERATION_KEY, uuid4().hex, None)
+        generation = cache.get(TREND_GENERATION_KEY)
+    return generation
+
+
+# 지난 구간의 집계를 바꿀 수 있는 투표 변경이 있으면 캐시를 무효화하는 함수
+def invalidate_vote_trend(changes):
+    """
+    apply_vote_changes()에서 호출
+    새 투표는 현재 구간에만 들어가므로 무효화하지 않고,
+    수정/삭제는 지난 구간의 평점 합계나 투표 수를 바꾸므로 커밋 후 세대 값을 바꿈
+    (워커별 로컬 메모리 캐시라면 다른 워커에는 VOTE_TREND_CACHE_TIMEOUT 뒤에 반영)
+    """
+    if any(change.old_rating is not None for change in changes):
+        transaction.on_commit(lambda: cache.set(TREND_GENERATION_KEY, uuid4().hex, None))
+
+
+# 구간별 투표 수와 평점 합계를 GROUP BY 한 번으로 계산하는 함수
+def query_trend_buckets(field, interval, start, end, accommodation_id=None):
+    """
+    반환값: {구간 시작 시각: [투표 수, 평점 합계]} (투표가 있는 구간만)
+    (field, accommodation_id, rating) 복합 인덱스만 읽고 투표 행은 가져오지 않음
+    """
+    from .models import Vote
+
+    votes = Vote.objects.filter(**{f'{field}__gte': start, f'{field}__lt': end}).order_by()
+    if accommodation_id is not None:
+        votes = votes.filter(accommodation_id=accommodation_id)
+
+    rows = votes.annotate(bucket=Trunc(field, interval)).values('bucket').annotate(
+        count=Count('rating'), total=Sum('rating')
+    ).values_list('bucket', 'count', 'total')
+    return {bucket: [count, total] for bucket, count, total in rows}
+
+
+# 구간별 투표 수와 평균, 이동 평균을 계산하는 함수
+def get_vote_trend(interval='hour', buckets=None, window=None, by='created', accommodation_id=None):
+    """
+    현재 구간을 마지막으로 buckets개 구간의 추이를 계산
+    끝난 구간의 집계는 캐시에서 읽고, 캐시에 없는 구간과 현재 구간만 GROUP BY 한 번으로 계산
+    window: 이동 평균에 포함할 구간 수 (현재 구간 포함, 투표 수로 가중)
+    accommodation_id: None이면 전체 숙소
+    반환값: [{'start', 'vote_count', 'average_rating', 'rolling_vote_count', 'rolling_average'}, ...]
+            (투표가 없는 구간의 평균은 None)
+    """
+    buckets = buckets or TREND_INTERVALS[interval]['buckets']
+    window = window or TREND_INTERVALS[interval]['window']
+    field = TREND_FIELDS[by]
+
+    # 이동 평균을 위해 첫 구간 앞의 (window - 1)개 구간도 함께 계산
+    now = timezone.now()
+    current = truncate_to_bucket(now, interval)
+    first = shift_bucket(current, interval, -(buckets + window - 2))
+    starts = [shift_bucket(first, interval, step) for step in range(buckets + window - 1)]
+
+    # 캐시할 수 있는 구간: 끝난 지 TREND_CACHE_LAG 이상 지난 구간
+    generation = get_trend_generation()
+    scope = accommodation_id if accommodation_id is not None else 'all'
+    keys = {
+        start: f'vote_trend:{generation}:{by}:{interval}:{scope}:{start.isoformat()}'
+        for start in starts
+        if shift_bucket(start, interval) <= now - TREND_CACHE_LAG
+    }
+    cached = cache.get_many(keys.values())
+    aggregates = {start: cached[key] for start, key in keys.items() if key in cached}
+
+    # 캐시에 없는 구간과 아직 캐시할 수 없는 최근 구간을 계산
+    pending = [start for start in starts if start not in aggregates]
+    if pending:
+        rows = query_trend_buckets(
+            field, interval, pending[0], shift_bucket(current, interval), accommodation_id
+        )
+        computed = {start: rows.get(start, [0, 0]) for start in pending}
+        cache.set_many(
+            {keys[start]: value for start, value in computed.items() if start in keys},
+            settings.VOTE_TREND_CACHE_TIMEOUT,
+        )
+        aggregates.update(computed)
+
+    # 구간별 평균과 이동 평균 계산
+    trend = []
+    for index in range(window - 1, len(starts)):
+        start = starts[index]
+        vote_count, rating_sum = aggregates[start]
+        recent = [aggregates[starts[position]] for position in range(index - window + 1, index + 1)]
+        rolling_count = sum(count for count, _ in recent)
+        rolling_sum = sum(total for _, total in recent)
+        trend.append({
+            'start': start,
+            'vote_count': vote_count,
+            'average_rating': round(rating_sum / vote_count, 2) if vote_count else None,
+            'rolling_vote_count': rolling_count,
+            'rolling_average': round(rolling_sum / rolling_count, 2) if rolling_count else None,
+        })
+    return trend
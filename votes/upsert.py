@@ -0,0 +1,105 @@
+# 투표를 INSERT ... ON CONFLICT DO UPDATE 한 문장으로 저장하는 모듈
+from contextlib import contextmanager
+
+# Django의 데이터베이스 관련 기능을 가져옴
+from django.db import connection, transaction
+
+# 테이블 버전 함수를 가져옴
+from core.versions import bump_table_versions
+
+# 현재 앱의 모델과 집계 함수를 가져옴
+from .aggregates import VoteChange, apply_vote_changes
+from .models import Vote
+
+
+# 블록 안의 외래키 검사를 커밋 시점이 아닌 문장 실행 시점에 하도록 하는 컨텍스트 매니저
+@contextmanager
+def immediate_foreign_keys():
+    """
+    Django의 외래키는 DEFERRABLE INITIALLY DEFERRED로 만들어져 커밋할 때 검사됨
+    PostgreSQL에서는 INSERT 시점에 IntegrityError가 나도록 잠시 IMMEDIATE로 바꿨다가 되돌림
+    (SQLite는 지연된 외래키를 바꿀 수 없어 가장 바깥 트랜잭션 커밋 시점에 IntegrityError 발생)
+    """
+    if connection.vendor != 'postgresql':
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+    # 오류가 나면 트랜잭션이 롤백되므로 정상 종료일 때만 되돌림
+    yield
+    with connection.cursor() as cursor:
+        cursor.execute('SET CONSTRAINTS ALL DEFERRED')
+
+
+# 사용자별 투표 저장 잠금에 쓰는 PostgreSQL advisory lock 키의 상위 32비트 (다른 잠금과 겹치지 않도록)
+VOTE_USER_LOCK_NAMESPACE = 0x766F7465
+
+
+# 같은 사용자의 투표 저장을 차례로 처리하도록 잠그는 함수
+def lock_user_votes(user_id):
+    """
+    select_for_update()는 이미 있는 투표 행만 잠그므로, 같은 (사용자, 숙소)의 첫 투표가 동시에 들어오면
+    두 요청 모두 기존 평점을 읽지 못해 '생성'으로 집계됨 (ON CONFLICT가 두 번째 INSERT를 수정으로 바꿔도
+    투표 수/평점 합계/평점 분포/이벤트는 두 번 반영)
+    PostgreSQL: 트랜잭션 단위 advisory lock으로 뒤 요청이 앞 요청의 커밋까지 기다린 뒤 기존 평점을 읽음
+                (READ COMMITTED는 문장마다 새 스냅샷을 쓰므로 기다린 뒤의 조회에는 커밋된 투표가 보임,
+                 사용자 행을 잠그지 않아 사용자 조회/수정과는 서로 기다리지 않음)
+    SQLite: 데이터베이스 단위 쓰기 잠금 때문에 먼저 읽은 요청이 뒤늦게 쓰려 하면 'database is locked'로 실패
+            (두 번 집계되지 않으므로 따로 잠그지 않음)
+    """
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT pg_advisory_xact_lock(%s)',
+            [(VOTE_USER_LOCK_NAMESPACE << 32) | (user_id & 0xFFFFFFFF)],
+        )
+
+
+# 한 사용자의 숙소별 평점을 저장하는 함수
+def upsert_votes(user_id, ratings):
+    """
+    ratings: {숙소 ID: 평점}
+    반환값: {숙소 ID: 'created' | 'updated' | 'unchanged'}
+
+    1. 사용자별 잠금을 얻은 뒤 기존 평점을 한 번에 조회 (집계 변화량 계산용, 동시 생성/수정 방지)
+    2. 바뀐 투표만 (user, accommodation) 고유 키 기준 bulk upsert 한 문장으로 저장
+       (생성일은 유지하고 평점과 수정일만 갱신)
+    3. bulk_create는 시그널을 보내지 않으므로 집계 컬럼/평점 분포 요약과 테이블 버전을 직접 갱신
+
+    사용자/숙소 존재 여부는 호출하는 쪽에서 확인 (없는 ID는 외래키 제약 조건 오류(IntegrityError)로 실패)
+    """
+    statuses = {}
+
+    with transaction.atomic():
+        lock_user_votes(user_id)
+        previous = dict(
+            Vote.objects.select_for_update().filter(
+                user_id=user_id, accommodation_id__in=ratings
+            ).values_list('accommodation_id', 'rating')
+        )
+
+        changes = []
+        for accommodation_id, rating in ratings.items():
+            old_rating = previous.get(accommodation_id)
+            if old_rating == rating:
+                statuses[accommodation_id] = 'unchanged'
+                continue
+            statuses[accommodation_id] = 'created' if old_rating is None else 'updated'
+            changes.append(VoteChange(user_id, accommodation_id, old_rating, rating))
+
+        if changes:
+            with immediate_foreign_keys():
+                Vote.objects.bulk_create(
+                    [
+                        Vote(user_id=user_id, accommodation_id=change.accommodation_id, rating=change.new_rating)
+                        for change in changes
+                    ],
+                    update_conflicts=True,
+                    unique_fields=['user', 'accommodation'],
+                    update_fields=['rating', 'updated_at'],
+                )
+            apply_vote_changes(changes)
+            bump_table_versions('votes')
+
+    return statuses
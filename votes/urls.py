@@ -2,7 +2,8 @@
 from django.urls import path
 
 # 현재 앱의 뷰들을 가져옴
-from . import views
+from . import async_views, views
+from core.async_views import select_view
 
 # 앱 이름 설정 (URL 네임스페이스 구분용)
 app_name = 'votes'
@@ -18,9 +19,33 @@ urlpatterns = [
     # POST /api/votes/ - 새로운 투표 생성 (기존 투표 있으면 업데이트)
     path('votes/', views.VoteListCreateView.as_view(), name='vote-list-create'),
 
+    # 여러 투표 한 번에 등록
+    # POST /api/votes/batch/ - 한 사용자의 여러 숙소 투표를 한 번에 등록/수정
+    path('votes/batch/', views.vote_batch, name='vote-batch'),
+
+    # 실시간 랭킹 스트림
+    # GET /api/votes/stream/ - Server-Sent Events로 랭킹 스냅샷과 변화량 전송
+    path('votes/stream/', views.vote_stream, name='vote-stream'),
+
+    # 투표 이벤트 기록
+    # GET /api/votes/events/?after= - 이후에 생성/수정/삭제된 투표 이벤트를 ID 순으로 조회
+    path('votes/events/', views.vote_events, name='vote-events'),
+
+    # 과거 시점의 숙소 랭킹
+    # GET /api/votes/history/ranking/?event_id= 또는 ?at= - 그 시점까지의 투표로 계산한 랭킹
+    path('votes/history/ranking/', views.vote_history_ranking, name='vote-history-ranking'),
+
     # 투표 통계 정보
     # GET /api/votes/stats/ - 투표 통계 조회 (전체 투표 수, 평균 평점, 평점 분포 등)
-    path('votes/stats/', views.vote_stats, name='vote-stats'),
+    path('votes/stats/', select_view(async_views.vote_stats, views.vote_stats), name='vote-stats'),
+
+    # 투표 내보내기
+    # GET /api/votes/export/?format=csv|ndjson - 전체 투표를 스트리밍으로 내보내기
+    path('votes/export/', views.vote_export, name='vote-export'),
+
+    # 투표 추이
+    # GET /api/votes/trend/?interval=hour|day - 시간별/일별 투표 수와 평균 평점, 이동 평균
+    path('votes/trend/', views.vote_trend, name='vote-trend'),
 
     # 특정 투표 상세 정보
     # GET /api/votes/{id}/ - 특정 투표 정보 조회
@@ -5,18 +5,57 @@ from rest_framework.response import Response
 
 # Django의 단축 함수들을 가져옴
 from django.shortcuts import get_object_or_404
-from django.db.models import Avg, Count, Q
+from django.db.models import Avg, Count, Prefetch, Q
 
 # 현재 앱의 모델과 serializers를 가져옴
-from .models import Vote
+from .models import Vote, VoteEvent
+from .summary import get_rating_histogram, get_voter_count, summarize_histogram
 from .serializers import (
     VoteSerializer,
+    VoteCompactSerializer,
     VoteCreateSerializer,
+    VoteBatchSerializer,
 )
 
-# 다른 앱의 모델들을 가져옴
+# 커서/페이지 번호 겸용 페이지네이션과 ?fields= / ?expand= 지원 믹스인
+from core.mixins import RequestedFieldsMixin
+from core.pagination import CursorOrPageNumberPagination
+
+# 테이블 버전 기반 조건부 GET (ETag / Last-Modified, 304)
+from core.versions import conditional_on_tables
+
+# 테이블 버전 기반 응답 캐시
+from core.cache import cache_response_on_tables
+
+# Idempotency-Key 재시도 처리
+from core.idempotency import idempotent
+from django.utils.decorators import method_decorator
+
+# 실시간 랭킹 스트림 (Server-Sent Events)
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponseNotAllowed, StreamingHttpResponse
+from core.broker import get_broker
+from .live import RANKING_CHANNEL, format_snapshot_event, get_ranking_snapshot, ranking_event_stream
+
+# 투표 이벤트 기록과 과거 시점 랭킹 재계산
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from .history import get_event_id_at, get_ranking_as_of
+
+# CSV / NDJSON 스트리밍 내보내기
+from django.views.decorators.http import require_GET
+from core.export import export_response
+
+# 시간 구간별 투표 추이
+from .trend import MAX_TREND_BUCKETS, TREND_FIELDS, TREND_INTERVALS, get_vote_trend
+
+# 다른 앱의 모델들과 쿼리셋 함수를 가져옴
 from users.models import User
+from users.serializers import UserSerializer
 from accommodations.models import Accommodation
+from accommodations.serializers import AccommodationSerializer
+from accommodations.views import build_ranking_response, get_accommodation_queryset, parse_ranking_params
 # 기존 import 문들 아래에 추가
 from django.db import models  # models.Min, models.Max를 위해 필요
 
@@ -24,33 +63,142 @@ from django.db import models  # models.Min, models.Max를 위해 필요
 # 투표 관련 API Views
 # =============================================================================
 
-# 모든 투표 조회 및 새 투표 생성을 위한 API View
-class VoteListCreateView(generics.ListCreateAPIView):
+# 투표 조회 시 공통으로 사용하는 쿼리셋을 만드는 함수
+def get_vote_queryset(serializer=None):
     """
-    GET: 모든 투표 목록 조회
-    POST: 새로운 투표 생성 (기존 투표 있으면 업데이트)
-    URL: /api/votes/
+    사용자 정보는 조인으로, 숙소 정보는 평점 정보와 정렬된 이미지까지 미리 로드
+    (투표 수와 관계없이 쿼리 수가 고정됨)
+    serializer: ?fields= / ?expand= 로 필드가 선택된 VoteSerializer
+                (응답에 포함된 관계만 조인/미리 로드하고, 선택된 컬럼만 조회)
     """
+    if serializer is None:
+        return Vote.objects.select_related('user').prefetch_related(
+            Prefetch('accommodation', queryset=get_accommodation_queryset())
+        )
 
-    # 조회할 데이터 쿼리셋 지정 (관련 데이터 미리 로드)
-    queryset = Vote.objects.select_related(
-        'user',  # 투표한 사용자 정보
-        'accommodation'  # 투표 대상 숙소 정보
-    ).order_by('-created_at')  # 최신 순으로 정렬
+    queryset = Vote.objects.all()
+    field_names = serializer.get_model_field_names()
 
-    # GET 요청 시 사용할 serializer
-    serializer_class = VoteSerializer
+    # 사용자 정보가 응답에 포함될 때만 조인
+    user = serializer.get_nested_serializer('user')
+    if user is not None:
+        queryset = queryset.select_related('user')
+        field_names += [f'user__{name}' for name in user.get_model_field_names()]
+
+    # 숙소 정보가 응답에 포함될 때만 미리 로드
+    accommodation = serializer.get_nested_serializer('accommodation')
+    if accommodation is not None:
+        queryset = queryset.prefetch_related(
+            Prefetch('accommodation', queryset=get_accommodation_queryset(accommodation))
+        )
+
+    return queryset.only(*field_names)
+
+
+# 투표 목록 응답에 영향을 주는 테이블 (중첩/사이드로딩되는 사용자, 숙소 포함)
+VOTE_LIST_TABLES = ('votes', 'users', 'accommodations', 'accommodation_images')
+
+
+# 투표 목록 API에서 공통으로 사용하는 믹스인 (간단한 형식 + 사이드로딩)
+class VoteListMixin(RequestedFieldsMixin):
+    """
+    기본 응답: 사용자/숙소를 ID로만 표시하는 간단한 형식 (VoteCompactSerializer)
+    ?include=users,accommodations : 응답에 포함된 사용자/숙소를 ID별로 한 번씩만 'users', 'accommodations'에 추가
+    ?nested=true : 사용자/숙소 정보를 투표마다 중첩하는 기존 형식 (VoteSerializer)
+    """
+
+    # ?cursor= 요청 시 커서 페이지네이션, 그 외에는 페이지 번호 방식
+    pagination_class = CursorOrPageNumberPagination
+
+    # 사이드로딩할 수 있는 관계 목록
+    SIDELOAD_RELATIONS = ('users', 'accommodations')
+
+    # 기존 중첩 형식을 요청했는지 확인하는 메서드
+    def use_nested_format(self):
+        return self.request.query_params.get('nested', '').lower() in ('true', '1')
+
+    # 조회용 serializer를 반환하는 메서드 (오버라이드)
+    def get_serializer_class(self):
+        return VoteSerializer if self.use_nested_format() else VoteCompactSerializer
+
+    # 형식과 ?fields= 에 맞춰 투표 조회 쿼리셋을 만드는 메서드
+    def get_vote_list_queryset(self):
+        if self.use_nested_format():
+            return get_vote_queryset(self.get_field_serializer())
+        # 간단한 형식은 조인/미리 로드 없이 투표 컬럼만 조회
+        return get_vote_queryset(self.get_serializer_class()(context=self.get_serializer_context()))
+
+    # 요청한 사이드로딩 관계 목록을 반환하는 메서드
+    def get_sideload_relations(self):
+        if self.use_nested_format():
+            return []
+        include = self.request.query_params.get('include', '')
+        return [name for name in self.SIDELOAD_RELATIONS if name in include.split(',')]
+
+    # 투표 목록에 등장한 사용자/숙소를 ID별로 한 번씩 직렬화하는 메서드
+    def get_sideloaded_data(self, votes):
+        """
+        votes: 현재 페이지의 투표 목록
+        반환값: {'users': {ID: 사용자 정보}, 'accommodations': {ID: 숙소 정보}} (요청한 관계만)
+        관계마다 쿼리 수가 고정 (사용자 1번, 숙소 + 이미지 2번)
+        """
+        context = {'request': self.request}
+        data = {}
+        relations = self.get_sideload_relations()
+
+        if 'users' in relations:
+            users = User.objects.filter(id__in={vote.user_id for vote in votes})
+            data['users'] = {
+                user.id: UserSerializer(user, context=context).data for user in users
+            }
+
+        if 'accommodations' in relations:
+            accommodations = get_accommodation_queryset().filter(
+                id__in={vote.accommodation_id for vote in votes}
+            )
+            data['accommodations'] = {
+                accommodation.id: AccommodationSerializer(accommodation, context=context).data
+                for accommodation in accommodations
+            }
+
+        return data
+
+    # GET 요청 처리 (목록 + 사이드로딩 데이터)
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        page = self.paginate_queryset(queryset)
+        votes = page if page is not None else list(queryset)
+        serializer = self.get_serializer(votes, many=True)
+
+        if page is None:
+            return Response(serializer.data)
+
+        response = self.get_paginated_response(serializer.data)
+        response.data.update(self.get_sideloaded_data(votes))
+        return response
+
+
+# 모든 투표 조회 및 새 투표 생성을 위한 API View
+@method_decorator(conditional_on_tables(*VOTE_LIST_TABLES), name='get')
+@method_decorator(idempotent, name='post')
+class VoteListCreateView(VoteListMixin, generics.ListCreateAPIView):
+    """
+    GET: 모든 투표 목록 조회 (기본은 간단한 형식, ?include= / ?nested=true 지원)
+    POST: 새로운 투표 생성 (기존 투표 있으면 업데이트, Idempotency-Key 헤더 지원)
+    URL: /api/votes/
+    """
 
     # HTTP 메서드별로 다른 serializer 사용하도록 설정
     def get_serializer_class(self):
         """
         HTTP 메서드에 따라 적절한 serializer 반환
-        GET: 조회용 serializer (모든 정보 포함)
+        GET: 조회용 serializer (간단한 형식 또는 ?nested=true 시 모든 정보 포함)
         POST: 생성용 serializer (입력 필드만)
         """
         if self.request.method == 'POST':
             return VoteCreateSerializer  # 투표 생성 시
-        return VoteSerializer  # 투표 조회 시
+        return super().get_serializer_class()  # 투표 조회 시
 
     # GET 요청 처리 (투표 목록 조회)
     def get_queryset(self):
@@ -58,7 +206,8 @@ class VoteListCreateView(generics.ListCreateAPIView):
         쿼리 파라미터에 따라 필터링된 투표 목록 반환
         지원되는 필터: 사용자, 숙소, 평점 범위
         """
-        queryset = super().get_queryset()
+        # 형식/필드에 필요한 데이터만 조회, 최신 순으로 정렬
+        queryset = self.get_vote_list_queryset().order_by('-created_at', '-id')
 
         # 특정 사용자의 투표만 필터링
         user_id = self.request.query_params.get('user_id', None)
@@ -90,25 +239,247 @@ class VoteListCreateView(generics.ListCreateAPIView):
         # 투표 생성 또는 업데이트 (중복 투표 방지)
         vote = serializer.save()
 
-        # 로그에 투표 기록
-        print(f"투표 등록: {vote.user.name} -> {vote.accommodation.name} ({vote.rating}점)")
+        # 로그에 투표 기록 (사용자/숙소를 다시 조회하지 않도록 ID로 기록)
+        print(f"투표 등록: 사용자 {vote.user_id} -> 숙소 {vote.accommodation_id} ({vote.rating}점)")
+
+
+# 여러 투표를 한 번에 등록하기 위한 함수형 API View
+@api_view(['POST'])
+@idempotent
+def vote_batch(request):
+    """
+    한 사용자의 여러 숙소 투표를 한 번에 등록/수정 (Idempotency-Key 헤더 지원)
+    POST: 투표 목록을 하나의 트랜잭션에서 bulk upsert
+    URL: /api/votes/batch/
+
+    Request:
+    {
+        "user_id": 사용자ID,
+        "votes": [{"accommodation_id": 숙소ID, "rating": 평점}, ...]  (최대 100개)
+    }
+
+    Response:
+    {
+        "results": [{"accommodation_id": 숙소ID, "rating": 평점, "status": "created|updated|unchanged|error",
+                     "error": "오류 메시지(오류일 때만)"}, ...],
+        "created": 생성_수, "updated": 수정_수, "unchanged": 변경_없음_수, "errors": 오류_수
+    }
+    """
+
+    # 요청 형식과 사용자 확인
+    serializer = VoteBatchSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response({
+            'error': '일괄 투표 요청 형식이 올바르지 않습니다.',
+            'details': serializer.errors
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    # 항목별 검사 후 올바른 항목만 저장
+    results = serializer.save()
+
+    # 상태별 개수 계산
+    counts = {key: 0 for key in ('created', 'updated', 'unchanged', 'error')}
+    for result in results:
+        counts[result['status']] += 1
+
+    # 로그에 일괄 투표 기록
+    print(
+        f"일괄 투표: 사용자 {serializer.validated_data['user_id']} - "
+        f"생성 {counts['created']}, 수정 {counts['updated']}, 오류 {counts['error']}"
+    )
+
+    # 일괄 투표 결과 응답
+    return Response({
+        'results': results,
+        'created': counts['created'],
+        'updated': counts['updated'],
+        'unchanged': counts['unchanged'],
+        'errors': counts['error'],
+        'message': f"{counts['created'] + counts['updated']}개의 투표가 저장되었습니다."
+    }, status=status.HTTP_200_OK)
+
+
+# 실시간 랭킹 변화를 Server-Sent Events로 보내는 비동기 View
+async def vote_stream(request):
+    """
+    투표 결과 화면용 실시간 랭킹 스트림
+    GET: 연결 직후 전체 랭킹(snapshot), 이후 투표 생성/수정/삭제가 커밋될 때마다 바뀐 숙소만(ranking) 전송
+    URL: /api/votes/stream/
+
+    ASGI 서버(uvicorn 등)에서는 연결마다 스레드를 쓰지 않고 이벤트 루프에서 대기
+    WSGI 서버에서는 연결을 유지하면 워커 스레드를 계속 차지하므로 스냅샷만 보내고 종료
+    (브라우저 EventSource는 retry 시간 후 다시 연결하므로 주기적인 새로고침처럼 동작)
+
+    Response (text/event-stream):
+        event: snapshot
+        data: {"method": "bayesian", "results": [{"id", "rank", "score", "vote_count", "average_rating"}, ...]}
+
+        event: ranking
+        data: {"changed": [{"id", "rank", "score", "vote_count", "average_rating"}, ...], "removed": [숙소ID, ...]}
+    """
+    # DRF의 api_view는 비동기 View를 지원하지 않으므로 메서드를 직접 확인
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+
+    # WSGI 서버: 스냅샷만 보내고 종료
+    if not isinstance(request, ASGIRequest):
+        snapshot = await sync_to_async(get_ranking_snapshot)()
+        response = StreamingHttpResponse([format_snapshot_event(snapshot)], content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        return response
+
+    # 스냅샷 계산 중 커밋된 변경을 놓치지 않도록 먼저 구독
+    subscription = get_broker().subscribe(RANKING_CHANNEL)
+    try:
+        snapshot = await sync_to_async(get_ranking_snapshot)()
+    except Exception:
+        get_broker().unsubscribe(subscription)
+        raise
+
+    response = StreamingHttpResponse(
+        ranking_event_stream(snapshot, subscription),
+        content_type='text/event-stream',
+    )
+    # 프록시/브라우저가 스트림을 캐시하거나 모아서 보내지 않도록 설정
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+# 한 번에 조회할 수 있는 최대 투표 이벤트 수
+MAX_EVENT_PAGE_SIZE = 1000
+
+
+# 투표 이벤트 목록을 위한 함수형 API View
+@api_view(['GET'])
+def vote_events(request):
+    """
+    투표 생성/수정/삭제 이벤트를 ID 순으로 조회 (증분 처리용, 기록은 지워지거나 바뀌지 않음)
+    GET: after 이후의 이벤트를 limit개까지 반환
+    URL: /api/votes/events/
+
+    Query Parameters:
+        after: 이미 처리한 마지막 이벤트 ID (기본값 0)
+        limit: 최대 반환 개수 (기본값 100, 최대 1000)
+
+    Response:
+    {
+        "results": [{"id", "kind": "created|updated|deleted", "user_id", "accommodation_id",
+                     "old_rating", "new_rating", "created_at"}, ...],
+        "last_event_id": 다음_요청의_after로_쓸_ID,
+        "has_more": 이후_이벤트_여부
+    }
+    """
+
+    # 파라미터 확인
+    after = request.query_params.get('after') or '0'
+    limit = request.query_params.get('limit') or '100'
+    if not after.isdigit() or not limit.isdigit() or int(limit) < 1:
+        return Response({
+            'error': 'after는 0 이상, limit은 1 이상의 숫자여야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    after, limit = int(after), min(int(limit), MAX_EVENT_PAGE_SIZE)
+
+    # 다음 페이지가 있는지 알기 위해 하나 더 조회 (PK 범위 조회 한 번)
+    events = list(VoteEvent.objects.filter(id__gt=after).order_by('id').values(
+        'id', 'kind', 'user_id', 'accommodation_id', 'old_rating', 'new_rating', 'created_at'
+    )[:limit + 1])
+    has_more = len(events) > limit
+    events = events[:limit]
+
+    kind_names = {VoteEvent.CREATED: 'created', VoteEvent.UPDATED: 'updated', VoteEvent.DELETED: 'deleted'}
+    for event in events:
+        event['kind'] = kind_names[event['kind']]
+
+    return Response({
+        'results': events,
+        'last_event_id': events[-1]['id'] if events else after,
+        'has_more': has_more,
+        'message': f'{len(events)}개의 투표 이벤트입니다.'
+    }, status=status.HTTP_200_OK)
+
+
+# 과거 시점의 숙소 랭킹을 위한 함수형 API View
+@api_view(['GET'])
+def vote_history_ranking(request):
+    """
+    특정 이벤트 또는 시각 기준의 숙소 랭킹 조회
+    GET: 가장 가까운 이전 스냅샷에서 그 시점까지의 투표 이벤트를 다시 적용해 랭킹 계산
+    URL: /api/votes/history/ranking/
+
+    Query Parameters:
+        event_id: 이 이벤트까지 반영한 랭킹 (at과 함께 쓸 수 없음)
+        at: 이 시각(ISO 8601)까지 반영한 랭킹 (둘 다 없으면 현재)
+        method, prior_weight, limit, offset: /api/accommodations/ranking/과 같음
+
+    Response: /api/accommodations/ranking/ 응답 + {"event_id": 기준_이벤트_ID, "as_of": 기준_시각}
+    """
+
+    # 랭킹 파라미터 확인 (현재 랭킹 API와 같은 규칙)
+    method, limit, offset, prior_weight, error = parse_ranking_params(request.query_params)
+    if error:
+        return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+
+    event_id = request.query_params.get('event_id')
+    at = request.query_params.get('at')
+    if event_id and at:
+        return Response({
+            'error': 'event_id와 at은 함께 사용할 수 없습니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    # 기준 이벤트 결정
+    if event_id:
+        if not event_id.isdigit():
+            return Response({
+                'error': 'event_id는 숫자여야 합니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        event_id = int(event_id)
+    else:
+        moment = timezone.now()
+        if at:
+            try:
+                moment = parse_datetime(at)
+            except ValueError:
+                moment = None
+            if moment is None:
+                return Response({
+                    'error': 'at은 ISO 8601 형식의 시각이어야 합니다. (예: 2024-05-01T12:00:00+09:00)'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            if timezone.is_naive(moment):
+                moment = timezone.make_aware(moment)
+        event_id = get_event_id_at(moment)
+
+    as_of = VoteEvent.objects.filter(id=event_id).values_list('created_at', flat=True).first()
+
+    # 그 시점의 랭킹 계산 후 요청 범위만 응답
+    prior_mean, prior_weight, rows = get_ranking_as_of(event_id, method, prior_weight)
+    end = offset + limit if limit is not None else None
+
+    response = build_ranking_response(
+        method, prior_mean, prior_weight, len(rows), limit, offset, rows[offset:end]
+    )
+    response['event_id'] = event_id
+    response['as_of'] = as_of
+    response['message'] = f'이벤트 {event_id} 시점의 {method} 방식 숙소 랭킹입니다.'
+    return Response(response, status=status.HTTP_200_OK)
 
 
 # 특정 투표 조회, 수정, 삭제를 위한 API View
-class VoteDetailView(generics.RetrieveUpdateDestroyAPIView):
+class VoteDetailView(RequestedFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     """
-    GET: 특정 투표 상세 정보 조회
+    GET: 특정 투표 상세 정보 조회 (?fields= / ?expand= 지원)
     PUT/PATCH: 특정 투표 수정
     DELETE: 특정 투표 삭제
     URL: /api/votes/{id}/
     """
 
-    # 조회할 데이터 쿼리셋 지정
-    queryset = Vote.objects.select_related('user', 'accommodation')
-
     # 사용할 serializer 지정
     serializer_class = VoteSerializer
 
+    # 조회할 데이터 쿼리셋 생성 (관련 데이터 미리 로드, ?fields= 요청 시 필요한 것만)
+    def get_queryset(self):
+        return get_vote_queryset(self.get_field_serializer())
+
     # DELETE 요청 처리 (투표 삭제)
     def perform_destroy(self, instance):
         """
@@ -123,45 +494,54 @@ class VoteDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 
 # 특정 사용자의 투표 목록을 위한 API View
-class UserVoteListView(generics.ListAPIView):
+@method_decorator(conditional_on_tables(*VOTE_LIST_TABLES), name='get')
+class UserVoteListView(VoteListMixin, generics.ListAPIView):
     """
-    GET: 특정 사용자의 모든 투표 목록 조회
+    GET: 특정 사용자의 모든 투표 목록 조회 (기본은 간단한 형식, ?include= / ?nested=true 지원)
     URL: /api/users/{user_id}/votes/
     """
 
-    # 사용할 serializer 지정
-    serializer_class = VoteSerializer
-
     # 쿼리셋 동적 생성 (URL 파라미터 기반)
     def get_queryset(self):
         """
         URL 파라미터의 사용자 ID에 해당하는 투표들만 반환
         """
         user_id = self.kwargs.get('user_id')
-        return Vote.objects.filter(user_id=user_id).select_related(
-            'user', 'accommodation'
-        ).order_by('-created_at')
+        return self.get_vote_list_queryset().filter(user_id=user_id).order_by('-created_at', '-id')
 
 
 # 특정 숙소의 투표 목록을 위한 API View
-class AccommodationVoteListView(generics.ListAPIView):
+@method_decorator(conditional_on_tables(*VOTE_LIST_TABLES), name='get')
+class AccommodationVoteListView(VoteListMixin, generics.ListAPIView):
     """
-    GET: 특정 숙소의 모든 투표 목록 조회
+    GET: 특정 숙소의 모든 투표 목록 조회 (기본은 간단한 형식, ?include= / ?nested=true 지원)
     URL: /api/accommodations/{accommodation_id}/votes/
     """
 
-    # 사용할 serializer 지정
-    serializer_class = VoteSerializer
-
     # 쿼리셋 동적 생성 (URL 파라미터 기반)
     def get_queryset(self):
         """
         URL 파라미터의 숙소 ID에 해당하는 투표들만 반환
         """
         accommodation_id = self.kwargs.get('accommodation_id')
-        return Vote.objects.filter(accommodation_id=accommodation_id).select_related(
-            'user', 'accommodation'
-        ).order_by('-created_at')
+        return self.get_vote_list_queryset().filter(accommodation_id=accommodation_id).order_by('-created_at', '-id')
+
+
+# 투표 내보내기에 포함하는 컬럼
+VOTE_EXPORT_FIELDS = ('id', 'user_id', 'accommodation_id', 'rating', 'created_at', 'updated_at')
+
+
+# 전체 투표를 CSV / NDJSON으로 내보내는 View
+@require_GET
+def vote_export(request):
+    """
+    전체 투표를 ID 순으로 스트리밍 (dumpdata처럼 전체를 메모리에 올리지 않음)
+    GET: ?format=csv (기본값) 또는 ?format=ndjson
+    URL: /api/votes/export/
+
+    DRF의 ?format= 렌더러 선택과 겹치지 않도록 DRF를 거치지 않는 Django View로 작성
+    """
+    return export_response(request, Vote.objects.order_by('id'), VOTE_EXPORT_FIELDS, 'votes')
 
 
 # =============================================================================
@@ -170,10 +550,12 @@ class AccommodationVoteListView(generics.ListAPIView):
 
 # 투표 통계 정보를 위한 함수형 API View
 @api_view(['GET'])
+@conditional_on_tables('votes', 'users')
+@cache_response_on_tables('votes', 'users')
 def vote_stats(request):
     """
     투표 통계 정보 조회
-    GET: 전체 투표 수, 평균 평점, 평점 분포 등
+    GET: 전체 투표 수, 평균 평점, 평점 분포 등 (?accommodation_id= 로 특정 숙소의 분포 조회)
     URL: /api/votes/stats/
 
     Response:
@@ -185,23 +567,24 @@ def vote_stats(request):
     }
     """
 
-    # 전체 투표 수 계산
-    total_votes = Vote.objects.count()
+    # 특정 숙소의 통계만 조회 (?accommodation_id=)
+    accommodation_id = request.query_params.get('accommodation_id')
+    if accommodation_id is not None and not accommodation_id.isdigit():
+        return Response({
+            'error': 'accommodation_id는 숫자여야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
 
-    # 전체 평균 평점 계산
-    average_rating = Vote.objects.aggregate(
-        avg_rating=Avg('rating')
-    )['avg_rating'] or 0
+    # 평점 분포 계산 (요약 테이블의 평점 행 또는 GROUP BY rating 한 번)
+    histogram = get_rating_histogram(int(accommodation_id) if accommodation_id else None)
+    rating_distribution = {str(rating): count for rating, count in histogram.items()}
 
-    # 평점 분포 계산 (1~10점 각각의 투표 수)
-    rating_distribution = {}
-    for rating in range(1, 11):
-        count = Vote.objects.filter(rating=rating).count()
-        rating_distribution[str(rating)] = count
+    # 전체 투표 수와 평균 평점은 분포에서 계산
+    total_votes, average_rating = summarize_histogram(histogram)
 
     # 참여율 계산 (전체 사용자 수 대비 투표한 사용자 수)
+    # (숙소별 통계에서는 한 사용자가 숙소당 한 번만 투표하므로 투표 수 = 투표한 사용자 수)
     total_users = User.objects.count()
-    voted_users = Vote.objects.values('user').distinct().count()
+    voted_users = total_votes if accommodation_id else get_voter_count()
     participation_rate = (voted_users / total_users * 100) if total_users > 0 else 0
 
     # 통계 정보 응답
@@ -216,6 +599,91 @@ def vote_stats(request):
     }, status=status.HTTP_200_OK)
 
 
+# 투표 추이 조회 파라미터를 확인하는 함수
+def parse_trend_params(query_params):
+    """
+    반환값: (interval, buckets, window, by, 오류 메시지 또는 None)
+    """
+    interval = query_params.get('interval', 'hour')
+    by = query_params.get('by', 'created')
+    if interval not in TREND_INTERVALS:
+        return interval, None, None, by, f'지원되지 않는 구간 단위입니다. 허용 단위: {list(TREND_INTERVALS)}'
+    if by not in TREND_FIELDS:
+        return interval, None, None, by, f'지원되지 않는 기준 시각입니다. 허용 값: {list(TREND_FIELDS)}'
+
+    buckets = query_params.get('buckets') or str(TREND_INTERVALS[interval]['buckets'])
+    window = query_params.get('window') or str(TREND_INTERVALS[interval]['window'])
+    if not buckets.isdigit() or not window.isdigit() or int(buckets) < 1 or int(window) < 1:
+        return interval, None, None, by, 'buckets와 window는 1 이상의 숫자여야 합니다.'
+    buckets, window = int(buckets), int(window)
+
+    if buckets + window - 1 > MAX_TREND_BUCKETS:
+        return interval, buckets, window, by, f'buckets + window는 {MAX_TREND_BUCKETS + 1} 이하여야 합니다.'
+
+    return interval, buckets, window, by, None
+
+
+# 투표 추이 응답을 만드는 함수
+def build_trend_response(request, accommodation_id=None):
+    interval, buckets, window, by, error = parse_trend_params(request.query_params)
+    if error:
+        return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+
+    trend = get_vote_trend(interval, buckets, window, by, accommodation_id)
+    return Response({
+        'accommodation_id': accommodation_id,
+        'interval': interval,
+        'by': by,
+        'window': window,
+        'total_votes': sum(bucket['vote_count'] for bucket in trend),
+        'buckets': trend,
+        'message': f"{'숙소' if accommodation_id else '전체'} 투표 추이입니다."
+    }, status=status.HTTP_200_OK)
+
+
+# 전체 투표 추이를 위한 함수형 API View
+@api_view(['GET'])
+def vote_trend(request):
+    """
+    시간별/일별 투표 수와 평균 평점, 이동 평균 조회 (투표 기간 동안 평점 변화 확인용)
+    GET: 현재 구간을 마지막으로 buckets개 구간
+    URL: /api/votes/trend/
+
+    Query Parameters:
+        interval: 구간 단위 (hour, day / 기본값 hour)
+        buckets: 구간 수 (기본값 hour 48, day 30)
+        window: 이동 평균에 포함할 구간 수 (기본값 hour 24, day 7)
+        by: 구간을 나누는 기준 (created: 처음 투표한 시각, updated: 마지막으로 투표를 바꾼 시각 / 기본값 created)
+
+    투표는 제자리에서 수정되므로 평점은 각 투표의 현재 평점 기준 (그 시점의 평점은 /api/votes/history/ranking/)
+    끝난 구간은 캐시에서 읽고 현재 구간만 다시 계산
+
+    Response:
+    {
+        "interval": "hour", "by": "created", "window": 24, "total_votes": 구간_내_투표_수,
+        "buckets": [{"start": 구간_시작_시각, "vote_count": 투표_수, "average_rating": 평균_평점,
+                     "rolling_vote_count": 이동_구간_투표_수, "rolling_average": 이동_평균}, ...]
+    }
+    """
+    return build_trend_response(request)
+
+
+# 특정 숙소의 투표 추이를 위한 함수형 API View
+@api_view(['GET'])
+def accommodation_vote_trend(request, accommodation_id):
+    """
+    특정 숙소의 시간별/일별 투표 수와 평균 평점, 이동 평균 조회
+    GET: /api/votes/trend/와 같은 파라미터와 응답
+    URL: /api/accommodations/{accommodation_id}/trend/
+    """
+    if not Accommodation.objects.filter(id=accommodation_id).exists():
+        return Response({
+            'error': '존재하지 않는 숙소입니다.'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+    return build_trend_response(request, accommodation_id)
+
+
 # 특정 사용자의 투표 및 댓글 활동 요약을 위한 함수형 API View
 @api_view(['GET'])
 def user_activity_summary(request, user_id):